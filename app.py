@@ -8,8 +8,10 @@ from elastic_manager import ElasticManager
 import logging
 
 from models.insertPhonetic import PhoneticRequestInserter
+from models.phonetc_basics.phonetic_dict_validator import is_algorithm_available
 from routes.base import bases_road
 from routes.file_common import common_file
+from routes.jobs import jobs_road
 from routes.mapping.under_title import under_title
 from routes.upload import upload_road
 from routes.renderer import render_page
@@ -30,6 +32,12 @@ def create_app():
     app.register_blueprint(under_title)
     app.register_blueprint(upload_road)
     app.register_blueprint(common_file)
+    app.register_blueprint(jobs_road)
+
+    @app.context_processor
+    def phonetic_options():
+        """Options phonétiques proposées dans les pages : seulement celles dont la librairie est présente."""
+        return {"doublemetaphone_available": is_algorithm_available("doublemetaphone", config)}
 
     @app.route("/404")
     def not_found_page():
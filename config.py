@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import bcrypt
 from dotenv import load_dotenv
@@ -46,6 +46,11 @@ class Config:
         self._files_folder = self._ensure_folder(os.getenv("FILES_FOLDER", "files"))
         self._config_folder = self._ensure_folder(os.getenv("CONFIG_FOLDER", "config"), self._files_folder)
         self._temp_folder = self._ensure_folder(os.getenv("TEMP_FOLDER", "temp"), self._files_folder)
+        self._jobs_folder = self._ensure_folder(os.getenv("JOBS_FOLDER", "jobs"), self._files_folder)
+        self._import_state_folder = self._ensure_folder(os.getenv("IMPORT_STATE_FOLDER", "import_state"),
+                                                        self._files_folder)
+        self._overlay_folder = self._ensure_folder(os.getenv("OVERLAY_FOLDER", "overlays"), self._files_folder)
+        self._versions_folder = self._ensure_folder(os.getenv("VERSIONS_FOLDER", "versions"), self._files_folder)
         self._base_template_files_folder = manage_folder_name(
             os.getenv("BASE_TEMPLATE_FILES_FOLDER", "types_base_layout")
         )
@@ -76,6 +81,8 @@ class Config:
         self._filepath_metaphone = self._ext_lib_folder_path / os.getenv("FILE_METAPHONE", "libmetaphone.so")
         self._filepath_metaphone3 = self._ext_lib_folder_path / os.getenv("FILE_METAPHONE3",
                                                                           "libmetaphone3.so")
+        self._filepath_doublemetaphone = self._ext_lib_folder_path / os.getenv("FILE_DOUBLEMETAPHONE",
+                                                                               "libdoublemetaphone.so")
 
         self._chunksize = int(os.getenv("FILE_CHUNK_SIZE", "100000"))
         self._max_csv_file_size = int(os.getenv("MAX_CSV_FILE_SIZE", str(100 * 1024 * 1024)))
@@ -86,6 +93,21 @@ class Config:
         self._index_es_types_name = os.getenv("BASE_INDEX_ES_TYPES", "es_types")
         self._index_es_analysers_name = os.getenv("BASE_INDEX_ES_ANALYSERS", "es_analyser")
         self._buffer_phonex = int(os.getenv("BUFFER_PHONEX", 4096))
+        self._phonetic_cache_size = int(os.getenv("PHONETIC_CACHE_SIZE", "100000"))
+        self._phonetic_workers = int(os.getenv("PHONETIC_WORKERS", "1"))
+        self._phonetic_sub_batch_size = int(os.getenv("PHONETIC_SUB_BATCH_SIZE", "20000"))
+        # Normalisation désactivée par défaut : elle change les codes des données déjà encodées (fichiers de
+        # complétion, index) ; à activer (ex. "nfkd,accents,casefold,punctuation") en les régénérant
+        self._phonetic_normalization = tuple(
+            step.strip() for step in os.getenv("PHONETIC_NORMALIZATION", "").split(",") if step.strip()
+        )
+        self._phonetic_store_filepath = self._files_folder / os.getenv("PHONETIC_STORE_FILENAME",
+                                                                       "phonetic_codes.sqlite")
+        self._phonetic_store_max_entries = int(os.getenv("PHONETIC_STORE_MAX_ENTRIES", "2000000"))
+        self._job_workers = int(os.getenv("JOB_WORKERS", "2"))
+        self._import_transform_workers = int(os.getenv("IMPORT_TRANSFORM_WORKERS", "2"))
+        self._import_sender_threads = int(os.getenv("IMPORT_SENDER_THREADS", "2"))
+        self._import_queue_size = int(os.getenv("IMPORT_QUEUE_SIZE", "4"))
 
     def _ensure_folder(self, folder_name: str, parent_folder: Optional[Path] = None) -> Path:
         """Crée un dossier si nécessaire et retourne son chemin absolu."""
@@ -120,6 +142,8 @@ class Config:
             return self._filepath_metaphone
         elif lib_name == "metaphone3":
             return self._filepath_metaphone3
+        elif lib_name == "doublemetaphone":
+            return self._filepath_doublemetaphone
         else:
             return self._filepath_phonex
 
@@ -160,6 +184,22 @@ class Config:
     def temp_folder(self) -> Path:
         return self._temp_folder
 
+    @property
+    def jobs_folder(self) -> Path:
+        return self._jobs_folder
+
+    @property
+    def import_state_folder(self) -> Path:
+        return self._import_state_folder
+
+    @property
+    def overlay_folder(self) -> Path:
+        return self._overlay_folder
+
+    @property
+    def versions_folder(self) -> Path:
+        return self._versions_folder
+
     @property
     def base_template_files_folder(self) -> str:
         return self._base_template_files_folder
@@ -228,6 +268,30 @@ class Config:
     def buffer_phonex(self) -> int:
         return self._buffer_phonex
 
+    @property
+    def phonetic_cache_size(self) -> int:
+        return self._phonetic_cache_size
+
+    @property
+    def phonetic_workers(self) -> int:
+        return self._phonetic_workers
+
+    @property
+    def phonetic_sub_batch_size(self) -> int:
+        return self._phonetic_sub_batch_size
+
+    @property
+    def phonetic_normalization(self) -> Tuple[str, ...]:
+        return self._phonetic_normalization
+
+    @property
+    def phonetic_store_filepath(self) -> Path:
+        return self._phonetic_store_filepath
+
+    @property
+    def phonetic_store_max_entries(self) -> int:
+        return self._phonetic_store_max_entries
+
     @property
     def filepath_metaphone(self) -> Path:
         return self._filepath_metaphone
@@ -236,6 +300,26 @@ class Config:
     def filepath_metaphone3(self) -> Path:
         return self._filepath_metaphone3
 
+    @property
+    def filepath_doublemetaphone(self) -> Path:
+        return self._filepath_doublemetaphone
+
+    @property
+    def job_workers(self) -> int:
+        return self._job_workers
+
+    @property
+    def import_transform_workers(self) -> int:
+        return self._import_transform_workers
+
+    @property
+    def import_sender_threads(self) -> int:
+        return self._import_sender_threads
+
+    @property
+    def import_queue_size(self) -> int:
+        return self._import_queue_size
+
 
 if __name__ == "__main__":
     config = Config()
@@ -1,12 +1,13 @@
 """
 Description: Classe utilitaire pour se connecter à Elasticsearch.
 """
+import json
 import uuid
 
 from elasticsearch import Elasticsearch, helpers
 from elasticsearch.helpers import BulkIndexError
 from contextlib import contextmanager
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from models.date_formater import MultiDateFormater
 
@@ -222,34 +223,159 @@ class ElasticSearchTools:
             print(f"❌ Erreur lors de l'ajout du document {doc} dans l'index {index_name} : {e}")
             return False
 
-    def bulk_import(self, index_name: str, documents: List[Dict[str, Any]]) -> bool:
+    BULK_OP_TYPES = ("index", "create", "update")
+
+    def build_bulk_actions(self, index_name: str, documents: List[Dict[str, Any]],
+                           ids: Optional[Sequence[str]] = None,
+                           op_type: str = "index") -> Optional[List[Dict[str, Any]]]:
+        """
+        Construit les actions bulk d'une liste de documents (voir bulk_import).
+        :return: Liste d'actions au format helpers.bulk, ou None si les paramètres sont invalides.
+        """
+        if op_type not in self.BULK_OP_TYPES:
+            print(f"❌ bulk_import error: op_type '{op_type}' invalide")
+            return None
+        if ids is not None and len(ids) != len(documents):
+            print("❌ bulk_import error: le nombre d'ids ne correspond pas au nombre de documents")
+            return None
+        if op_type == "update" and ids is None:
+            print("❌ bulk_import error: op_type 'update' nécessite des ids")
+            return None
+
+        now = self._date_formater.to_es()
+        actions = []
+        for position, doc in enumerate(documents):
+            source = {
+                **{k: v for k, v in doc.items() if k not in ("id", "_id")},
+                "date_updated": now,
+            }
+            action = {"_index": index_name, "_op_type": op_type}
+            if ids is not None:
+                action["_id"] = ids[position]
+            if op_type == "update":
+                action["doc"] = source
+                action["doc_as_upsert"] = True
+            else:
+                action["_source"] = source
+            actions.append(action)
+        return actions
+
+    @staticmethod
+    def serialize_bulk_actions(actions: List[Dict[str, Any]]) -> bytes:
+        """
+        Sérialise des actions bulk au format NDJSON attendu par l'API _bulk.
+        :param actions: Actions construites par build_bulk_actions.
+        :return: Corps de requête encodé en UTF-8.
+        """
+        lines = []
+        for action in actions:
+            op_type = action["_op_type"]
+            meta = {"_index": action["_index"]}
+            if "_id" in action:
+                meta["_id"] = action["_id"]
+            lines.append(json.dumps({op_type: meta}, ensure_ascii=False))
+            if op_type == "update":
+                lines.append(json.dumps({"doc": action["doc"], "doc_as_upsert": action["doc_as_upsert"]},
+                                        ensure_ascii=False, default=str))
+            elif op_type != "delete":
+                lines.append(json.dumps(action["_source"], ensure_ascii=False, default=str))
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    def send_bulk_body(self, body: bytes, ignore_conflicts: bool = False) -> bool:
+        """
+        Envoie un corps NDJSON déjà sérialisé à l'API _bulk.
+        :param body: Corps produit par serialize_bulk_actions.
+        :param ignore_conflicts: Ignore les erreurs 409 (op_type 'create' sur un _id existant).
+        :return: True si succès, False sinon.
+        """
+        try:
+            with self.es_connection() as es:
+                response = es.bulk(operations=body)
+            if response.get("errors"):
+                errors = [item for item in response.get("items", [])
+                          for result in item.values()
+                          if result.get("error") and not (ignore_conflicts and result.get("status") == 409)]
+                if errors:
+                    print(f"❌ send_bulk_body error: {len(errors)} document(s) en erreur, ex: {errors[0]}")
+                    return False
+            return True
+        except Exception as e:
+            print(f"❌ send_bulk_body error: {e}")
+            return False
+
+    def bulk_import(self, index_name: str, documents: List[Dict[str, Any]],
+                    ids: Optional[Sequence[str]] = None, op_type: str = "index",
+                    refresh: bool = True) -> bool:
         """
         Importe une liste de documents dans un index Elasticsearch.
         Ajoute automatiquement 'date_updated' et 'sort_key' pour le tri.
         :param index_name: Nom de l'index.
         :param documents: Liste des documents à indexer.
+        :param ids: Identifiants (_id) des documents, dans le même ordre. Si absent, ES génère les _id.
+        :param op_type: 'index' (écrase), 'create' (ignore les _id déjà présents)
+                        ou 'update' (mise à jour partielle avec doc_as_upsert).
+        :param refresh: Rafraîchit l'index après l'import.
         :return: True si succès, False sinon.
         """
-        now = self._date_formater.to_es()
-        actions = [
-            {
-                "_index": index_name,
-                "_source": {
-                    **{k: v for k, v in doc.items() if k not in ("id", "_id")},
-                    "date_updated": now,
-                }
-            }
-            for doc in documents
-        ]
+        actions = self.build_bulk_actions(index_name, documents, ids, op_type)
+        if actions is None:
+            return False
+
         try:
             with self.es_connection() as es:
-                helpers.bulk(es, actions)
-                es.indices.refresh(index=index_name)
+                if op_type == "create":
+                    # Les documents déjà présents (409) sont volontairement ignorés
+                    _, errors = helpers.bulk(es, actions, raise_on_error=False)
+                    errors = [e for e in errors if e.get("create", {}).get("status") != 409]
+                    if errors:
+                        raise BulkIndexError(f"{len(errors)} document(s) en erreur", errors)
+                else:
+                    helpers.bulk(es, actions)
+                if refresh:
+                    es.indices.refresh(index=index_name)
             return True
         except (BulkIndexError, Exception) as e:
             print(f"❌ bulk_import error: {e}")
             return False
 
+    def bulk_delete(self, index_name: str, ids: Sequence[str], refresh: bool = True) -> bool:
+        """
+        Supprime une liste de documents par _id. Les documents déjà absents sont ignorés.
+        :param index_name: Nom de l'index.
+        :param ids: Identifiants des documents à supprimer.
+        :param refresh: Rafraîchit l'index après la suppression.
+        :return: True si succès, False sinon.
+        """
+        if not ids:
+            return True
+        actions = [{"_op_type": "delete", "_index": index_name, "_id": doc_id} for doc_id in ids]
+        try:
+            with self.es_connection() as es:
+                _, errors = helpers.bulk(es, actions, raise_on_error=False)
+                errors = [e for e in errors if e.get("delete", {}).get("status") != 404]
+                if errors:
+                    raise BulkIndexError(f"{len(errors)} document(s) en erreur", errors)
+                if refresh:
+                    es.indices.refresh(index=index_name)
+            return True
+        except (BulkIndexError, Exception) as e:
+            print(f"❌ bulk_delete error: {e}")
+            return False
+
+    def refresh(self, index_name: str) -> bool:
+        """
+        Rafraîchit un index pour rendre visibles les documents importés.
+        :param index_name: Nom de l'index.
+        :return: True si succès, False sinon.
+        """
+        try:
+            with self.es_connection() as es:
+                es.indices.refresh(index=index_name)
+            return True
+        except Exception as e:
+            print(f"❌ refresh error: {e}")
+            return False
+
     def update_doc(self, index_name: str, doc_id: str, body: Dict[str, Any]) -> bool:
         """
         Met à jour un document dans un index.
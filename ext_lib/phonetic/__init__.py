@@ -1 +1,2 @@
-from ext_lib.phonetic.wrappers import MetaphoneWrapper, Metaphone3Wrapper, PhonexWrapper, PhoneticWrapper
\ No newline at end of file
+from ext_lib.phonetic.wrappers import MetaphoneWrapper, Metaphone3Wrapper, DoubleMetaphoneWrapper, PhonexWrapper, \
+    PhoneticWrapper, PhoneticLibraryRegistry, get_library_registry
\ No newline at end of file
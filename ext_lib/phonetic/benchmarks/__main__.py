@@ -0,0 +1,4 @@
+from ext_lib.phonetic.benchmarks.suite import main
+
+if __name__ == "__main__":
+    main()
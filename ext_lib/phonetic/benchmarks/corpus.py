@@ -0,0 +1,68 @@
+from typing import List
+
+import numpy as np
+
+FR_NAMES = [
+    "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau",
+    "Simon", "Laurent", "Lefèvre", "Michel", "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier",
+    "Morel", "Girard", "André", "Lefebvre", "Mercier", "Dupont", "Lambert", "Bonnet", "François", "Martinez",
+    "Légaré", "Bézier", "Gaëlle", "Hélène", "Benoît", "Françoise", "Jérôme", "Noël", "Cécile", "Loïc",
+]
+EN_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis", "Wilson", "Anderson", "Taylor",
+    "Thomas", "Moore", "Jackson", "White", "Harris", "Thompson", "Clark", "Lewis", "Robinson", "Walker",
+    "Wright", "Scott", "Green", "Baker", "Adams", "Nelson", "Hill", "Campbell", "Mitchell", "Roberts",
+    "Knight", "Schmidt", "Phillips", "Evans", "Turner", "Parker", "Collins", "Edwards", "Stewart", "Morris",
+]
+FR_SYLLABLES = ["ber", "nard", "du", "pont", "mar", "tin", "le", "roux", "gar", "nier", "fa", "bre", "mo",
+                "reau", "lau", "rent", "gi", "rard", "bon", "net", "che", "val", "lier", "beau", "cha", "teau"]
+EN_SYLLABLES = ["smi", "th", "john", "son", "wil", "li", "ams", "brow", "jo", "nes", "mil", "ler", "da",
+                "vis", "tay", "lor", "har", "ris", "clark", "ton", "wood", "ford", "ing", "ham", "well", "by"]
+
+LANGUAGES = ("fr", "en", "mixed")
+
+
+def _vocabulary(language: str, size: int, rng: np.random.Generator) -> np.ndarray:
+    """Noms réels complétés de noms synthétiques formés de syllabes de la langue."""
+    names = {"fr": FR_NAMES, "en": EN_NAMES, "mixed": FR_NAMES + EN_NAMES}[language]
+    syllables = {"fr": FR_SYLLABLES, "en": EN_SYLLABLES, "mixed": FR_SYLLABLES + EN_SYLLABLES}[language]
+    vocabulary = list(dict.fromkeys(names))
+    seen = set(vocabulary)
+    while len(vocabulary) < size:
+        parts = rng.choice(syllables, size=rng.integers(2, 5))
+        name = "".join(parts).capitalize()
+        if name not in seen:
+            seen.add(name)
+            vocabulary.append(name)
+    return np.array(vocabulary[:size], dtype=object)
+
+
+def generate_names(count: int, language: str = "mixed", vocabulary_size: int = 50_000,
+                   zipf: float = 1.1, seed: int = 42) -> List[str]:
+    """
+    Génère un corpus synthétique de noms de famille FR/EN.
+    Les fréquences suivent une loi de Zipf, comme dans les colonnes de noms réelles
+    (quelques noms très fréquents et une longue traîne de noms rares).
+
+    :param count: Nombre de valeurs
+    :param language: 'fr', 'en' ou 'mixed'
+    :param vocabulary_size: Nombre de noms distincts possibles
+    :param zipf: Exposant de la loi de Zipf (0 : distribution uniforme)
+    :param seed: Graine du générateur (corpus reproductible)
+    """
+    if language not in LANGUAGES:
+        raise ValueError(f"Langue inconnue : {language}")
+    rng = np.random.default_rng(seed)
+    vocabulary = _vocabulary(language, vocabulary_size, rng)
+    weights = 1.0 / np.arange(1, len(vocabulary) + 1) ** zipf
+    indices = rng.choice(len(vocabulary), size=count, p=weights / weights.sum())
+    return vocabulary[indices].tolist()
+
+
+def parse_size(size: str) -> int:
+    """Convertit '10k', '1M', '10M' ou '2500' en nombre de valeurs."""
+    size = size.strip()
+    multipliers = {"k": 1_000, "K": 1_000, "m": 1_000_000, "M": 1_000_000}
+    if size and size[-1] in multipliers:
+        return int(float(size[:-1]) * multipliers[size[-1]])
+    return int(size)
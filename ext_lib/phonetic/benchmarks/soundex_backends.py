@@ -0,0 +1,55 @@
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Sequence
+
+from config import Config
+from ext_lib.phonetic import PhoneticWrapper
+from ext_lib.phonetic.benchmarks.corpus import generate_names, parse_size
+
+
+def compare(size: int, batch_sizes: Sequence[int], length: int = 8, repeat: int = 3,
+            language: str = "mixed") -> List[Dict[str, Any]]:
+    """
+    Compare le coût de 'soundex' (Phonex, librairie C) et de 'american_soundex' (NumPy) pour plusieurs tailles
+    de lot. Les codes des deux algorithmes diffèrent : seule la vitesse est comparée.
+    Meilleur temps sur 'repeat' essais.
+    """
+    wrapper = PhoneticWrapper(Config())
+    values = generate_names(size, language)
+    encoders = {"soundex": wrapper.soundex_encode_array, "american_soundex": wrapper.american_soundex_encode_array}
+    # Chargement des librairies hors mesure
+    for encode in encoders.values():
+        encode(values[:1], length)
+
+    results = []
+    for batch_size in batch_sizes:
+        batches = [values[start:start + batch_size] for start in range(0, size, batch_size)]
+        for algorithm, encode in encoders.items():
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for batch in batches:
+                    encode(batch, length)
+                best = min(best, time.perf_counter() - start)
+            results.append({
+                "algorithm": algorithm,
+                "size": size,
+                "batch_size": batch_size,
+                "length": length,
+                "seconds": round(best, 4),
+                "values_per_second": round(size / best) if best > 0 else None,
+            })
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soundex : Phonex (librairie C) contre Soundex américain (NumPy)")
+    parser.add_argument("--size", type=parse_size, default=parse_size("1M"))
+    parser.add_argument("--batch-sizes", default="100,1000,10000,100000")
+    parser.add_argument("--length", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    batch_sizes = [int(size) for size in args.batch_sizes.split(",")]
+    print(json.dumps(compare(args.size, batch_sizes, args.length, args.repeat), indent=2))
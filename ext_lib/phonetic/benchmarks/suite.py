@@ -0,0 +1,222 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import multiprocessing
+import pandas as pd
+import psutil
+
+from config import Config
+from ext_lib.phonetic.benchmarks.corpus import LANGUAGES, generate_names, parse_size
+from models.phonetc_basics.phonetic_dict_validator import is_algorithm_available
+
+TARGETS = ("wrapper", "encoder", "file")
+ALGORITHMS = ("soundex", "american_soundex", "metaphone", "metaphone3", "doublemetaphone")
+DEFAULT_SIZES = ("10k", "1M", "10M")
+# Longueur fixe utilisée par PhoneticChunkEncoder : seul le wrapper balaie la longueur
+ENCODER_LENGTH = 8
+
+
+def _rss_mb() -> float:
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Pic de mémoire résidente du processus depuis son démarrage."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Octets sous macOS, kilo-octets sous Linux
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        peak = getattr(psutil.Process().memory_info(), "peak_wset", None)
+        return peak / (1024 * 1024) if peak else None
+
+
+def _batches(values: List[str], batch_size: int) -> List[List[str]]:
+    return [values[start:start + batch_size] for start in range(0, len(values), batch_size)]
+
+
+def _run_wrapper(values: List[str], case: Dict[str, Any], config: Config) -> None:
+    from ext_lib.phonetic import PhoneticWrapper
+
+    wrapper = PhoneticWrapper(config)
+    encode: Callable[[List[str]], Any] = {
+        "soundex": lambda batch: wrapper.soundex_encode_array(batch, case["length"]),
+        "american_soundex": lambda batch: wrapper.american_soundex_encode_array(batch, case["length"]),
+        "metaphone": lambda batch: wrapper.metaphone_encode_array(batch, case["length"]),
+        "metaphone3": lambda batch: wrapper.metaphone3_encode_array(batch, case["length"]),
+        "doublemetaphone": lambda batch: wrapper.doublemetaphone_encode_array(batch, case["length"]),
+    }[case["algorithm"]]
+    batches = _batches(values, case["batch_size"])
+    if case["threads"] > 1:
+        with ThreadPoolExecutor(max_workers=case["threads"]) as pool:
+            list(pool.map(encode, batches))
+    else:
+        for batch in batches:
+            encode(batch)
+
+
+def _run_encoder(values: List[str], case: Dict[str, Any], config: Config) -> None:
+    from models.phonetc_basics.chunk_encoder import PhoneticChunkEncoder
+
+    encoder = PhoneticChunkEncoder({case["algorithm"]: True}, "nom", config)
+    for chunk in _batches(values, config.chunksize):
+        encoder.encode(chunk)
+
+
+def _run_file(values: List[str], case: Dict[str, Any], config: Config) -> None:
+    from models.file_management.file_modifier.phonex_injecter import PhonexCsvModifier
+
+    folder = Path(tempfile.mkdtemp(prefix="phonetic_bench_"))
+    try:
+        filepath = folder / "corpus.csv"
+        pd.DataFrame({"id": range(len(values)), "nom": values}).to_csv(filepath, index=False)
+        start = time.perf_counter()
+        if not PhonexCsvModifier(str(filepath), ",", "nom", {case["algorithm"]: True}, config,
+                                 same_file=False).process():
+            raise RuntimeError("Échec de PhonexCsvModifier")
+        case["_elapsed"] = time.perf_counter() - start
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+RUNNERS: Dict[str, Callable[[List[str], Dict[str, Any], Config], None]] = {
+    "wrapper": _run_wrapper,
+    "encoder": _run_encoder,
+    "file": _run_file,
+}
+
+
+def run_case(case: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Exécute un cas de benchmark. Appelée dans un processus neuf : le pic de RSS est celui du cas seul.
+    Le corpus est généré avant la mesure ; pour la cible 'file', l'écriture du CSV n'est pas chronométrée.
+    """
+    os.environ["PHONETIC_WORKERS"] = str(case["threads"])
+    os.environ["PHONETIC_SUB_BATCH_SIZE"] = str(case["batch_size"])
+    os.environ["PHONETIC_CACHE_SIZE"] = "100000" if case["cache"] else "0"
+    # Le dictionnaire persistant rendrait les mesures dépendantes des exécutions précédentes
+    os.environ["PHONETIC_STORE_MAX_ENTRIES"] = "0"
+    config = Config()
+    values = generate_names(case["size"], case["language"])
+    corpus_rss = _rss_mb()
+
+    from ext_lib.phonetic import get_library_registry
+
+    start = time.perf_counter()
+    RUNNERS[case["target"]](values, case, config)
+    elapsed = case.pop("_elapsed", time.perf_counter() - start)
+    peak = _peak_rss_mb()
+    return {
+        **case,
+        "seconds": round(elapsed, 4),
+        "values_per_second": round(case["size"] / elapsed) if elapsed > 0 else None,
+        "corpus_rss_mb": round(corpus_rss, 1),
+        "peak_rss_mb": round(peak, 1) if peak is not None else None,
+        "libraries": get_library_registry().stats(),
+    }
+
+
+def build_cases(targets: Sequence[str], sizes: Sequence[int], algorithms: Sequence[str], lengths: Sequence[int],
+                batch_sizes: Sequence[int], threads: Sequence[int], language: str = "mixed",
+                cache: bool = False) -> List[Dict[str, Any]]:
+    """
+    Produit cartésien des paramètres. La longueur ne s'applique qu'au wrapper
+    (l'encodeur et le modificateur de fichier utilisent une longueur fixe).
+    """
+    cases = []
+    for target, size, algorithm, batch_size, thread_count in itertools.product(
+            targets, sizes, algorithms, batch_sizes, threads):
+        for length in (lengths if target == "wrapper" else [ENCODER_LENGTH]):
+            cases.append({
+                "target": target,
+                "size": size,
+                "language": language,
+                "algorithm": algorithm,
+                "length": length,
+                "batch_size": batch_size,
+                "threads": thread_count,
+                "cache": cache,
+            })
+    return cases
+
+
+def run_suite(cases: List[Dict[str, Any]], progress: bool = True) -> Dict[str, Any]:
+    """Exécute chaque cas dans un processus dédié et retourne le rapport JSON."""
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for index, case in enumerate(cases, start=1):
+        if progress:
+            print(f"[{index}/{len(cases)}] {case}", file=sys.stderr)
+        try:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results.append(executor.submit(run_case, dict(case)).result())
+        except Exception as e:
+            results.append({**case, "error": str(e)})
+    return {"meta": _metadata(), "results": results}
+
+
+def _metadata() -> Dict[str, Any]:
+    """Contexte d'exécution, pour comparer les rapports d'une version à l'autre."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _csv_list(cast: Callable[[str], Any]) -> Callable[[str], List[Any]]:
+    return lambda value: [cast(item) for item in value.split(",") if item.strip()]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de l'encodage phonétique (rapport JSON)")
+    parser.add_argument("--targets", type=_csv_list(str), default=list(TARGETS))
+    parser.add_argument("--sizes", type=_csv_list(parse_size), default=[parse_size(s) for s in DEFAULT_SIZES])
+    parser.add_argument("--algorithms", type=_csv_list(str),
+                        default=[a for a in ALGORITHMS if is_algorithm_available(a)])
+    parser.add_argument("--lengths", type=_csv_list(int), default=[4, 8])
+    parser.add_argument("--batch-sizes", type=_csv_list(int), default=[1_000, 20_000])
+    parser.add_argument("--threads", type=_csv_list(int), default=sorted({1, os.cpu_count() or 1}))
+    parser.add_argument("--language", choices=LANGUAGES, default="mixed")
+    parser.add_argument("--cache", action="store_true", help="Active le cache des codes de l'encodeur")
+    parser.add_argument("--output", help="Fichier JSON de sortie (sortie standard par défaut)")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.targets) - set(TARGETS) | set(args.algorithms) - set(ALGORITHMS)
+    if unknown:
+        parser.error(f"Valeurs inconnues : {sorted(unknown)}")
+    missing = [algorithm for algorithm in args.algorithms if not is_algorithm_available(algorithm)]
+    if missing:
+        parser.error(f"Librairie absente pour : {missing}")
+
+    cases = build_cases(args.targets, args.sizes, args.algorithms, args.lengths, args.batch_sizes,
+                        args.threads, args.language, args.cache)
+    report = json.dumps(run_suite(cases), indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(report, encoding="utf-8")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import os
+import random
+import string
+import time
+from typing import Dict, List
+
+from config import Config
+from models.phonetc_basics.chunk_encoder import PhoneticChunkEncoder
+
+ALGORITHMS = {"soundex": True, "metaphone": True, "metaphone3": True}
+
+
+def random_names(count: int, seed: int = 42) -> List[str]:
+    """Noms aléatoires distincts (cache et dictionnaire persistant désactivés, seule compte la charge C)."""
+    rng = random.Random(seed)
+    return ["".join(rng.choices(string.ascii_letters, k=rng.randint(4, 12))) for _ in range(count)]
+
+
+def measure(values: List[str], workers: int, config: Config, repeat: int) -> float:
+    """Meilleur temps d'encodage d'un chunk sur 'repeat' essais."""
+    encoder = PhoneticChunkEncoder(ALGORITHMS, "nom", config, workers=workers, cache_size=0,
+                                   use_store=False)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encoder.encode(values)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(rows: int, max_workers: int, repeat: int) -> List[Dict[str, float]]:
+    config = Config()
+    values = random_names(rows)
+    results = []
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        elapsed = measure(values, workers, config, repeat)
+        baseline = baseline or elapsed
+        results.append({
+            "workers": workers,
+            "seconds": round(elapsed, 4),
+            "values_per_second": round(rows / elapsed),
+            "speedup": round(baseline / elapsed, 2),
+        })
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Passage à l'échelle de l'encodage phonétique multi-thread")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'secondes':>10} {'valeurs/s':>12} {'accélération':>13}")
+    for result in run(args.rows, args.max_workers, args.repeat):
+        print(f"{result['workers']:>8} {result['seconds']:>10} {result['values_per_second']:>12} "
+              f"{result['speedup']:>13}")
@@ -38,3 +38,6 @@ class CTypesLib(CLib):
 
     def run(self, *args: Any) -> Union[str, List[str]]:
         return self._strategy.process(*args)
+
+    def run_array(self, *args: Any) -> Any:
+        return self._strategy.process_array(*args)
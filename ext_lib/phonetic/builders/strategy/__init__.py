@@ -1,5 +1,8 @@
-from typing import Any, Union, List
-from ctypes import CDLL
+from typing import Any, Union, List, Sequence
+from ctypes import CDLL, c_char_p
+
+import numpy as np
+
 from ext_lib.phonetic.builders.strategy.abstract import AbstractPhoneticStrategy
 import logging
 
@@ -55,4 +58,41 @@ class PhoneticStrategy(AbstractPhoneticStrategy):
         :return: Chaîne transformée.
         :raises NotImplementedError: Si non implémentée.
         """
-        raise NotImplementedError("La méthode 'process' doit être implémentée par une sous-classe concrète.")
\ No newline at end of file
+        raise NotImplementedError("La méthode 'process' doit être implémentée par une sous-classe concrète.")
+
+    def process_array(self, *args: Any, **kwargs: Any) -> np.ndarray:
+        """
+        Applique une transformation phonétique à un lot de valeurs, sans concaténation par séparateur.
+
+        :param args: Arguments pour la fonction de transformation.
+        :return: Tableau NumPy des codes, aligné sur les valeurs d'entrée.
+        :raises NotImplementedError: Si non implémentée.
+        """
+        raise NotImplementedError("La méthode 'process_array' doit être implémentée par une sous-classe concrète.")
+
+    def _has_function(self, func_name: str) -> bool:
+        """Indique si la bibliothèque chargée exporte la fonction demandée."""
+        return hasattr(self._lib, func_name)
+
+    @staticmethod
+    def _encode_array_input(values: Sequence[str]) -> np.ndarray:
+        """
+        Encode les valeurs en UTF-8 en une seule opération vectorisée : une cellule par valeur,
+        le contenu des valeurs (séparateurs compris) n'a plus d'incidence sur l'alignement.
+        """
+        if not len(values):
+            return np.empty(0, dtype="S1")
+        return np.char.encode(np.asarray(values, dtype=str), "utf-8")
+
+    @staticmethod
+    def _char_pointer_array(inputs: np.ndarray):
+        """Construit le tableau char** attendu par les points d'entrée C par lot."""
+        return (c_char_p * len(inputs))(*inputs.tolist())
+
+    @staticmethod
+    def _decode_output(output: np.ndarray) -> np.ndarray:
+        """Convertit le buffer de sortie à largeur fixe (codes ASCII) en tableau de chaînes, sans boucle Python."""
+        try:
+            return output.astype(str)
+        except UnicodeDecodeError:
+            return np.char.decode(output, "utf-8", errors="replace")
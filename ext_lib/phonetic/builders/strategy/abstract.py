@@ -14,3 +14,13 @@ class AbstractPhoneticStrategy(ABC):
         :return: Chaîne transformée.
         """
         pass
+
+    @abstractmethod
+    def process_array(self, *args):
+        """
+        Applique une transformation phonétique à un lot de valeurs.
+
+        :param args:
+        :return: Tableau NumPy des codes, aligné sur les valeurs d'entrée.
+        """
+        pass
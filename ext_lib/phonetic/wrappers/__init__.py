@@ -1,38 +1,64 @@
-from typing import Union, List, Protocol
+from typing import Union, List, Protocol, Sequence, Tuple
+
+import numpy as np
 
 from config import Config
+from ext_lib.phonetic.wrappers.doublemetaphone import DoubleMetaphoneWrapper
 from ext_lib.phonetic.wrappers.metaphone import MetaphoneWrapper
 from ext_lib.phonetic.wrappers.metaphone3 import Metaphone3Wrapper
 from ext_lib.phonetic.wrappers.phonex import PhonexWrapper
+from ext_lib.phonetic.wrappers.registry import PhoneticLibraryRegistry, get_library_registry
+from ext_lib.phonetic.wrappers.soundex import NumpySoundexWrapper
 
 
 class PhoneticAlgorithm(Protocol):
     """
     Fournit une interface unifiée pour les algorithmes phonétiques :
-    Phonex, Metaphone et Metaphone3.
+    Phonex, Metaphone, Metaphone3 et Double Metaphone.
     """
 
     def run(self, *args) -> Union[str, List[str]]:
         raise NotImplementedError
 
+    def run_array(self, *args) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        raise NotImplementedError
+
 
 class PhoneticWrapper:
     """
     Fournit une interface unifiée pour les algorithmes phonétiques :
-    Phonex, Metaphone et Metaphone3.
+    Phonex, Metaphone, Metaphone3 et Double Metaphone.
     """
 
-    def __init__(self, config: Config = None) -> None:
+    def __init__(self, config: Config = None, registry: PhoneticLibraryRegistry = None) -> None:
         """
         Initialise les wrappers phonétiques avec la configuration donnée.
+        Les librairies sont obtenues auprès du registre du processus au premier usage de chaque algorithme :
+        elles ne sont chargées qu'une fois par processus, et seulement si elles servent.
 
         Args:
             config (Config, optional): Configuration de l'application.
+            registry (PhoneticLibraryRegistry, optional): Registre des librairies (celui du processus par défaut).
         """
-        config = config or Config()
-        self._phonex: PhoneticAlgorithm = PhonexWrapper(config=config)
-        self._metaphone: PhoneticAlgorithm = MetaphoneWrapper(config=config)
-        self._metaphone3: PhoneticAlgorithm = Metaphone3Wrapper(config=config)
+        self._config = config or Config()
+        self._registry = registry or get_library_registry()
+        self._numpy_soundex = NumpySoundexWrapper()
+
+    @property
+    def _phonex(self) -> PhoneticAlgorithm:
+        return self._registry.get("phonex", self._config)
+
+    @property
+    def _metaphone(self) -> PhoneticAlgorithm:
+        return self._registry.get("metaphone", self._config)
+
+    @property
+    def _metaphone3(self) -> PhoneticAlgorithm:
+        return self._registry.get("metaphone3", self._config)
+
+    @property
+    def _doublemetaphone(self) -> PhoneticAlgorithm:
+        return self._registry.get("doublemetaphone", self._config)
 
     def phonex_encode(self, input_str: str, separator: str = "|", length: int = 8) -> Union[str, List[str]]:
         """Encode une chaîne en utilisant Phonex."""
@@ -49,10 +75,47 @@ class PhoneticWrapper:
             length: int = 8,
             encode_vowels: bool = False,
             encode_exact: bool = True,
-    ) -> Union[str, List[str]]:
-        """Encode une chaîne en utilisant Metaphone3."""
+    ) -> List[Tuple[str, str]]:
+        """Encode une chaîne en utilisant Metaphone3 (tuples primary, secondary)."""
         return self._metaphone3.run(input_str, separator, length, encode_vowels, encode_exact)
 
+    def doublemetaphone_encode(self, input_str: str, separator: str = "|", length: int = 8) -> List[Tuple[str, str]]:
+        """Encode une chaîne en utilisant Double Metaphone (tuples primary, secondary)."""
+        return self._doublemetaphone.run(input_str, separator, length)
+
+    def phonex_encode_array(self, values: Sequence[str], length: int = 8) -> np.ndarray:
+        """Encode un lot de valeurs avec Phonex (tableau NumPy aligné sur les valeurs)."""
+        return self._phonex.run_array(values, length)
+
+    def soundex_encode_array(self, values: Sequence[str], length: int = 8) -> np.ndarray:
+        """Encode un lot de valeurs pour l'algorithme 'soundex' (codes Phonex de la librairie C)."""
+        return self.phonex_encode_array(values, length)
+
+    def american_soundex_encode_array(self, values: Sequence[str], length: int = 8) -> np.ndarray:
+        """
+        Encode un lot de valeurs avec le Soundex américain (NumPy, sans librairie C).
+        Ses codes diffèrent de ceux de l'algorithme 'soundex' (Phonex) : c'est un algorithme distinct.
+        """
+        return self._numpy_soundex.run_array(values, length)
+
+    def metaphone_encode_array(self, values: Sequence[str], length: int = 8) -> np.ndarray:
+        """Encode un lot de valeurs avec Metaphone (tableau NumPy aligné sur les valeurs)."""
+        return self._metaphone.run_array(values, length)
+
+    def metaphone3_encode_array(
+            self,
+            values: Sequence[str],
+            length: int = 8,
+            encode_vowels: bool = False,
+            encode_exact: bool = True,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Encode un lot de valeurs avec Metaphone3 (tableaux NumPy primary et secondary)."""
+        return self._metaphone3.run_array(values, length, encode_vowels, encode_exact)
+
+    def doublemetaphone_encode_array(self, values: Sequence[str], length: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """Encode un lot de valeurs avec Double Metaphone (tableaux NumPy primary et secondary)."""
+        return self._doublemetaphone.run_array(values, length)
+
 
 if __name__ == "__main__":
     wrapper = PhoneticWrapper(Config())
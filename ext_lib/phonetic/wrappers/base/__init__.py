@@ -9,3 +9,6 @@ class BaseWrapper(BaseWrapperAbstract):
 
     def run(self, *args):
         return self._lib.run(*args)
+
+    def run_array(self, *args):
+        return self._lib.run_array(*args)
@@ -0,0 +1,20 @@
+from typing import Optional
+
+from config import Config
+from ext_lib.phonetic.wrappers.base import BaseWrapper
+from ext_lib.phonetic.wrappers.doublemetaphone.lib import ClibDoubleMetaphone
+
+
+class DoubleMetaphoneWrapper(BaseWrapper):
+
+    def __init__(self, config: Optional[Config]):
+        config = config or Config()
+        super().__init__(lib=ClibDoubleMetaphone(config=config, _=8))
+
+
+if __name__ == "__main__":
+    config_test = Config()
+    dm_test = DoubleMetaphoneWrapper(config_test)
+    print(dm_test.run("Schmidt", "|", 6))
+    print(dm_test.run(["paris", "lyon", "marseille"], "|", 6))
+    print(dm_test.run_array(["paris", "lyon", "marseille"], 6))
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from config import Config
+from ext_lib.phonetic.builders import CTypesLib
+from ext_lib.phonetic.wrappers.doublemetaphone.signature import doublemetaphone_signature
+from ext_lib.phonetic.wrappers.doublemetaphone.strategy import DoubleMetaphoneStrategy
+
+
+class ClibDoubleMetaphone(CTypesLib):
+
+    def __init__(self, config: Optional[Config] = None, _=0):
+        super().__init__(lib_name="doublemetaphone",
+                         config=config,
+                         signature=doublemetaphone_signature,
+                         strategy=DoubleMetaphoneStrategy,
+                         _=_)
@@ -0,0 +1,20 @@
+from ctypes import c_char_p, c_char, c_int, c_void_p
+from _ctypes import POINTER
+
+doublemetaphone_signature = {
+    # Encodage d'une liste de valeurs séparées par un caractère, résultat alloué par la bibliothèque
+    "double_metaphone": {
+        "argtypes": [c_char_p, c_char, c_int],
+        "restype": c_void_p,
+    },
+    "double_metaphone_free": {
+        "argtypes": [c_void_p],
+        "restype": None,
+    },
+    # Point d'entrée par lot : (char** entrées, nombre, buffer primary, buffer secondary,
+    # largeur d'une cellule, longueur du code)
+    "double_metaphone_encode_array": {
+        "argtypes": [POINTER(c_char_p), c_int, c_void_p, c_void_p, c_int, c_int],
+        "restype": c_int,
+    }
+}
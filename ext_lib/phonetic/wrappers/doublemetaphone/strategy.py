@@ -0,0 +1,98 @@
+from ctypes import string_at
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ext_lib.phonetic.builders import PhoneticStrategy
+
+# Séparateur du lot envoyé à 'double_metaphone' : caractère de contrôle absent des noms
+_BATCH_SEPARATOR = b"\x1f"
+# Séparateur du code primaire et du code secondaire d'une valeur dans la réponse texte
+_CODES_SEPARATOR = ","
+
+
+class DoubleMetaphoneStrategy(PhoneticStrategy):
+    """
+    Stratégie phonétique utilisant l'algorithme Double Metaphone via une bibliothèque C.
+    Moins coûteux que Metaphone3 par valeur, il produit aussi un code primaire et un code secondaire.
+    La réponse texte de 'double_metaphone' contient, pour chaque valeur et dans l'ordre,
+    'primaire,secondaire' ; les valeurs sont séparées par le séparateur passé en entrée.
+    Ce format n'a pas pu être vérifié sur une compilation de libdoublemetaphone (non livrée) : l'option n'est
+    proposée que si la librairie est présente (cf. is_algorithm_available).
+    """
+
+    def process(
+            self,
+            input_value: Union[str, List[str]],
+            separator: Optional[str] = "|",
+            length: Optional[int] = 8,
+    ) -> List[Tuple[str, str]]:
+        """
+        Applique l'algorithme Double Metaphone sur la chaîne d'entrée.
+
+        :param input_value: Chaine d'entrée ou liste de chaines d'entrée.
+        :param separator: Séparateur des valeurs (caractère ASCII unique).
+        :param length: Longueur maximale des codes.
+        :return: Liste de tuples (primary, secondary), une entrée par valeur.
+        :raises MemoryError: Si la bibliothèque ne retourne aucun buffer.
+        """
+        input_str = self._define_input_str(input_value, separator)
+        sep_byte = separator.encode("utf-8")
+        if len(sep_byte) != 1:
+            raise ValueError("Le séparateur doit être un caractère ASCII unique.")
+        result = self._call(input_str.encode("utf-8"), sep_byte, length)
+        return [self._split_codes(item) for item in result.split(separator)]
+
+    def process_array(self, values: Sequence[str], length: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Applique Double Metaphone à un lot de valeurs.
+        Le point d'entrée par lot 'double_metaphone_encode_array' remplit deux buffers NumPy à largeur fixe
+        s'il est exporté ; sinon le lot est envoyé en un seul appel à 'double_metaphone', avec un séparateur
+        de contrôle retiré au préalable des valeurs (les valeurs vides ne sont pas envoyées).
+
+        :param values: Valeurs à encoder.
+        :param length: Longueur des codes.
+        :return: Tableaux NumPy (primary, secondary), alignés sur les valeurs.
+        """
+        inputs = self._encode_array_input(values)
+        width = length + 1
+        primaries = np.zeros(len(inputs), dtype=f"S{width}")
+        secondaries = np.zeros(len(inputs), dtype=f"S{width}")
+        if not len(inputs):
+            return self._decode_output(primaries), self._decode_output(secondaries)
+
+        if self._has_function("double_metaphone_encode_array"):
+            status = self._lib.double_metaphone_encode_array(self._char_pointer_array(inputs), len(inputs),
+                                                             primaries.ctypes.data, secondaries.ctypes.data,
+                                                             width, int(length))
+            if status != 0:
+                raise RuntimeError(f"Échec de l'encodage Double Metaphone par lot (code {status})")
+            return self._decode_output(primaries), self._decode_output(secondaries)
+
+        inputs = np.char.replace(inputs, _BATCH_SEPARATOR, b"")
+        non_empty = np.flatnonzero(np.char.str_len(inputs))
+        if len(non_empty):
+            result = self._call(_BATCH_SEPARATOR.join(inputs[non_empty].tolist()), _BATCH_SEPARATOR, length)
+            items = result.split(_BATCH_SEPARATOR.decode())
+            if len(items) != len(non_empty):
+                raise RuntimeError(f"Double Metaphone : {len(items)} résultats pour {len(non_empty)} valeurs")
+            codes = [self._split_codes(item) for item in items]
+            primaries[non_empty] = [primary.encode() for primary, _ in codes]
+            secondaries[non_empty] = [secondary.encode() for _, secondary in codes]
+        return self._decode_output(primaries), self._decode_output(secondaries)
+
+    def _call(self, input_bytes: bytes, sep_byte: bytes, length: int) -> str:
+        """Appelle 'double_metaphone' et libère le buffer retourné."""
+        result_ptr = self._lib.double_metaphone(input_bytes, sep_byte, int(length))
+        if not result_ptr:
+            raise MemoryError("Le pointeur C est NULL")
+        try:
+            return string_at(result_ptr).decode("utf-8")
+        finally:
+            self._lib.double_metaphone_free(result_ptr)
+
+    @staticmethod
+    def _split_codes(item: str) -> Tuple[str, str]:
+        """'primaire,secondaire' -> (primary, secondary) ; le secondaire manquant est vide."""
+        primary, _, secondary = item.strip().partition(_CODES_SEPARATOR)
+        return primary, secondary
@@ -16,6 +16,9 @@ class MetaphoneWrapper:
     def run(self, input_str: str, separator: str = "|", length: int = 8):
         return self._lib.run(input_str, separator, length)
 
+    def run_array(self, values, length: int = 8):
+        return self._lib.run_array(values, length)
+
 
 if __name__ == "__main__":
     config_test = Config()
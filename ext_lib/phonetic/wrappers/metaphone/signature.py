@@ -1,13 +1,25 @@
-from ctypes import c_char_p, c_int
+from ctypes import c_char_p, c_int, c_void_p
 from _ctypes import POINTER
 
 metaphone_signature = {
+    # Seuls points d'entrée de la bibliothèque livrée (libmetaphone.dll)
     "metaphone_api": {
         "argtypes": [c_char_p, POINTER(c_char_p), c_char_p, c_int],
         "restype": None
     },
     "free_output": {
-        "argtypes": [c_char_p],
+        "argtypes": [c_void_p],
         "restype": None
+    },
+    # Encodage d'un mot, résultat alloué par la bibliothèque (libéré par free_output) ;
+    # absent de libmetaphone.dll, exporté par certaines compilations locales
+    "metaphone": {
+        "argtypes": [c_char_p, c_int],
+        "restype": c_void_p
+    },
+    # Point d'entrée par lot : (char** entrées, nombre, buffer de sortie, largeur d'une cellule, longueur du code)
+    "metaphone_encode_array": {
+        "argtypes": [POINTER(c_char_p), c_int, c_void_p, c_int, c_int],
+        "restype": c_int
     }
-}
\ No newline at end of file
+}
@@ -1,8 +1,13 @@
 from ctypes import string_at, c_char_p, byref
-from typing import List, Union
+from typing import List, Sequence, Union
+
+import numpy as np
 
 from ext_lib.phonetic.builders import PhoneticStrategy
 
+# Séparateur passé à 'metaphone_api' pour une valeur seule (caractère de contrôle absent des données)
+_UNIT_SEPARATOR = b"\x1f"
+
 
 class MetaphoneStrategy(PhoneticStrategy):
     """
@@ -32,3 +37,54 @@ class MetaphoneStrategy(PhoneticStrategy):
             return result.split(separator) if separator in result else result
         finally:
             self._lib.free_output(output_ptr)
+
+    def process_array(self, values: Sequence[str], length: int = 8) -> np.ndarray:
+        """
+        Applique l'algorithme Metaphone à un lot de valeurs, sans concaténation par séparateur.
+        Le point d'entrée par lot 'metaphone_encode_array' remplit un buffer NumPy à largeur fixe
+        s'il est exporté ; sinon chaque valeur est encodée séparément par 'metaphone_api' (bibliothèque livrée)
+        ou, à défaut, par 'metaphone'.
+
+        :param values: Valeurs à encoder.
+        :param length: Longueur du code Metaphone.
+        :return: Tableau NumPy des codes, aligné sur les valeurs.
+        """
+        inputs = self._encode_array_input(values)
+        width = length + 1
+        output = np.zeros(len(inputs), dtype=f"S{width}")
+        if not len(inputs):
+            return self._decode_output(output)
+
+        if self._has_function("metaphone_encode_array"):
+            status = self._lib.metaphone_encode_array(self._char_pointer_array(inputs), len(inputs),
+                                                      output.ctypes.data, width, length)
+            if status != 0:
+                raise RuntimeError(f"Échec de l'encodage Metaphone par lot (code {status})")
+            return self._decode_output(output)
+
+        encode = self._encode_api if self._has_function("metaphone_api") else self._encode_single
+        for i, value in enumerate(inputs.tolist()):
+            if value:
+                output[i] = encode(value, length)
+        return self._decode_output(output)
+
+    def _encode_api(self, value: bytes, length: int) -> bytes:
+        """Encode une valeur par 'metaphone_api' (une valeur par appel : aucun découpage de la réponse)."""
+        output_ptr = c_char_p()
+        self._lib.metaphone_api(value, byref(output_ptr), _UNIT_SEPARATOR, length)
+        if not bool(output_ptr):
+            raise MemoryError("Aucun buffer retourné (null pointer).")
+        try:
+            return string_at(output_ptr)
+        finally:
+            self._lib.free_output(output_ptr)
+
+    def _encode_single(self, value: bytes, length: int) -> bytes:
+        """Encode une valeur par 'metaphone' (absent de la bibliothèque livrée, présent dans certaines compilations)."""
+        ptr = self._lib.metaphone(value, length)
+        if not ptr:
+            raise MemoryError("Aucun buffer retourné (null pointer).")
+        try:
+            return string_at(ptr)
+        finally:
+            self._lib.free_output(ptr)
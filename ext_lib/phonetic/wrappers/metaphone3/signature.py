@@ -1,12 +1,42 @@
-from ctypes import c_char_p, c_ubyte, c_int, c_void_p
+from ctypes import c_char_p, c_ubyte, c_int, c_void_p, c_bool
+from _ctypes import POINTER
 
 metaphone3_signature = {
+    # Point d'entrée texte (seul exporté par libmetaphone3.dll) : valeurs séparées par un octet,
+    # réponse d'une ligne "valeur,primary,secondary" par valeur non vide
     "metaphone3_encode_multi_str": {
         "argtypes": [c_char_p, c_ubyte, c_int, c_int, c_int],
-        "restype": c_void_p,  # On récupère un pointeur générique !
+        "restype": c_void_p,
     },
     "free_result_str": {
-        "argtypes": [c_void_p],  # On libère un pointeur générique !
+        "argtypes": [c_void_p],
         "restype": None,
+    },
+    # API objet : un encodeur par mot
+    "Metaphone3_new": {
+        "argtypes": [c_char_p, c_bool, c_bool, c_int],
+        "restype": c_void_p,
+    },
+    "Metaphone3_encode": {
+        "argtypes": [c_void_p],
+        "restype": None,
+    },
+    "Metaphone3_primary": {
+        "argtypes": [c_void_p],
+        "restype": c_char_p,
+    },
+    "Metaphone3_secondary": {
+        "argtypes": [c_void_p],
+        "restype": c_char_p,
+    },
+    "Metaphone3_free": {
+        "argtypes": [c_void_p],
+        "restype": None,
+    },
+    # Point d'entrée par lot : (char** entrées, nombre, buffer primary, buffer secondary,
+    # largeur d'une cellule, longueur du code, voyelles, exact)
+    "metaphone3_encode_array": {
+        "argtypes": [POINTER(c_char_p), c_int, c_void_p, c_void_p, c_int, c_int, c_int, c_int],
+        "restype": c_int,
     }
 }
@@ -1,8 +1,17 @@
+import re
 from ctypes import string_at
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from ext_lib.phonetic.builders import PhoneticStrategy
 
+# Séparateur des valeurs envoyées à 'metaphone3_encode_multi_str' (caractère de contrôle absent des données)
+_UNIT_SEPARATOR = 0x1f
+# Une ligne de la réponse texte : valeur, primary, secondary (séparés par ',' ou '|' selon la compilation) ;
+# les codes sont lus en fin de ligne, la valeur recopiée pouvant contenir ces caractères
+_TEXT_CODES = re.compile(rb"[,|]([^,|\n]*)[,|]([^,|\n]*)$")
+
 
 class Metaphone3Strategy(PhoneticStrategy):
 
@@ -11,59 +20,112 @@ class Metaphone3Strategy(PhoneticStrategy):
             input_value: Union[str, List[str]],
             separator: Optional[str] = "|",
             length: Optional[int] = 8,
-            encode_vowels: Optional[bool] = True,
-            encode_exact: Optional[bool] = False
-    ) -> List[tuple[str, str]]:
-        input_str = self._define_input_str(input_value, separator)
-        lib = self._lib
+            encode_vowels: Optional[bool] = False,
+            encode_exact: Optional[bool] = True
+    ) -> List[Tuple[str, str]]:
+        """
+        Applique Metaphone3 sur une chaîne (valeurs séparées par le séparateur) ou une liste de valeurs.
+        Les codes sont lus dans les tableaux primary/secondary de process_array : aucune réponse texte
+        à découper ni à normaliser.
 
-        sep_byte = separator.encode("utf-8")
-        if len(sep_byte) != 1:
-            raise ValueError("Le séparateur doit être un caractère ASCII unique.")
+        :return: Liste de tuples (primary, secondary), une entrée par valeur.
+        :raises ValueError: Si l'entrée est vide ou invalide.
+        """
+        if not self._valid_input_value(input_value):
+            raise ValueError("La valeur d'entrée n'est pas valide.")
+        values = input_value.split(separator) if isinstance(input_value, str) else input_value
+        primaries, secondaries = self.process_array(values, length, encode_vowels, encode_exact)
+        return list(zip(primaries.tolist(), secondaries.tolist()))
 
-        # Appel C, retour c_char_p donc string binaire à décoder
-        csv_result_ptr = lib.metaphone3_encode_multi_str(
-            input_str.encode("utf-8"),
-            sep_byte[0],
-            int(length),
-            int(encode_vowels),
-            int(encode_exact)
-        )
-        if not bool(csv_result_ptr):
-            raise MemoryError("Le pointeur C est NULL")
+    def process_array(
+            self,
+            values: Sequence[str],
+            length: int = 8,
+            encode_vowels: bool = False,
+            encode_exact: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Applique Metaphone3 à un lot de valeurs, sans concaténation ni réponse texte à analyser.
+        Le point d'entrée par lot 'metaphone3_encode_array' remplit deux buffers NumPy à largeur fixe
+        s'il est exporté ; sinon chaque valeur est encodée via l'API objet (Metaphone3_new / encode), ou à défaut
+        via le point d'entrée texte 'metaphone3_encode_multi_str', seul exporté par la bibliothèque livrée.
+
+        :param values: Valeurs à encoder.
+        :param length: Longueur du code Metaphone3.
+        :param encode_vowels: Encode les voyelles après la première lettre.
+        :param encode_exact: Encodage exact des consonnes.
+        :return: Tableaux NumPy (primary, secondary), alignés sur les valeurs.
+        """
+        inputs = self._encode_array_input(values)
+        if not len(inputs):
+            return np.empty(0, dtype=str), np.empty(0, dtype=str)
 
-        # Récupère le contenu du buffer C
-        csv_result_bytes = string_at(csv_result_ptr)
-        csv_result = csv_result_bytes.decode("utf-8")
+        lib = self._lib
+        if self._has_function("metaphone3_encode_array"):
+            # Metaphone3 peut dépasser la longueur demandée : la cellule est dimensionnée en conséquence
+            width = 2 * length + 1
+            primaries = np.zeros(len(inputs), dtype=f"S{width}")
+            secondaries = np.zeros(len(inputs), dtype=f"S{width}")
+            status = lib.metaphone3_encode_array(self._char_pointer_array(inputs), len(inputs),
+                                                 primaries.ctypes.data, secondaries.ctypes.data, width,
+                                                 int(length), int(encode_vowels), int(encode_exact))
+            if status != 0:
+                raise RuntimeError(f"Échec de l'encodage Metaphone3 par lot (code {status})")
+            return self._decode_output(primaries), self._decode_output(secondaries)
 
-        # Libère la mémoire côté C
-        lib.free_result_str(csv_result_ptr)
+        if not self._has_function("Metaphone3_new"):
+            primary_list, secondary_list = self._encode_text(inputs.tolist(), length, encode_vowels, encode_exact)
+            return (self._decode_output(np.array(primary_list, dtype=bytes)),
+                    self._decode_output(np.array(secondary_list, dtype=bytes)))
 
-        # Suite inchangée
-        lines = [line for line in csv_result.strip().split("\n") if line]
-        results = []
-        for line in lines:
-            cols = line.split("|")
-            while len(cols) < 3:
-                cols.append("")
-            results.append(cols[1:])
-        return self._normalize_result(results)
+        primary_list, secondary_list = [], []
+        for value in inputs.tolist():
+            encoder = lib.Metaphone3_new(value, bool(encode_vowels), bool(encode_exact), int(length))
+            if not encoder:
+                raise MemoryError("Le pointeur C est NULL")
+            try:
+                lib.Metaphone3_encode(encoder)
+                primary_list.append(lib.Metaphone3_primary(encoder) or b"")
+                secondary_list.append(lib.Metaphone3_secondary(encoder) or b"")
+            finally:
+                lib.Metaphone3_free(encoder)
+        return (self._decode_output(np.array(primary_list, dtype=bytes)),
+                self._decode_output(np.array(secondary_list, dtype=bytes)))
 
-    def _normalize_result(self, raw: List[str]) -> List[tuple[str, str]]:
+    def _encode_text(self, values: List[bytes], length: int, encode_vowels: bool,
+                     encode_exact: bool) -> Tuple[List[bytes], List[bytes]]:
         """
-        Normalise la sortie de Metaphone3.
-        :param raw: La sortie de Metaphone3.
-        :return: La sortie normalisée.
+        Encode un lot par 'metaphone3_encode_multi_str' : les valeurs non vides sont jointes en un seul appel et
+        la réponse compte une ligne par valeur. La bibliothèque ignorant les valeurs vides, celles-ci reçoivent
+        des codes vides sans appel ; si la réponse n'est pas alignée (valeur contenant le séparateur ou un saut
+        de ligne), les valeurs sont encodées une à une.
         """
-        # Normalisation : chaque item est un tuple (primary, secondary)
-        normalized = []
-        for item in raw:
-            # Cas normal
-            if isinstance(item, (list, tuple)) and len(item) >= 2:
-                normalized.append((item[0] or "", item[1] or ""))
-            # Cas partiel (rare)
-            elif isinstance(item, (list, tuple)) and len(item) == 1:
-                normalized.append((item[0] or "", ""))
-            else:
-                normalized.append(("", ""))
-        return normalized
+        primaries, secondaries = [b""] * len(values), [b""] * len(values)
+        positions = [i for i, value in enumerate(values) if value.strip()]
+        batch = [values[i] for i in positions]
+        codes: List[Optional[Tuple[bytes, bytes]]] = []
+        if batch and not any(b"\n" in value or bytes([_UNIT_SEPARATOR]) in value for value in batch):
+            lines = [line for line in self._call_text(b"\x1f".join(batch), length, encode_vowels,
+                                                      encode_exact).split(b"\n") if line]
+            codes = [self._parse_codes(line) for line in lines]
+        if len(codes) != len(batch) or None in codes:
+            codes = [self._parse_codes(self._call_text(value, length, encode_vowels, encode_exact).rstrip(b"\n"))
+                     for value in batch]
+        for i, code in zip(positions, codes):
+            primaries[i], secondaries[i] = code or (b"", b"")
+        return primaries, secondaries
+
+    def _call_text(self, value: bytes, length: int, encode_vowels: bool, encode_exact: bool) -> bytes:
+        result_ptr = self._lib.metaphone3_encode_multi_str(value, _UNIT_SEPARATOR, int(length), int(encode_vowels),
+                                                           int(encode_exact))
+        if not bool(result_ptr):
+            raise MemoryError("Le pointeur C est NULL")
+        try:
+            return string_at(result_ptr)
+        finally:
+            self._lib.free_result_str(result_ptr)
+
+    @staticmethod
+    def _parse_codes(line: bytes) -> Optional[Tuple[bytes, bytes]]:
+        match = _TEXT_CODES.search(line)
+        return (match.group(1), match.group(2)) if match else None
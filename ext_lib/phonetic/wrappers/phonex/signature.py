@@ -1,4 +1,4 @@
-from ctypes import c_char_p, c_int, c_char
+from ctypes import c_char_p, c_int, c_char, c_void_p
 from _ctypes import POINTER
 
 phonex_signature = {
@@ -9,5 +9,15 @@ phonex_signature = {
     "phonex_free": {
         "argtypes": [c_char_p],
         "restype": None
+    },
+    # Encodage d'un mot dans un buffer fourni (length caractères + NUL)
+    "phonex_single": {
+        "argtypes": [c_char_p, c_void_p, c_int],
+        "restype": None
+    },
+    # Point d'entrée par lot : (char** entrées, nombre, buffer de sortie, largeur d'une cellule, longueur du code)
+    "phonex_encode_array": {
+        "argtypes": [POINTER(c_char_p), c_int, c_void_p, c_int, c_int],
+        "restype": c_int
     }
 }
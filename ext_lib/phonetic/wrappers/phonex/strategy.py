@@ -1,5 +1,7 @@
 from ctypes import string_at
-from typing import List, Union
+from typing import List, Sequence, Union
+
+import numpy as np
 
 from ext_lib.phonetic.builders import PhoneticStrategy
 
@@ -32,3 +34,32 @@ class PhonexStrategy(PhoneticStrategy):
             return result
         finally:
             self._lib.phonex_free(ptr)
+
+    def process_array(self, values: Sequence[str], length: int = 8) -> np.ndarray:
+        """
+        Applique l'algorithme Phonex à un lot de valeurs.
+        Les codes sont écrits directement par la bibliothèque dans un buffer NumPy à largeur fixe
+        (length caractères + NUL par cellule) : ni concaténation, ni découpage par séparateur.
+        Le point d'entrée par lot 'phonex_encode_array' est utilisé s'il est exporté,
+        sinon chaque valeur est encodée par 'phonex_single' dans sa cellule du buffer.
+
+        :param values: Valeurs à encoder.
+        :param length: Longueur du code Phonex.
+        :return: Tableau NumPy des codes, aligné sur les valeurs.
+        """
+        inputs = self._encode_array_input(values)
+        width = length + 1
+        output = np.zeros(len(inputs), dtype=f"S{width}")
+        if not len(inputs):
+            return self._decode_output(output)
+
+        if self._has_function("phonex_encode_array"):
+            status = self._lib.phonex_encode_array(self._char_pointer_array(inputs), len(inputs),
+                                                   output.ctypes.data, width, length)
+            if status != 0:
+                raise RuntimeError(f"Échec de l'encodage Phonex par lot (code {status})")
+        else:
+            encode, base = self._lib.phonex_single, output.ctypes.data
+            for i, value in enumerate(inputs.tolist()):
+                encode(value, base + i * width, length)
+        return self._decode_output(output)
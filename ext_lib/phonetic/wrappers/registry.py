@@ -0,0 +1,115 @@
+import hashlib
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from config import Config
+from ext_lib.phonetic.wrappers.doublemetaphone import DoubleMetaphoneWrapper
+from ext_lib.phonetic.wrappers.metaphone import MetaphoneWrapper
+from ext_lib.phonetic.wrappers.metaphone3 import Metaphone3Wrapper
+from ext_lib.phonetic.wrappers.phonex import PhonexWrapper
+
+logger = logging.getLogger(__name__)
+
+# Nom de la librairie -> constructeur du wrapper (chargement de la librairie et application des signatures)
+LIBRARY_FACTORIES: Dict[str, Callable[[Config], Any]] = {
+    "phonex": lambda config: PhonexWrapper(config=config),
+    "metaphone": lambda config: MetaphoneWrapper(config=config),
+    "metaphone3": lambda config: Metaphone3Wrapper(config=config),
+    "doublemetaphone": lambda config: DoubleMetaphoneWrapper(config=config),
+}
+
+
+class PhoneticLibraryRegistry:
+    """
+    Registre des librairies phonétiques chargées par le processus.
+    Chaque librairie est chargée et configurée une seule fois, à la première demande
+    (seuls les algorithmes réellement utilisés sont chargés). Le coût de chargement est mesuré.
+    """
+
+    def __init__(self):
+        self._wrappers: Dict[Tuple[str, Path], Any] = {}
+        self._load_times: Dict[Tuple[str, Path], float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, lib_name: str, config: Optional[Config] = None) -> Any:
+        """
+        Retourne le wrapper de la librairie, en la chargeant au premier appel.
+
+        :param lib_name: 'phonex', 'metaphone', 'metaphone3' ou 'doublemetaphone'
+        :param config: Configuration (chemin de la librairie)
+        :raises ValueError: Si la librairie est inconnue.
+        """
+        if lib_name not in LIBRARY_FACTORIES:
+            raise ValueError(f"Librairie phonétique inconnue : {lib_name}")
+        config = config or Config()
+        key = (lib_name, Path(config.get_lib_path(lib_name)))
+        wrapper = self._wrappers.get(key)
+        if wrapper is not None:
+            return wrapper
+        with self._lock:
+            wrapper = self._wrappers.get(key)
+            if wrapper is None:
+                start = time.perf_counter()
+                wrapper = LIBRARY_FACTORIES[lib_name](config)
+                elapsed = time.perf_counter() - start
+                self._load_times[key] = elapsed
+                self._wrappers[key] = wrapper
+                logger.info(f"PhoneticLibraryRegistry - '{lib_name}' chargée en {elapsed * 1000:.2f} ms ({key[1]})")
+        return wrapper
+
+    def is_loaded(self, lib_name: str) -> bool:
+        return any(name == lib_name for name, _ in self._wrappers)
+
+    def is_available(self, lib_name: str, config: Optional[Config] = None) -> bool:
+        """
+        Indique si la librairie peut être chargée : connue du registre et présente dans ext_lib
+        (toutes les librairies ne sont pas livrées, cf. libdoublemetaphone).
+        """
+        if lib_name not in LIBRARY_FACTORIES:
+            return False
+        config = config or Config()
+        path = Path(config.get_lib_path(lib_name))
+        return (lib_name, path) in self._wrappers or path.is_file()
+
+    def fingerprint(self, lib_name: str, config: Optional[Config] = None) -> str:
+        """
+        Empreinte courte du fichier de la librairie (chemin, taille, date de modification) : elle change dès que
+        FILE_* désigne une autre compilation. Chaîne vide si le fichier est absent.
+        """
+        config = config or Config()
+        path = Path(config.get_lib_path(lib_name)).resolve()
+        try:
+            stat = path.stat()
+        except OSError:
+            return ""
+        identity = f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+        return hashlib.blake2b(identity.encode("utf-8"), digest_size=6).hexdigest()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Coût de chargement (ms) et chemin de chaque librairie chargée."""
+        with self._lock:
+            return {
+                name: {"path": str(path), "load_ms": round(self._load_times[(name, path)] * 1000, 3)}
+                for name, path in self._wrappers
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._wrappers.clear()
+            self._load_times.clear()
+
+
+_registry: Optional[PhoneticLibraryRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_library_registry() -> PhoneticLibraryRegistry:
+    """Registre partagé par le processus, créé au premier appel."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = PhoneticLibraryRegistry()
+        return _registry
@@ -0,0 +1,108 @@
+import unicodedata
+from typing import List, Sequence, Union
+
+import numpy as np
+
+# Codes Soundex américain : 1-6 pour les consonnes, 0 pour les voyelles (séparateurs),
+# 7 pour H et W (transparents), 255 pour tout caractère qui n'est pas une lettre
+_VOWEL, _TRANSPARENT, _IGNORED = 0, 7, 255
+_CODES = {
+    "AEIOUY": _VOWEL,
+    "BFPV": 1,
+    "CGJKQSXZ": 2,
+    "DT": 3,
+    "L": 4,
+    "MN": 5,
+    "R": 6,
+    "HW": _TRANSPARENT,
+}
+SOUNDEX_TABLE = np.full(256, _IGNORED, dtype=np.uint8)
+for _letters, _code in _CODES.items():
+    for _letter in _letters:
+        SOUNDEX_TABLE[ord(_letter)] = _code
+
+# Point de code Unicode (Latin-1 et Latin étendu) -> lettre ASCII majuscule de base, 0 sinon (É -> E, ç -> C...)
+_MAX_CODE_POINT = 0x250
+LETTER_TABLE = np.zeros(_MAX_CODE_POINT + 1, dtype=np.uint8)
+for _code_point in range(_MAX_CODE_POINT):
+    _base = unicodedata.normalize("NFKD", chr(_code_point)).encode("ascii", "ignore").upper()[:1]
+    if _base.isalpha():
+        LETTER_TABLE[_code_point] = _base[0]
+for _char, _base in {"Œ": "O", "œ": "O", "Æ": "A", "æ": "A", "ß": "S", "Ø": "O", "ø": "O", "Đ": "D", "đ": "D",
+                     "Ł": "L", "ł": "L"}.items():
+    LETTER_TABLE[ord(_char)] = ord(_base)
+
+
+def normalize_names(values: Sequence[str]) -> np.ndarray:
+    """
+    Normalise les valeurs en tableau uint8 à largeur fixe (une ligne par valeur) à partir des points de code
+    UTF-32 : lettres ASCII majuscules, accents retirés, tout autre caractère remplacé par 0.
+    """
+    if not len(values):
+        return np.zeros((0, 1), dtype=np.uint8)
+    array = np.asarray(values, dtype=str)
+    width = max(array.dtype.itemsize // 4, 1)
+    code_points = array.astype(f"U{width}").view(np.uint32).reshape(len(array), width)
+    return LETTER_TABLE[np.minimum(code_points, _MAX_CODE_POINT)]
+
+
+def soundex_array(values: Union[Sequence[str], np.ndarray], length: int = 8) -> np.ndarray:
+    """
+    Soundex américain vectorisé : table de correspondance puis fusion des codes adjacents
+    identiques par opérations sur tableaux, sans boucle Python par valeur.
+    Le code est formé de la première lettre suivie de length - 1 chiffres, complété par des '0'
+    (une valeur sans lettre donne length '0', comme la librairie Phonex).
+
+    :param values: Valeurs à encoder, ou tableau uint8 déjà normalisé (normalize_names).
+    :param length: Longueur du code.
+    :return: Tableau NumPy des codes, aligné sur les valeurs.
+    """
+    length = max(int(length), 1)
+    names = values if isinstance(values, np.ndarray) and values.dtype == np.uint8 else normalize_names(values)
+    count, width = names.shape
+    if not count:
+        return np.empty(0, dtype=str)
+
+    # Parcours par colonne (largeur des noms, faible) avec des opérations vectorisées sur toutes les lignes
+    codes = np.ascontiguousarray(SOUNDEX_TABLE[names].T)
+    letters = np.ascontiguousarray(names.T)
+    rows = np.arange(count)
+    # Une colonne supplémentaire reçoit les écritures des lignes sans chiffre à ajouter
+    output = np.full((count, length + 1), ord("0"), dtype=np.uint8)
+    first_letter = np.zeros(count, dtype=np.uint8)
+    previous = np.full(count, _IGNORED, dtype=np.uint8)
+    digits = np.zeros(count, dtype=np.intp)
+
+    for column in range(width):
+        code, letter = codes[column], letters[column]
+        started = first_letter != 0
+        is_first = ~started & (letter != 0)
+        first_letter[is_first] = letter[is_first]
+        # Chiffre retenu : consonne après la première lettre, différente du code significatif précédent
+        keep = started & (code >= 1) & (code <= 6) & (code != previous) & (digits < length - 1)
+        output[rows, np.where(keep, digits + 1, length)] = code + ord("0")
+        digits += keep
+        # H, W et les non-lettres sont transparents ; les voyelles séparent deux codes identiques
+        significant = (code != _TRANSPARENT) & (code != _IGNORED)
+        previous = np.where(significant, code, previous)
+
+    output[:, 0] = np.where(first_letter != 0, first_letter, ord("0"))
+    return np.ascontiguousarray(output[:, :length]).view(f"S{length}").ravel().astype(str)
+
+
+class NumpySoundexWrapper:
+    """
+    Backend Soundex en NumPy pur : aucune librairie à charger, aucun passage par ctypes.
+    Même interface que les wrappers des librairies C.
+    """
+
+    def run(self, input_value: Union[str, List[str]], separator: str = "|",
+            length: int = 8) -> Union[str, List[str]]:
+        if isinstance(input_value, str):
+            values = input_value.split(separator)
+            codes = soundex_array(values, length).tolist()
+            return codes if len(codes) > 1 else codes[0]
+        return soundex_array(input_value, length).tolist()
+
+    def run_array(self, values: Sequence[str], length: int = 8) -> np.ndarray:
+        return soundex_array(values, length)
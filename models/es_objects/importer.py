@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from models.es_objects._base_obj import BaseObject
 
@@ -21,6 +21,8 @@ class EsImporter(BaseObject):
                  datas_filename: Optional[str] = None,
                  datas_separator: Optional[str] = None,
                  mapping_filename: Optional[str] = None,
+                 id_columns: Optional[List[str]] = None,
+                 op_type: Optional[str] = None,
                  ):
         super().__init__(es_id=es_id, filepath=filepath, filename=filename,
                          front_name=front_name, description=description, index_name=index_name,
@@ -29,6 +31,8 @@ class EsImporter(BaseObject):
         self._datas_filename = datas_filename
         self._datas_separator = datas_separator
         self._mapping_filename = mapping_filename
+        self._id_columns = id_columns
+        self._op_type = op_type
         self.expected_keys = {"front_name", "datas_filename", "datas_separator", "mapping_filename", "index_name"}
 
     @property
@@ -64,6 +68,29 @@ class EsImporter(BaseObject):
             return
         self._mapping_filename = name
 
+    @property
+    def id_columns(self) -> Optional[List[str]]:
+        """Colonnes clés servant à calculer les _id des documents (import idempotent)."""
+        return self._id_columns
+
+    @id_columns.setter
+    def id_columns(self, columns: Optional[List[str] | str]):
+        if isinstance(columns, str):
+            columns = [columns]
+        self._id_columns = columns or None
+
+    @property
+    def op_type(self) -> str:
+        """Type d'opération bulk : index, create ou update (doc_as_upsert)."""
+        return self._op_type or "index"
+
+    @op_type.setter
+    def op_type(self, op_type: Optional[str]):
+        if op_type and op_type not in ("index", "create", "update"):
+            print(f"❌ EsImporter.op_type : valeur invalide {op_type}")
+            return
+        self._op_type = op_type
+
     def to_dict_file(self):
         """
         Convertit l'objet en dictionnaire JSON exportable.
@@ -76,6 +103,8 @@ class EsImporter(BaseObject):
             "mapping_filename": self.mapping_filename,
             "index_name": self.index_name,
             "description": self.description,
+            "id_columns": self.id_columns,
+            "op_type": self.op_type,
         }
 
     @property
@@ -88,6 +117,8 @@ class EsImporter(BaseObject):
         base_dict["datas_filename"] = self.datas_filename
         base_dict["datas_separator"] = self.datas_separator
         base_dict["mapping_filename"] = self.mapping_filename
+        base_dict["id_columns"] = self.id_columns
+        base_dict["op_type"] = self.op_type
         return base_dict
 
     @dict.setter
@@ -104,6 +135,8 @@ class EsImporter(BaseObject):
         self.datas_filename = data.get("datas_filename", None)
         self.datas_separator = data.get("datas_separator", None)
         self.mapping_filename = data.get("mapping_filename", None)
+        self.id_columns = data.get("id_columns", None)
+        self.op_type = data.get("op_type", None)
 
     @property
     def dict_file(self) -> dict:
@@ -118,4 +151,6 @@ class EsImporter(BaseObject):
             "mapping_filename": self.mapping_filename,
             "index_name": self.index_name,
             "description": self.description,
+            "id_columns": self.id_columns,
+            "op_type": self.op_type,
         }
\ No newline at end of file
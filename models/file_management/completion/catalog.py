@@ -0,0 +1,154 @@
+import csv
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import Config
+from models.file_management.file_utls import FileUtils
+from models.file_management.overlay import file_hash
+
+logger = logging.getLogger(__name__)
+
+
+class CompletionFileInfo:
+    """
+    Informations d'un fichier de complétion : entêtes et séparateur lus à la création,
+    nombre de lignes et empreinte calculés à la première demande (ils nécessitent une lecture complète).
+    """
+
+    def __init__(self, path: Path, stat: os.stat_result):
+        self._path = path
+        self._size = stat.st_size
+        self._mtime_ns = stat.st_mtime_ns
+        self._sep = FileUtils.detect_separator(str(path))
+        # utf-8-sig : un BOM éventuel ne doit pas se retrouver dans la première entête
+        with path.open(encoding="utf-8-sig", newline="") as f:
+            self._headers = next(csv.reader(f, delimiter=self._sep), [])
+        self._rows: Optional[int] = None
+        self._hash: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self._path.name
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def mtime_ns(self) -> int:
+        return self._mtime_ns
+
+    @property
+    def sep(self) -> str:
+        return self._sep
+
+    @property
+    def headers(self) -> List[str]:
+        return self._headers
+
+    @property
+    def rows(self) -> int:
+        """Nombre de lignes de données (hors entête)."""
+        if self._rows is None:
+            with self._path.open("rb") as f:
+                self._rows = max(sum(block.count(b"\n") for block in iter(lambda: f.read(1024 * 1024), b"")) - 1, 0)
+        return self._rows
+
+    @property
+    def hash(self) -> str:
+        """Empreinte SHA-256 du contenu."""
+        if self._hash is None:
+            self._hash = file_hash(self._path)
+        return self._hash
+
+    def is_current(self, stat: os.stat_result) -> bool:
+        return (stat.st_size, stat.st_mtime_ns) == (self._size, self._mtime_ns)
+
+    @property
+    def dict(self) -> dict:
+        return {"filename": self.name, "headers": self.headers, "sep": self.sep, "size": self.size,
+                "rows": self.rows}
+
+
+class CompletionCatalog:
+    """
+    Catalogue en mémoire du dossier des fichiers de complétion : liste des fichiers et informations de chaque
+    fichier (entêtes, nombre de lignes, empreinte). La liste est relue lorsque la date de modification du dossier
+    change (ajout, suppression ou renommage d'un fichier), les informations d'un fichier lorsque sa taille ou
+    sa date de modification changent : une consultation ne coûte qu'un stat.
+    """
+
+    def __init__(self, folder: Path):
+        self._folder = Path(folder)
+        self._lock = threading.Lock()
+        self._folder_mtime_ns: Optional[int] = None
+        self._filenames: List[str] = []
+        self._files: Dict[str, CompletionFileInfo] = {}
+
+    @property
+    def folder(self) -> Path:
+        return self._folder
+
+    def filenames(self) -> List[str]:
+        """Noms des fichiers du dossier, triés."""
+        try:
+            mtime_ns = self._folder.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        with self._lock:
+            if mtime_ns != self._folder_mtime_ns:
+                self._filenames = sorted(entry.name for entry in os.scandir(self._folder) if entry.is_file())
+                self._folder_mtime_ns = mtime_ns
+                self._files = {name: info for name, info in self._files.items() if name in self._filenames}
+            return list(self._filenames)
+
+    def get(self, filename: str) -> Optional[CompletionFileInfo]:
+        """
+        Informations d'un fichier du dossier, ou None s'il est absent ou illisible.
+        """
+        path = self._folder / Path(filename).name
+        try:
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        with self._lock:
+            info = self._files.get(path.name)
+        if info is not None and info.is_current(stat):
+            return info
+        try:
+            info = CompletionFileInfo(path, stat)
+        except (OSError, UnicodeDecodeError, ValueError, RuntimeError) as e:
+            logger.error(f"CompletionCatalog - Fichier de complétion illisible {path} : {e}")
+            return None
+        with self._lock:
+            self._files[path.name] = info
+        return info
+
+    def headers(self, filename: str) -> Optional[List[str]]:
+        info = self.get(filename)
+        return info.headers if info is not None else None
+
+    def infos(self) -> List[CompletionFileInfo]:
+        return [info for info in (self.get(name) for name in self.filenames()) if info is not None]
+
+
+_catalogs: Dict[Path, CompletionCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_completion_catalog(config: Optional[Config] = None) -> CompletionCatalog:
+    """Catalogue partagé par le processus pour le dossier des complétions configuré."""
+    config = config or Config()
+    folder = Path(config.file_types.completions.folder_path).resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(folder)
+        if catalog is None:
+            catalog = _catalogs[folder] = CompletionCatalog(folder)
+        return catalog
@@ -1,14 +1,14 @@
 import logging
-import shutil
+import re
 from pathlib import Path
-from typing import Optional, List, Union
-from io import StringIO
+from typing import Callable, Iterable, Iterator, Optional, List, Union
 
+import numpy as np
 import pandas as pd
 
 from config import Config
 from elastic_manager import ElasticManager
-from models.file_management.file_utls import FileUtils
+from models.file_management.file_utls import AtomicFileWriter, FileUtils
 from models.file_management.readers.csv_file_reader import CsvFileReader
 
 logger = logging.getLogger(__name__)
@@ -83,31 +83,31 @@ class CsvManualMultiColumnsBuilder:
     def output_path(self, filename: str):
         self._output_csv = self.file_types.completions.folder_path / filename
 
-    def create_csv(self) -> bool | str:
+    def create_csv(self, on_chunk: Optional[Callable[..., None]] = None) -> bool | str:
         """
         Crée un nouveau CSV contenant la colonne source et les colonnes vides.
+        Seule la colonne source est lue, en un seul passage ; chaque ligne est écrite sous forme de texte
+        préformaté (valeur puis suffixe constant des colonnes vides), par blocs, dans un fichier temporaire
+        qui remplace le fichier de sortie une fois complet.
+
+        :param on_chunk: Callback optionnel appelé après chaque chunk avec (index du chunk, nombre de chunks)
+            et les compteurs rows/total_bytes.
         """
         if self.separator is None:
             self.separator = self.reader.sep
+        sep = self.reader.sep
+        # Les colonnes vides ne changent jamais : leur texte est calculé une fois
+        suffix = sep * len(self.new_columns) + "\n"
         try:
-            for chunk_index in range(self.reader.num_chunks):
-                chunk_values = self.reader.get_column_chunk(self.source_column, chunk_index, self.chunk_size)
-                data = {self.source_column: chunk_values}
-
-                for col in self.new_columns:
-                    data[col] = ["" for _ in chunk_values]
-
-                df = pd.DataFrame(data)
-
-                df.to_csv(
-                    self.output_path,
-                    index=False,
-                    sep=self.reader.sep,
-                    encoding=self.reader.encoding,
-                    mode='w' if chunk_index == 0 else 'a',
-                    header=chunk_index == 0,
-                    lineterminator="\n"
-                )
+            num_chunks = self.reader.num_chunks if on_chunk is not None else 0
+            with AtomicFileWriter(self.output_path, self.reader.encoding) as output:
+                header = [self.source_column] + self.new_columns
+                output.file.write(sep.join(quote_csv_values(pd.Series(header), sep)) + "\n")
+                for chunk_index, values in enumerate(self.reader.iter_column(self.source_column, self.chunk_size)):
+                    lines = quote_csv_values(values.fillna(""), sep)
+                    output.file.write(suffix.join(lines) + suffix if lines else "")
+                    if on_chunk is not None:
+                        on_chunk(chunk_index, num_chunks, rows=len(lines), total_bytes=self.reader.file_size)
         except Exception as e:
             logger.error(
                 f"CsvManualMultiColumnsBuilder - Une erreur s'est produite lors de la création du fichier CSV : {e}")
@@ -116,64 +116,111 @@ class CsvManualMultiColumnsBuilder:
 
     def inject_values_in_chunks(self, df_values: pd.DataFrame, start_row: int = 0) -> None:
         """
-        Injecte les valeurs chunk par chunk à partir de `start_row`, sans recharger tout le fichier.
+        Injecte les valeurs à partir de `start_row` (voir inject_values_stream).
 
         Args:
             df_values: DataFrame contenant les nouvelles valeurs à injecter.
             start_row: Index de ligne du fichier à partir duquel injecter les données.
         """
-        for col in self.new_columns:
-            if col not in df_values.columns:
-                raise ValueError(f"Colonne {col} manquante dans le DataFrame fourni")
+        self.inject_values_stream([df_values], start_row)
+
+    def inject_values_stream(self, values: Iterable[pd.DataFrame], start_row: int = 0) -> int:
+        """
+        Fusionne en une seule lecture du fichier un flux de DataFrames de valeurs alignés sur ses lignes.
+        Le fichier est lu chunk par chunk ; chaque chunk consomme autant de lignes de valeurs que nécessaire
+        (les DataFrames du flux peuvent avoir une taille quelconque) et seules les cellules vides des nouvelles
+        colonnes sont remplies, par masque vectorisé. Le résultat est écrit via AtomicFileWriter : synchronisé sur
+        disque puis substitué au fichier de sortie une fois complet, avec les permissions de ce dernier.
+
+        Args:
+            values: DataFrames contenant les nouvelles colonnes, consommés dans l'ordre.
+            start_row: Index de ligne du fichier correspondant à la première valeur.
 
-        total_rows = sum(1 for _ in open(self.output_path, encoding=self.reader.encoding)) - 1
-        max_required = start_row + len(df_values)
-        if max_required > total_rows:
-            raise ValueError("Le DataFrame à injecter dépasse la taille du fichier existant.")
-
-        tmp_path = str(self.output_path) + ".tmp"
-        if Path(tmp_path).exists():
-            Path(tmp_path).unlink()
-
-        header = pd.read_csv(self.output_path, sep=self.reader.sep, nrows=0).columns.tolist()
-
-        with open(self.output_path, encoding=self.reader.encoding) as infile:
-            next(infile)  # skip header
-            all_lines = infile.readlines()
-
-        n_chunks = (total_rows // self.chunk_size) + (1 if total_rows % self.chunk_size else 0)
-
-        with open(tmp_path, 'w', encoding=self.reader.encoding) as outfile:
-            outfile.write(self.reader.sep.join(header) + "\n")
-
-            for chunk_index in range(n_chunks):
-                start = chunk_index * self.chunk_size
-                end = min((chunk_index + 1) * self.chunk_size, total_rows)
-                lines = all_lines[start:end]
-
-                df_chunk = pd.read_csv(
-                    StringIO("".join([self.reader.sep.join(header) + "\n"] + lines)),
-                    sep=self.reader.sep,
-                    dtype=str
-                )
-
-                for i in range(len(df_chunk)):
-                    global_idx = start + i
-                    if start_row <= global_idx < start_row + len(df_values):
-                        for col in self.new_columns:
-                            val = str(df_values.at[global_idx - start_row, col])
-                            if pd.isna(df_chunk.at[i, col]) or df_chunk.at[i, col] == "":
-                                df_chunk.at[i, col] = val
-
-                df_chunk.to_csv(
-                    outfile,
-                    index=False,
-                    sep=self.reader.sep,
-                    header=False,
-                    lineterminator="\n"
-                )
-
-        shutil.move(tmp_path, self.output_path)
+        Returns:
+            Nombre de lignes de valeurs injectées.
+
+        Raises:
+            ValueError: Si une colonne manque ou si les valeurs dépassent la taille du fichier.
+        """
+        pending = _ValuesBuffer(iter(values), self.new_columns)
+        output_path = Path(self.output_path)
+        injected = 0
+        row = 0
+        with AtomicFileWriter(output_path, self.reader.encoding) as output:
+            read_options = dict(sep=self.reader.sep, encoding=self.reader.encoding, dtype=str,
+                                keep_default_na=False)
+            header = pd.read_csv(output_path, nrows=0, **read_options)
+            header.to_csv(output.file, index=False, sep=self.reader.sep, lineterminator="\n")
+            for df_chunk in pd.read_csv(output_path, chunksize=self.chunk_size, **read_options):
+                skipped = min(max(start_row - row, 0), len(df_chunk))
+                df_new = pending.take(len(df_chunk) - skipped)
+                if len(df_new):
+                    target = slice(skipped, skipped + len(df_new))
+                    for col in self.new_columns:
+                        current = df_chunk[col].to_numpy(dtype=object)
+                        window = current[target]
+                        new_values = df_new[col].to_numpy(dtype=object)
+                        current[target] = np.where(window == "", new_values, window)
+                        df_chunk[col] = current
+                    injected += len(df_new)
+                row += len(df_chunk)
+                df_chunk.to_csv(output.file, index=False, sep=self.reader.sep, header=False, lineterminator="\n")
+            if not pending.exhausted():
+                raise ValueError("Le DataFrame à injecter dépasse la taille du fichier existant.")
+        return injected
+
+
+def quote_csv_values(values: pd.Series, sep: str) -> List[str]:
+    """
+    Formate des valeurs en champs CSV (règles de csv.QUOTE_MINIMAL) : seules les valeurs contenant
+    le séparateur, un guillemet ou un saut de ligne sont entourées de guillemets.
+    """
+    values = values.astype(str)
+    special = values.str.contains(f"[{re.escape(sep)}\"\r\n]", regex=True)
+    if special.any():
+        values = values.where(~special, '"' + values.str.replace('"', '""', regex=False) + '"')
+    return values.tolist()
+
+
+class _ValuesBuffer:
+    """Découpe un flux de DataFrames de taille quelconque en blocs de lignes de la taille demandée."""
+
+    def __init__(self, frames: Iterator[pd.DataFrame], columns: List[str]):
+        self._frames = frames
+        self._columns = columns
+        self._parts: List[pd.DataFrame] = []
+        self._size = 0
+
+    def take(self, count: int) -> pd.DataFrame:
+        """Retire jusqu'à `count` lignes du flux (moins si le flux est épuisé)."""
+        while self._size < count and self._pull():
+            pass
+        if not self._parts:
+            return pd.DataFrame(columns=self._columns)
+        block = pd.concat(self._parts, ignore_index=True) if len(self._parts) > 1 else self._parts[0]
+        taken, rest = block.iloc[:count], block.iloc[count:]
+        self._parts = [rest] if len(rest) else []
+        self._size = len(rest)
+        return taken
+
+    def exhausted(self) -> bool:
+        """Indique qu'il ne reste aucune ligne à injecter."""
+        while not self._size:
+            if not self._pull():
+                return True
+        return False
+
+    def _pull(self) -> bool:
+        frame = next(self._frames, None)
+        if frame is None:
+            return False
+        for col in self._columns:
+            if col not in frame.columns:
+                raise ValueError(f"Colonne {col} manquante dans le DataFrame fourni")
+        frame = frame[self._columns].reset_index(drop=True).fillna("").astype(str)
+        self._parts.append(frame)
+        self._size += len(frame)
+        return True
 
 
 if __name__ == "__main__":
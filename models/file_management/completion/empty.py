@@ -1,4 +1,4 @@
-from typing import Union, Optional, List, Dict
+from typing import Callable, Union, Optional, List, Dict
 
 from config import Config
 from models.file_management.completion.creator import CsvManualMultiColumnsBuilder
@@ -16,9 +16,11 @@ class MappingCompletionEmptyFileCreator:
     def __init__(
             self,
             request_dict: Dict,
-            config: Optional[Config] = None
+            config: Optional[Config] = None,
+            on_chunk: Optional[Callable[..., None]] = None
     ):
         self._config = config or Config()
+        self._on_chunk = on_chunk
         self.request = request_dict
         self._csv_object = None
 
@@ -40,7 +42,7 @@ class MappingCompletionEmptyFileCreator:
                 filename=self.request.filename,
                 config=self._config
             )
-            return self._csv_object.create_csv()
+            return self._csv_object.create_csv(on_chunk=self._on_chunk)
         except Exception as e:
             logger.error(f"EmptyColumnAdder - Erreur durant le traitement de création du fichier : {e}")
             return False
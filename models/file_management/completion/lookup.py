@@ -0,0 +1,138 @@
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+import numpy as np
+import pandas as pd
+
+from models.file_management.file_utls import FileUtils
+from models.file_management.overlay import file_hash
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Nombre de structures (tables, automates) gardées en mémoire par processus
+_MAX_TABLES = 16
+
+_tables: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+# Empreinte connue de chaque fichier : chemin -> (taille, date de modification, empreinte)
+_hashes: Dict[str, Tuple[int, int, str]] = {}
+_tables_lock = threading.Lock()
+
+
+class ReplacementTable:
+    """
+    Table de correspondance d'un fichier de complétion (synonymes, codes phonétiques...) :
+    la première colonne contient les valeurs d'origine, les suivantes les valeurs de complétion.
+    Le fichier est lu une fois ; les valeurs d'origine forment un index de hachage (pd.Index), si bien que
+    compléter un chunk se résume à une jointure vectorisée (get_indexer puis indexation numpy).
+    """
+
+    def __init__(self, filepath: Union[str, Path], use_first_column: bool = False, sep: Optional[str] = None):
+        """
+        :param filepath: Fichier de complétion
+        :param use_first_column: Inclut la valeur d'origine parmi les valeurs de complétion
+        :param sep: Séparateur du fichier (détecté si absent)
+        """
+        self._filepath = Path(filepath)
+        sep = sep or FileUtils.detect_separator(str(self._filepath))
+        frame = pd.read_csv(self._filepath, sep=sep, dtype=str, keep_default_na=False)
+        if frame.empty or len(frame.columns) < 2:
+            logger.warning(f"ReplacementTable - Aucune valeur de complétion dans {self._filepath}")
+        frame = frame.drop_duplicates(subset=frame.columns[0], keep="first").reset_index(drop=True)
+        self._frame = frame
+        self._index = pd.Index(frame.iloc[:, 0])
+
+        keys = frame.iloc[:, 0].tolist()
+        rows = frame.iloc[:, 0 if use_first_column else 1:].to_numpy(dtype=object).tolist()
+        # Une case de plus en fin de tableau : get_indexer retourne -1 pour une valeur absente
+        self._values = np.empty(len(keys) + 1, dtype=object)
+        self._values_with_original = np.empty(len(keys) + 1, dtype=object)
+        for position, (key, row) in enumerate(zip(keys, rows)):
+            values = list(dict.fromkeys(value for value in row if value))
+            self._values[position] = values or None
+            self._values_with_original[position] = [key] + [value for value in values if value != key]
+
+    @property
+    def filepath(self) -> Path:
+        return self._filepath
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Contenu du fichier (une ligne par valeur d'origine)."""
+        return self._frame
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def positions(self, values: Union[pd.Series, np.ndarray, List[str]]) -> np.ndarray:
+        """Position de chaque valeur dans la table (-1 si absente)."""
+        return self._index.get_indexer(np.asarray(values, dtype=object))
+
+    def complete(self, values: Union[pd.Series, np.ndarray, List[str]], keep_original: bool = False) -> np.ndarray:
+        """
+        Remplace chaque valeur par la liste de ses valeurs de complétion.
+
+        :param values: Valeurs d'origine d'un chunk
+        :param keep_original: Place la valeur d'origine en tête de liste (seule si elle est absente de la table)
+        :return: Tableau d'objets : une liste par valeur, None si la valeur est absente de la table
+            (et que keep_original est faux) ou manquante.
+            Les listes sont partagées avec la table : elles ne doivent pas être modifiées.
+        """
+        values = np.asarray(values, dtype=object)
+        positions = self.positions(values)
+        if not keep_original:
+            return self._values[positions]
+        result = self._values_with_original[positions]
+        for i in np.flatnonzero(positions < 0):
+            result[i] = [values[i]] if isinstance(values[i], str) else None
+        return result
+
+
+def get_cached_table(filepath: Union[str, Path], options: Tuple[Any, ...], factory: Callable[[Path], T]) -> T:
+    """
+    Retourne la structure construite par `factory` à partir d'un fichier de complétion, partagée par le processus
+    (entre chunks et entre imports). Les structures sont indexées par l'empreinte du contenu et par `options`
+    (type de structure et paramètres) : un fichier modifié est relu, un fichier identique sous un autre nom ne
+    l'est pas. L'empreinte n'est recalculée que si la taille ou la date du fichier changent.
+    """
+    path = Path(filepath).resolve()
+    stat = path.stat()
+    with _tables_lock:
+        known = _hashes.get(str(path))
+    if known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns):
+        digest = known[2]
+    else:
+        digest = file_hash(path)
+        with _tables_lock:
+            _hashes[str(path)] = (stat.st_size, stat.st_mtime_ns, digest)
+
+    key = (digest, *options)
+    with _tables_lock:
+        table = _tables.get(key)
+        if table is not None:
+            _tables.move_to_end(key)
+            return table
+    table = factory(path)
+    with _tables_lock:
+        _tables[key] = table
+        while len(_tables) > _MAX_TABLES:
+            _tables.popitem(last=False)
+    logger.info(f"{type(table).__name__} - {len(table)} valeurs chargées depuis {path}")
+    return table
+
+
+def get_replacement_table(filepath: Union[str, Path], use_first_column: bool = False) -> ReplacementTable:
+    """Retourne la table de correspondance d'un fichier de complétion (cf. get_cached_table)."""
+    return get_cached_table(filepath, ("replacement", use_first_column),
+                            lambda path: ReplacementTable(path, use_first_column))
+
+
+def clear_replacement_tables() -> None:
+    """Vide les tables gardées en mémoire (fichiers de complétion modifiés hors application, tests)."""
+    with _tables_lock:
+        _tables.clear()
+        _hashes.clear()
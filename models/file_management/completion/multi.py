@@ -0,0 +1,211 @@
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import pandas as pd
+
+from config import Config
+from models.file_management.completion.creator import quote_csv_values
+from models.file_management.file_utls import AtomicFileWriter, FileUtils
+from models.file_management.filepath_codec import FilePathCodec
+from models.file_management.readers.csv_file_reader import CsvFileReader
+from models.phonetc_basics.chunk_encoder import PhoneticChunkEncoder
+from models.phonetc_basics.phonetic_dict_validator import PhoneticDictValidator
+
+logger = logging.getLogger(__name__)
+
+# Marqueur de fin de flux vers un worker
+_END = object()
+
+
+class _CompletionTask:
+    """
+    Écriture d'un fichier de complétion : colonne source suivie de colonnes vides ou de codes phonétiques.
+    """
+
+    def __init__(self, spec: Dict[str, Any], folder: Path, config: Config):
+        self.column = spec.get("column") or spec.get("original_field")
+        if not self.column:
+            raise ValueError(f"Colonne source absente de la complétion {spec}")
+        self.kind = spec.get("type") or ("phonetic" if spec.get("category") == "phonetic" else "empty")
+        self.encoder: Optional[PhoneticChunkEncoder] = None
+        if self.kind == "phonetic":
+            self.encoder = PhoneticChunkEncoder(PhoneticDictValidator(spec.get("phonetic")).validate(), self.column,
+                                                config)
+            self.new_columns = self.encoder.new_column_names
+            filename = spec.get("filename") or FileUtils.generate_filename(".csv")
+        elif self.kind == "empty":
+            new_columns = spec.get("new_columns") or spec.get("new_column") or f"{self.column}_completion"
+            self.new_columns = [new_columns] if isinstance(new_columns, str) else list(new_columns)
+            filename = spec.get("filename") or "multicols_" + FileUtils.generate_filename(".csv")
+        else:
+            raise ValueError(f"Type de complétion inconnu : {self.kind}")
+        self.path = folder / Path(filename).name
+        self._output: Optional[AtomicFileWriter] = None
+        self._sep = ","
+
+    def open(self, encoding: str, sep: str) -> None:
+        self._sep = sep
+        self._output = AtomicFileWriter(self.path, encoding)
+        header = quote_csv_values(pd.Series([self.column] + self.new_columns), sep)
+        self._output.file.write(sep.join(header) + "\n")
+
+    def write(self, values: pd.Series) -> None:
+        # Même rendu que CsvManualMultiColumnsBuilder.create_csv : une valeur manquante est une cellule vide
+        values = values.fillna("").reset_index(drop=True)
+        if self.encoder is None:
+            suffix = self._sep * len(self.new_columns) + "\n"
+            lines = quote_csv_values(values, self._sep)
+            self._output.file.write(suffix.join(lines) + suffix if lines else "")
+            return
+        df = pd.concat([values.rename(self.column), self.encoder.encode(values)], axis=1)
+        df.to_csv(self._output.file, index=False, header=False, sep=self._sep, lineterminator="\n")
+
+    def commit(self) -> None:
+        self._output.commit()
+
+    def abort(self) -> None:
+        if self._output is not None:
+            self._output.abort()
+
+
+class MultiCompletionFileCreator:
+    """
+    Crée en un seul job les fichiers de complétion de plusieurs champs (colonnes vides ou phonétiques)
+    d'un même fichier de données. Le fichier est lu une seule fois, en ne lisant que les colonnes sources ;
+    chaque chunk est distribué à un worker par fichier de complétion, qui écrit son CSV en parallèle des autres
+    (files bornées entre la lecture et les workers). Les fichiers ne sont visibles qu'une fois tous complets.
+
+    Requête : {"filepath": <chemin encodé>, "sep": ";", "completions": [
+        {"type": "empty", "column": "nom", "new_columns": ["nom_completion"], "filename": "..."},
+        {"type": "phonetic", "column": "prenom", "phonetic": {"soundex": true}}]}
+    """
+
+    def __init__(
+            self,
+            request: Dict[str, Any],
+            config: Optional[Config] = None,
+            on_chunk: Optional[Callable[..., None]] = None,
+            queue_size: Optional[int] = None
+    ):
+        self._config = config or Config()
+        self._request = request or {}
+        self._on_chunk = on_chunk
+        self._queue_size = max(queue_size or self._config.import_queue_size, 1)
+        self._failed = threading.Event()
+        self._error: Optional[str] = None
+
+    def create(self) -> Union[bool, List[Dict[str, str]]]:
+        """
+        :return: Une entrée {"column", "type", "filename"} par fichier créé, ou False en cas d'échec.
+        """
+        try:
+            reader = CsvFileReader(FilePathCodec.decode(self._request["filepath"]), sep=self._request.get("sep"),
+                                   config=self._config)
+            folder = Path(self._config.file_types.completions.folder_path)
+            tasks = [_CompletionTask(spec, folder, self._config) for spec in self._request.get("completions") or []]
+        except (KeyError, TypeError, ValueError, FileNotFoundError) as e:
+            logger.error(f"MultiCompletionFileCreator - Requête invalide : {e}")
+            return False
+        if not tasks:
+            logger.error("MultiCompletionFileCreator - Aucune complétion demandée")
+            return False
+        paths = [task.path for task in tasks]
+        duplicates = sorted({path.name for path in paths if paths.count(path) > 1})
+        if duplicates:
+            logger.error(f"MultiCompletionFileCreator - Plusieurs complétions écrivent le même fichier : {duplicates}")
+            return False
+        missing = {task.column for task in tasks} - set(reader.headers)
+        if missing:
+            logger.error(f"MultiCompletionFileCreator - Colonnes absentes de {reader.filepath} : {sorted(missing)}")
+            return False
+
+        queues: List[queue.Queue] = [queue.Queue(maxsize=self._queue_size) for _ in tasks]
+        workers = [threading.Thread(target=self._write_stage, args=(task, task_queue), name=f"completion-{i}")
+                   for i, (task, task_queue) in enumerate(zip(tasks, queues))]
+        try:
+            for task in tasks:
+                task.open(reader.encoding, reader.sep)
+            for worker in workers:
+                worker.start()
+            self._read_stage(reader, tasks, queues)
+        except Exception as e:
+            self._fail(f"Erreur de lecture : {e}")
+        finally:
+            for task_queue in queues:
+                self._put_end(task_queue)
+            for worker in workers:
+                if worker.ident is not None:
+                    worker.join()
+
+        if self._failed.is_set():
+            for task in tasks:
+                task.abort()
+            return False
+        if not self._commit(tasks):
+            return False
+        return [{"column": task.column, "type": task.kind, "filename": task.path.name} for task in tasks]
+
+    def _commit(self, tasks: List[_CompletionTask]) -> bool:
+        """Publie les fichiers ; si une publication échoue, ceux déjà publiés sont retirés et les autres abandonnés."""
+        committed: List[_CompletionTask] = []
+        try:
+            for task in tasks:
+                task.commit()
+                committed.append(task)
+        except Exception as e:
+            self._fail(f"Erreur de publication de {task.path.name} : {e}")
+            for task in tasks:
+                if task in committed:
+                    task.path.unlink(missing_ok=True)
+                else:
+                    task.abort()
+            return False
+        return True
+
+    def _fail(self, message: str) -> None:
+        if not self._failed.is_set():
+            self._error = message
+            logger.error(f"MultiCompletionFileCreator - {message}")
+        self._failed.set()
+
+    def _read_stage(self, reader: CsvFileReader, tasks: List[_CompletionTask], queues: List[queue.Queue]) -> None:
+        num_chunks = reader.num_chunks if self._on_chunk is not None else 0
+        columns = [task.column for task in tasks]
+        for chunk_index, chunk in enumerate(reader.iter_columns(columns)):
+            for task, task_queue in zip(tasks, queues):
+                if not self._put(task_queue, chunk[task.column]):
+                    return
+            if self._on_chunk is not None:
+                self._on_chunk(chunk_index, num_chunks, rows=len(chunk), total_bytes=reader.file_size)
+
+    def _write_stage(self, task: _CompletionTask, task_queue: queue.Queue) -> None:
+        try:
+            while True:
+                values = task_queue.get()
+                if values is _END:
+                    return
+                if not self._failed.is_set():
+                    task.write(values)
+        except Exception as e:
+            self._fail(f"Erreur d'écriture de {task.path.name} : {e}")
+            # Vide la file jusqu'au marqueur de fin pour ne pas bloquer la lecture
+            while task_queue.get() is not _END:
+                pass
+
+    def _put(self, target: queue.Queue, item: Any) -> bool:
+        """Dépose un élément dans une file bornée en restant attentif à un échec d'un worker."""
+        while not self._failed.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _put_end(target: queue.Queue) -> None:
+        # Les workers consomment toujours leur file jusqu'au marqueur de fin : l'attente se termine
+        target.put(_END)
@@ -1,5 +1,7 @@
 import logging
-from typing import Optional
+from typing import Callable, Iterator, Optional
+
+import pandas as pd
 
 from config import Config
 from models.file_management.file_utls import FileUtils
@@ -19,8 +21,10 @@ class PhoneticFileCreator:
     Traite une requête de transformation phonétique sur un fichier CSV.
     """
 
-    def __init__(self, request_dataset: dict, config: Optional[Config] = None) -> bool | str:
+    def __init__(self, request_dataset: dict, config: Optional[Config] = None,
+                 on_chunk: Optional[Callable[..., None]] = None) -> bool | str:
         self._config = config or Config()
+        self._on_chunk = on_chunk
         self._request = PhoneticRequestValidator(request_dataset)
 
     def create(self) -> bool:
@@ -39,7 +43,11 @@ class PhoneticFileCreator:
             logger.error("PhoneticInserter - Le chemin de fichier original est invalide.")
             return False
 
-        phonex_dict = PhoneticDictValidator(self._request.phonetic).validate()
+        try:
+            phonex_dict = PhoneticDictValidator(self._request.phonetic, self._config).validate()
+        except ValueError as e:
+            logger.error(f"PhoneticInserter - {e}")
+            return False
         if not phonex_dict:
             logger.error("PhoneticInserter - Les algorithmes phonétiques sont invalides.")
             return False
@@ -60,6 +68,7 @@ class PhoneticFileCreator:
             logger.error(f"PhoneticInserter - Erreur durant le traitement d'injection des données : {e}")
             return False
 
+        logger.info(f"PhoneticInserter - Statistiques d'encodage : {encoder.stats}")
         return filename
 
     def _build_empty_phonetic_csv(self, csv_reader: CsvFileReader, encoder: PhoneticChunkEncoder,
@@ -78,13 +87,20 @@ class PhoneticFileCreator:
         self._csv_builder = builder
 
     def _inject_encoded_values(self, csv_reader: CsvFileReader, encoder: PhoneticChunkEncoder):
-        """Injecte les données encodées dans les colonnes du fichier CSV créé."""
-        prev_index = 0
-        for chunk_index in range(csv_reader.num_chunks):
-            chunk = csv_reader.get_column_chunk(self._request.column, chunk_index)
+        """Injecte les données encodées dans les colonnes du fichier CSV créé, en une seule réécriture."""
+        self._csv_builder.inject_values_stream(self._encoded_chunks(csv_reader, encoder))
+
+    def _encoded_chunks(self, csv_reader: CsvFileReader, encoder: PhoneticChunkEncoder) -> Iterator[pd.DataFrame]:
+        """
+        Encode les chunks de la colonne source au fur et à mesure de leur consommation par l'injection.
+        La colonne est lue en un seul passage, avec les mêmes valeurs que create_csv ('NA' reste 'NA').
+        """
+        num_chunks = csv_reader.num_chunks
+        for chunk_index, chunk in enumerate(csv_reader.iter_column(self._request.column, csv_reader.chunk_size)):
             encoded = encoder.encode(chunk)
-            self._csv_builder.inject_values_in_chunks(encoded, prev_index)
-            prev_index += len(encoded)
+            yield encoded
+            if self._on_chunk is not None:
+                self._on_chunk(chunk_index, num_chunks, rows=len(encoded), total_bytes=csv_reader.file_size)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,177 @@
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from models.file_management.completion.lookup import get_cached_table
+from models.file_management.file_utls import FileUtils
+
+logger = logging.getLogger(__name__)
+
+
+def _lower(value: str) -> str:
+    """Minuscules caractère pour caractère (les positions restent celles de la valeur d'origine)."""
+    lowered = value.lower()
+    if len(lowered) == len(value):
+        return lowered
+    return "".join(low if len(low) == 1 else char for char, low in ((char, char.lower()) for char in value))
+
+
+class AhoCorasick:
+    """
+    Automate d'Aho-Corasick : trouve toutes les occurrences d'un ensemble de motifs dans un texte
+    en un seul parcours, quel que soit le nombre de motifs.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        :param patterns: Motifs à rechercher ; l'identifiant d'un motif est sa position
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[int]] = [[]]
+        self._lengths: List[int] = []
+        for pattern_id, pattern in enumerate(patterns):
+            self._lengths.append(len(pattern))
+            if pattern:
+                self._add(pattern, pattern_id)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def _add(self, pattern: str, pattern_id: int) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._outputs[state].append(pattern_id)
+
+    def _build_failure_links(self) -> None:
+        """
+        Parcours en largeur : le lien d'échec d'un état pointe vers son plus long suffixe présent dans l'automate.
+        """
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._outputs[next_state] += self._outputs[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """Produit (début, fin, identifiant du motif) pour chaque occurrence, par position de fin croissante."""
+        goto, fail, outputs, lengths = self._goto, self._fail, self._outputs, self._lengths
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in outputs[state]:
+                yield end - lengths[pattern_id], end, pattern_id
+
+
+class SynonymExpander:
+    """
+    Expansion des synonymes d'un fichier de complétion de type "synonymes" (première colonne : terme,
+    colonnes suivantes : alternatives). Les termes sont compilés en un automate d'Aho-Corasick : toutes les
+    occurrences de termes d'une valeur, même composée de plusieurs mots, sont trouvées en un parcours linéaire.
+    La recherche ignore la casse et ne retient que des mots entiers ; parmi des occurrences qui se chevauchent,
+    la plus à gauche puis la plus longue l'emporte.
+    """
+
+    def __init__(self, filepath: Union[str, Path], sep: Optional[str] = None):
+        """
+        :param filepath: Fichier de complétion
+        :param sep: Séparateur du fichier (détecté si absent)
+        """
+        self._filepath = Path(filepath)
+        sep = sep or FileUtils.detect_separator(str(self._filepath))
+        frame = pd.read_csv(self._filepath, sep=sep, dtype=str, keep_default_na=False)
+
+        alternatives: Dict[str, List[str]] = {}
+        for row in frame.to_numpy(dtype=object).tolist():
+            term = row[0].strip()
+            if not term:
+                continue
+            values = alternatives.setdefault(_lower(term), [])
+            for value in row[1:]:
+                if value and value != term and value not in values:
+                    values.append(value)
+        self._terms = [term for term, values in alternatives.items() if values]
+        self._alternatives = [alternatives[term] for term in self._terms]
+        self._automaton = AhoCorasick(self._terms)
+
+    @property
+    def filepath(self) -> Path:
+        return self._filepath
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def find(self, value: str) -> List[Tuple[int, int, int]]:
+        """
+        Occurrences de termes dans une valeur : (début, fin, identifiant du terme), sans chevauchement.
+        """
+        matches = [
+            (start, end, term_id) for start, end, term_id in self._automaton.iter_matches(_lower(value))
+            if (start == 0 or not value[start - 1].isalnum()) and (end == len(value) or not value[end].isalnum())
+        ]
+        matches.sort(key=lambda match: (match[0], match[0] - match[1]))
+        selected = []
+        position = 0
+        for start, end, term_id in matches:
+            if start >= position:
+                selected.append((start, end, term_id))
+                position = end
+        return selected
+
+    def expand(self, value: str) -> List[str]:
+        """
+        Variantes d'une valeur : chaque occurrence de terme est remplacée, une à la fois, par chacune
+        de ses alternatives.
+        """
+        variants: List[str] = []
+        for start, end, term_id in self.find(value):
+            for alternative in self._alternatives[term_id]:
+                variant = value[:start] + alternative + value[end:]
+                if variant != value and variant not in variants:
+                    variants.append(variant)
+        return variants
+
+    def expand_many(self, values: Union[pd.Series, np.ndarray, List[str]], keep_original: bool = False) -> np.ndarray:
+        """
+        Variantes de chaque valeur d'un chunk (chaque valeur distincte n'est parcourue qu'une fois).
+
+        :param keep_original: Place la valeur d'origine en tête de liste
+        :return: Tableau d'objets : une liste par valeur, None si la valeur n'a pas de variante (et que
+            keep_original est faux) ou est manquante.
+        """
+        inverse, uniques = pd.factorize(pd.Series(values, dtype=object))
+        expanded = np.empty(len(uniques) + 1, dtype=object)
+        for position, value in enumerate(uniques.tolist()):
+            if not isinstance(value, str):
+                continue
+            variants = self.expand(value)
+            expanded[position] = ([value] + variants if keep_original else variants) or None
+        # pd.factorize retourne -1 pour une valeur manquante : la dernière case reste à None
+        return expanded[inverse]
+
+
+def get_synonym_expander(filepath: Union[str, Path]) -> SynonymExpander:
+    """
+    Retourne l'automate des synonymes d'un fichier de complétion, partagé par le processus (cf. get_cached_table).
+    """
+    return get_cached_table(filepath, ("synonyms",), SynonymExpander)
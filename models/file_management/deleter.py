@@ -5,6 +5,8 @@ from pathlib import Path
 from config import Config
 from elastic_manager import ElasticManager
 from models.file_management.file_infos import FileInfos
+from models.file_management.overlay import ColumnOverlay
+from models.file_management.versions import get_file_versions
 
 logger = logging.getLogger(__name__)
 
@@ -117,7 +119,9 @@ class FileDeleter:
             logger.warning(f"Fichier déjà absent ou introuvable : {file_path}")
             return False
         try:
-            file_path.unlink()
+            # Les lecteurs en cours gardent leur version du fichier
+            get_file_versions().publish(file_path)
+            ColumnOverlay(file_path).delete()
             logger.info(f"Fichier supprimé physiquement : {file_path}")
             return True
         except Exception as e:
@@ -0,0 +1,316 @@
+import csv
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from config import Config
+from models.file_management.completion.synonyms import get_synonym_expander
+from models.file_management.filepath_codec import FilePathCodec
+from models.file_management.readers.csv_file_reader import CsvFileReader
+from models.file_management.versions import VersionedFileWriter
+from models.phonetc_basics.chunk_encoder import PhoneticChunkEncoder
+from models.phonetc_basics.normalizer import NORMALIZATION_STEPS, PhoneticNormalizer
+from models.phonetc_basics.phonetic_dict_validator import PhoneticDictValidator
+
+logger = logging.getLogger(__name__)
+
+# Destinations possibles du résultat d'un pipeline
+PIPELINE_MODES = ("overlay", "file", "in_place")
+
+
+class ColumnTransform:
+    """
+    Transformation d'une colonne : la fonction reçoit la colonne source d'un chunk et retourne les colonnes
+    produites, insérées après la colonne `after` (par défaut la colonne source).
+    """
+
+    def __init__(
+            self,
+            source_column: str,
+            func: Callable[[pd.Series], Any],
+            output_columns: List[str],
+            after: Optional[str] = None,
+            name: Optional[str] = None
+    ):
+        if not output_columns:
+            raise ValueError(f"ColumnTransform - Aucune colonne produite pour '{source_column}'")
+        self._source_column = source_column
+        self._func = func
+        self._output_columns = list(output_columns)
+        self._after = after or source_column
+        self._name = name or getattr(func, "__name__", "transform")
+
+    @property
+    def source_column(self) -> str:
+        return self._source_column
+
+    @property
+    def output_columns(self) -> List[str]:
+        return self._output_columns
+
+    @property
+    def after(self) -> str:
+        return self._after
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def apply(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        :raises ValueError: Si le nombre de colonnes retournées ne correspond pas à output_columns.
+        """
+        result = pd.DataFrame(self._func(chunk[self._source_column]))
+        if len(result.columns) != len(self._output_columns):
+            raise ValueError(f"{self._name} : {len(result.columns)} colonnes retournées pour "
+                             f"{len(self._output_columns)} attendues")
+        result.columns = self._output_columns
+        return result.reset_index(drop=True)
+
+
+def _require(spec: Dict[str, Any], key: str) -> Any:
+    value = spec.get(key)
+    if value is None or value == "":
+        raise ValueError(f"ColumnPipeline : Le champ '{key}' est obligatoire.")
+    return value
+
+
+def _phonetic_transform(spec: Dict[str, Any], config: Config) -> ColumnTransform:
+    column = _require(spec, "column")
+    encoder = PhoneticChunkEncoder(PhoneticDictValidator(_require(spec, "phonetic")).validate(), column, config)
+    return ColumnTransform(column, encoder.encode, encoder.new_column_names, spec.get("after"), "phonetic")
+
+
+def _case_transform(suffix: str, func: Callable[[pd.Series], pd.Series]) -> Callable[..., ColumnTransform]:
+    def factory(spec: Dict[str, Any], config: Config) -> ColumnTransform:
+        column = _require(spec, "column")
+        output_columns = spec.get("output_columns") or [f"{column}_{suffix}"]
+        return ColumnTransform(column, func, output_columns, spec.get("after"), suffix)
+    return factory
+
+
+def _normalize_transform(spec: Dict[str, Any], config: Config) -> ColumnTransform:
+    column = _require(spec, "column")
+    # Transformation demandée explicitement : toutes les étapes si PHONETIC_NORMALIZATION n'en définit aucune
+    normalizer = PhoneticNormalizer(spec.get("steps", config.phonetic_normalization or NORMALIZATION_STEPS))
+
+    def normalize(series: pd.Series) -> pd.Series:
+        return pd.Series(normalizer.normalize(series.fillna("").astype(str).tolist()))
+
+    output_columns = spec.get("output_columns") or [f"{column}_normalized"]
+    return ColumnTransform(column, normalize, output_columns, spec.get("after"), "normalize")
+
+
+def _synonyms_transform(spec: Dict[str, Any], config: Config) -> ColumnTransform:
+    column = _require(spec, "column")
+    expander = get_synonym_expander(Path(config.file_types.completions.folder_path) / _require(spec, "filename"))
+    separator = spec.get("separator", "|")
+
+    def expand(series: pd.Series) -> pd.Series:
+        return pd.Series([separator.join(variants) if variants else ""
+                          for variants in expander.expand_many(series.to_numpy())])
+
+    output_columns = spec.get("output_columns") or [f"{column}_synonymes"]
+    return ColumnTransform(column, expand, output_columns, spec.get("after"), "synonyms")
+
+
+# Transformations disponibles dans une spécification : type -> fabrique (spec, config)
+TRANSFORM_FACTORIES: Dict[str, Callable[[Dict[str, Any], Config], ColumnTransform]] = {
+    "phonetic": _phonetic_transform,
+    "upper": _case_transform("upper", lambda series: series.str.upper()),
+    "lower": _case_transform("lower", lambda series: series.str.lower()),
+    "normalize": _normalize_transform,
+    "synonyms": _synonyms_transform,
+}
+
+
+def build_transform(spec: Dict[str, Any], config: Optional[Config] = None) -> ColumnTransform:
+    """
+    Construit une transformation depuis sa spécification, par exemple
+    {"type": "phonetic", "column": "nom", "phonetic": {"soundex": true}, "after": "nom"}.
+
+    :raises ValueError: Si le type est inconnu ou qu'un champ obligatoire manque.
+    """
+    transform_type = spec.get("type")
+    if transform_type not in TRANSFORM_FACTORIES:
+        raise ValueError(f"ColumnPipeline : Type de transformation inconnu : {transform_type}")
+    return TRANSFORM_FACTORIES[transform_type](spec, config or Config())
+
+
+class ColumnPipeline:
+    """
+    Applique plusieurs transformations de colonnes à un fichier CSV en un seul passage : chaque chunk est lu
+    une fois, toutes les transformations lui sont appliquées dans l'ordre (une transformation peut utiliser
+    les colonnes produites par les précédentes), puis le résultat est écrit une fois.
+    Le résultat va dans l'overlay du fichier, dans un nouveau fichier ou remplace le fichier source.
+    Une transformation en échec annule l'ensemble.
+    """
+
+    def __init__(
+            self,
+            csv_reader: CsvFileReader,
+            transforms: List[ColumnTransform],
+            on_chunk: Optional[Callable[..., None]] = None
+    ):
+        """
+        :param on_chunk: Callback optionnel appelé après chaque chunk avec (index du chunk, nombre de chunks)
+            et les compteurs rows/total_bytes.
+        :raises ValueError: Si aucune transformation n'est fournie.
+        """
+        if not transforms:
+            raise ValueError("ColumnPipeline - Aucune transformation")
+        self._csv_reader = csv_reader
+        self._transforms = list(transforms)
+        self._on_chunk = on_chunk
+
+    @classmethod
+    def from_spec(
+            cls,
+            spec: Dict[str, Any],
+            config: Optional[Config] = None,
+            on_chunk: Optional[Callable[..., None]] = None
+    ) -> "ColumnPipeline":
+        """
+        Construit un pipeline depuis une spécification soumise par l'interface :
+        {"filepath": <chemin encodé>, "sep": ";", "transforms": [<spécification de transformation>, ...]}.
+
+        :raises ValueError: Si la spécification est invalide.
+        """
+        config = config or Config()
+        filepath = FilePathCodec.decode(_require(spec, "filepath"))
+        transforms = [build_transform(transform, config) for transform in _require(spec, "transforms")]
+        csv_reader = CsvFileReader(filepath, sep=spec.get("sep"), config=config)
+        return cls(csv_reader, transforms, on_chunk)
+
+    @property
+    def csv_reader(self) -> CsvFileReader:
+        return self._csv_reader
+
+    @property
+    def transforms(self) -> List[ColumnTransform]:
+        return self._transforms
+
+    @property
+    def output_columns(self) -> List[str]:
+        return [name for transform in self._transforms for name in transform.output_columns]
+
+    def plan_headers(self, headers: List[str]) -> List[str]:
+        """
+        Calcule les entêtes produits à partir des entêtes d'entrée.
+
+        :raises ValueError: Si une colonne source ou d'ancrage est absente, ou si une colonne produite existe déjà.
+        """
+        headers = list(headers)
+        for transform in self._transforms:
+            for column in (transform.source_column, transform.after):
+                if column not in headers:
+                    raise ValueError(f"ColumnPipeline - Colonne '{column}' absente")
+            existing = set(transform.output_columns) & set(headers)
+            if existing:
+                raise ValueError(f"ColumnPipeline - Colonnes déjà présentes : {sorted(existing)}")
+            index = headers.index(transform.after) + 1
+            headers[index:index] = transform.output_columns
+        return headers
+
+    def run(self, mode: str = "overlay") -> Dict[str, Any]:
+        """
+        Exécute le pipeline.
+
+        :param mode: 'overlay' (colonnes ajoutées à l'overlay), 'file' (nouveau fichier '<nom>_modified.csv')
+            ou 'in_place' (réécriture du fichier source)
+        :return: Mode, colonnes produites et fichier écrit.
+        :raises ValueError: Si le mode est inconnu.
+        """
+        if mode not in PIPELINE_MODES:
+            raise ValueError(f"ColumnPipeline - Mode inconnu : {mode}")
+        filepath = Path(self._csv_reader.filepath)
+        if mode == "overlay":
+            self.process_to_overlay()
+            output_path = filepath
+        else:
+            output_path = filepath.with_name(f"{filepath.stem}_modified.csv") if mode == "file" else filepath
+            self.process_and_save(str(output_path))
+        return {"mode": mode, "columns": self.output_columns, "filename": output_path.name}
+
+    def process_to_overlay(self) -> None:
+        """
+        Ajoute les colonnes produites à l'overlay du fichier source, sans le réécrire.
+        Les colonnes dérivées existantes de même nom sont remplacées.
+
+        :raises ValueError: Si le lecteur n'utilise pas d'overlay ou si le pipeline est invalide.
+        :raises RuntimeError: Si une transformation échoue.
+        """
+        overlay = self._csv_reader.overlay
+        if overlay is None:
+            raise ValueError("Le lecteur CSV n'utilise pas d'overlay.")
+        replaced = set(self.output_columns)
+        self.plan_headers([name for name in self._csv_reader.headers if name not in replaced])
+
+        writers = [overlay.writer(transform.output_columns, transform.after) for transform in self._transforms]
+        try:
+            for _, outputs in self._iter_transformed_chunks():
+                for writer, values in zip(writers, outputs):
+                    writer.append(values)
+        except BaseException:
+            for writer in writers:
+                writer.abort()
+            raise
+        for writer in writers:
+            writer.commit()
+
+    def process_and_save(self, output_path: Optional[str] = None) -> None:
+        """
+        Écrit le fichier transformé (par défaut à la place du fichier source) via un fichier temporaire
+        publié comme nouvelle version de la cible (cf. VersionedFileWriter).
+
+        :raises ValueError: Si le pipeline est invalide.
+        :raises RuntimeError: Si une transformation échoue (la cible reste intacte).
+        """
+        source_path = Path(self._csv_reader.filepath)
+        target_path = Path(output_path) if output_path is not None else source_path
+        headers = self.plan_headers(self._csv_reader.headers)
+        in_place = target_path.resolve() == source_path.resolve()
+
+        owner = self._csv_reader.version if in_place else None
+        with VersionedFileWriter(target_path, self._csv_reader.encoding, owner=owner) as output:
+            pd.DataFrame(columns=headers).to_csv(output.file, index=False, sep=self._csv_reader.sep,
+                                                 quoting=csv.QUOTE_ALL)
+            for df, _ in self._iter_transformed_chunks():
+                df[headers].to_csv(output.file, index=False, header=False, sep=self._csv_reader.sep,
+                                   quoting=csv.QUOTE_ALL)
+
+        if in_place:
+            # Les colonnes dérivées font désormais partie du fichier
+            if self._csv_reader.overlay is not None:
+                self._csv_reader.overlay.delete()
+            self._csv_reader.reload()
+
+    def _iter_transformed_chunks(self) -> Iterator[Tuple[pd.DataFrame, List[pd.DataFrame]]]:
+        """
+        Parcourt le fichier une fois et applique toutes les transformations à chaque chunk.
+        Produit (chunk complété, colonnes produites par chaque transformation).
+        """
+        num_chunks = self._csv_reader.num_chunks
+        for chunk_index, chunk in enumerate(self._csv_reader.iter_chunks()):
+            yield self._transform_chunk(chunk_index, chunk)
+            self._notify_chunk(chunk_index, num_chunks, len(chunk))
+
+    def _transform_chunk(self, chunk_index: int, chunk: pd.DataFrame) -> Tuple[pd.DataFrame, List[pd.DataFrame]]:
+        df = chunk.reset_index(drop=True)
+        outputs = []
+        for transform in self._transforms:
+            try:
+                values = transform.apply(df)
+            except Exception as e:
+                raise RuntimeError(f"Échec de la transformation '{transform.name}' sur le chunk {chunk_index} : "
+                                   f"{e}") from e
+            for name in values.columns:
+                df[name] = values[name].to_numpy()
+            outputs.append(values)
+        return df, outputs
+
+    def _notify_chunk(self, chunk_index: int, num_chunks: int, rows: int) -> None:
+        if self._on_chunk is not None:
+            self._on_chunk(chunk_index, num_chunks, rows=rows, total_bytes=self._csv_reader.file_size)
@@ -1,11 +1,14 @@
 import csv
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 
 import pandas as pd
-from typing import Callable, Optional, List
+from typing import Any, Callable, Iterator, Optional, List, Tuple
 import logging
 
 from models.file_management.readers.csv_file_reader import CsvFileReader
+from models.file_management.versions import VersionedFileWriter
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +16,8 @@ logger = logging.getLogger(__name__)
 class CsvChunkAutoModifier:
     """
     Applique une fonction de transformation à une colonne d'un CSV chunk par chunk,
-    puis insère les colonnes résultantes juste après la colonne source.
+    puis insère les colonnes résultantes juste après la colonne source :
+    dans un nouveau fichier (process_and_save) ou dans l'overlay du fichier, sans le réécrire (process_to_overlay).
     """
 
     def __init__(
@@ -22,65 +26,177 @@ class CsvChunkAutoModifier:
             source_column: str,
             modify_func: Callable[[pd.Series], pd.DataFrame],
             output_columns: Optional[List[str]] = None,
+            on_chunk: Optional[Callable[..., None]] = None,
     ) -> None:
+        """
+        :param on_chunk: Callback optionnel appelé après chaque chunk avec (index du chunk, nombre de chunks)
+            et les compteurs rows/total_bytes.
+        """
         self.csv_reader = csv_reader
         self.source_column = source_column
         self.modify_func = modify_func
         self.output_columns = output_columns
+        self.on_chunk = on_chunk
 
-    def _generate_modified_chunk(self, chunk: pd.DataFrame) -> Optional[pd.DataFrame]:
+    def _generate_modified_columns(self, chunk: pd.DataFrame) -> Optional[pd.DataFrame]:
         """
-        Transforme un chunk en insérant les colonnes modifiées après la colonne source.
+        Calcule les colonnes produites par la transformation pour un chunk.
         """
         if self.source_column not in chunk.columns:
             logger.warning(f"Colonne '{self.source_column}' absente du chunk, chunk ignoré.")
             return None
 
         try:
-            modified_df = pd.DataFrame(self.modify_func(chunk[self.source_column]))
+            result = self.modify_func(chunk[self.source_column])
         except Exception as e:
             logger.error(f"Erreur de transformation sur chunk: {e}")
             return None
+        return self._format_columns(result)
 
+    def _format_columns(self, result: Any) -> Optional[pd.DataFrame]:
+        """
+        Vérifie et renomme les colonnes retournées par la transformation.
+        """
+        modified_df = pd.DataFrame(result)
         if self.output_columns and len(modified_df.columns) != len(self.output_columns):
             logger.error("Le nombre de colonnes retournées ne correspond pas à output_columns.")
             return None
 
+        modified_df.columns = self.output_columns if self.output_columns else modified_df.columns
+        return modified_df.reset_index(drop=True)
+
+    def _generate_modified_chunk(self, chunk: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Transforme un chunk en insérant les colonnes modifiées après la colonne source.
+        """
+        return self._insert_columns(chunk, self._generate_modified_columns(chunk))
+
+    def _insert_columns(self, chunk: pd.DataFrame, modified_df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        if modified_df is None:
+            return None
+
         insert_index = chunk.columns.get_loc(self.source_column) + 1
         left = chunk.iloc[:, :insert_index].reset_index(drop=True)
         right = chunk.iloc[:, insert_index:].reset_index(drop=True)
-        modified_df.columns = self.output_columns if self.output_columns else modified_df.columns
+        return pd.concat([left, modified_df, right], axis=1)
 
-        return pd.concat([left, modified_df.reset_index(drop=True), right], axis=1)
+    def process_to_overlay(self) -> None:
+        """
+        Enregistre les colonnes produites dans l'overlay du fichier source : le fichier n'est pas réécrit,
+        seules les nouvelles colonnes sont écrites. Un chunk en échec annule l'ajout (les colonnes doivent
+        rester alignées sur toutes les lignes du fichier).
 
-    def process_and_save(self, output_path: Optional[str] = None) -> None:
+        :raises ValueError: Si le lecteur n'utilise pas d'overlay.
+        :raises RuntimeError: Si un chunk n'a pas pu être transformé.
+        """
+        overlay = self.csv_reader.overlay
+        if overlay is None:
+            raise ValueError("Le lecteur CSV n'utilise pas d'overlay.")
+        num_chunks = self.csv_reader.num_chunks
+        writer = None
+        try:
+            for chunk_index, chunk in enumerate(self.csv_reader.iter_chunks()):
+                modified_df = self._generate_modified_columns(chunk)
+                if modified_df is None:
+                    raise RuntimeError(f"Échec de la transformation du chunk {chunk_index}")
+                if writer is None:
+                    writer = overlay.writer(list(modified_df.columns), self.source_column)
+                writer.append(modified_df)
+                self._notify_chunk(chunk_index, num_chunks, len(modified_df))
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+        if writer is not None:
+            writer.commit()
+
+    def process_and_save(self, output_path: Optional[str] = None, workers: int = 0) -> None:
         """
         Lance le traitement chunk par chunk et écrit le fichier modifié.
+        Le fichier source est lu en un seul passage ; la sortie est écrite dans un fichier temporaire voisin
+        (écritures bufferisées), synchronisée sur disque puis publiée comme nouvelle version de la cible
+        (les lecteurs en cours gardent l'ancienne) : en cas d'erreur, la cible reste intacte.
+
+        :param output_path: Fichier de sortie (None : le fichier source est réécrit, colonnes dérivées de
+            l'overlay comprises ; un chunk en échec annule alors la réécriture)
+        :param workers: Nombre de processus appliquant la transformation (0 : dans le processus courant ;
+            au-delà, modify_func doit être picklable, les processus étant démarrés en 'spawn').
+            L'ordre des chunks est conservé.
+        :raises RuntimeError: Si un chunk échoue lors de la réécriture du fichier source.
+        """
+        source_path = Path(self.csv_reader.filepath)
+        target_path = Path(output_path) if output_path is not None else source_path
+        in_place = target_path.resolve() == source_path.resolve()
+        num_chunks = self.csv_reader.num_chunks
+
+        owner = self.csv_reader.version if in_place else None
+        with VersionedFileWriter(target_path, self.csv_reader.encoding, owner=owner) as output:
+            written = False
+            for chunk_index, modified_chunk in enumerate(self._iter_modified_chunks(workers)):
+                if modified_chunk is None:
+                    if in_place:
+                        raise RuntimeError(f"Échec de la transformation du chunk {chunk_index}")
+                    self._notify_chunk(chunk_index, num_chunks, 0)
+                    continue
+                modified_chunk.to_csv(output.file, index=False, header=not written, sep=self.csv_reader.sep,
+                                      quoting=csv.QUOTE_ALL)
+                written = True
+                self._notify_chunk(chunk_index, num_chunks, len(modified_chunk))
+            if not written:
+                logger.warning(f"Aucun chunk transformé, {target_path} n'est pas écrit.")
+                output.abort()
+                return
+
+        if in_place:
+            # Les colonnes dérivées font désormais partie du fichier
+            if self.csv_reader.overlay is not None:
+                self.csv_reader.overlay.delete()
+            self.csv_reader.reload()
+
+    def _iter_modified_chunks(self, workers: int) -> Iterator[Optional[pd.DataFrame]]:
+        """
+        Transforme les chunks du fichier source dans l'ordre, éventuellement dans un pool de processus
+        (nombre de chunks en vol borné pour limiter la mémoire). Les processus sont démarrés en 'spawn' :
+        un fork hériterait des verrous et threads de l'application (jobs, clients Elasticsearch) dans leur état
+        du moment.
         """
-        if output_path is None:
-            output_path = Path(self.csv_reader.filepath)
-        else:
-            output_path = Path(output_path)
-        first_chunk = True
-
-        for chunk_index in range(self.csv_reader.num_chunks):
-            chunk = self.csv_reader.get_chunk(chunk_index=chunk_index)
-            modified_chunk = self._generate_modified_chunk(chunk)
-            if modified_chunk is None:
-                continue
-
-            if first_chunk:
-                modified_chunk.to_csv(
-                    output_path, mode="w", index=False, encoding=self.csv_reader.encoding, sep=self.csv_reader.sep,
-                    quoting=csv.QUOTE_ALL
-                )
-                first_chunk = False
-            else:
-                modified_chunk.to_csv(
-                    output_path, mode="a", index=False, header=False,
-                    encoding=self.csv_reader.encoding, sep=self.csv_reader.sep,
-                    quoting=csv.QUOTE_ALL
-                )
+        if workers <= 0:
+            for chunk in self.csv_reader.iter_chunks():
+                yield self._generate_modified_chunk(chunk)
+            return
+
+        pending: List[Tuple[pd.DataFrame, Optional[Future]]] = []
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            try:
+                for chunk in self.csv_reader.iter_chunks():
+                    future = None
+                    if self.source_column in chunk.columns:
+                        future = pool.submit(self.modify_func, chunk[self.source_column])
+                    pending.append((chunk, future))
+                    while len(pending) >= workers * 2:
+                        yield self._collect_modified_chunk(*pending.pop(0))
+                while pending:
+                    yield self._collect_modified_chunk(*pending.pop(0))
+            finally:
+                for _, future in pending:
+                    if future is not None:
+                        future.cancel()
+
+    def _collect_modified_chunk(self, chunk: pd.DataFrame, future: Optional[Future]) -> Optional[pd.DataFrame]:
+        if future is None:
+            logger.warning(f"Colonne '{self.source_column}' absente du chunk, chunk ignoré.")
+            return None
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Erreur de transformation sur chunk: {e}")
+            return None
+        return self._insert_columns(chunk, self._format_columns(result))
+
+    def _notify_chunk(self, chunk_index: int, num_chunks: int, rows: int) -> None:
+        if self.on_chunk is not None:
+            self.on_chunk(chunk_index, num_chunks, rows=rows, total_bytes=self.csv_reader.file_size)
 
 
 if __name__ == "__main__":
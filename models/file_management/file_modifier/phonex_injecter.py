@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 import pandas as pd
 
@@ -17,6 +17,8 @@ class PhonexCsvModifier:
     """
     Applique des algorithmes phonétiques sur une colonne d'un fichier CSV par chunk.
     Centralise la logique via PhoneticChunkEncoder.
+    Avec same_file, les colonnes phonétiques sont ajoutées à l'overlay du fichier (le fichier n'est pas réécrit) ;
+    sinon un fichier '<nom>_modified.csv' complet est produit.
     """
 
     def __init__(
@@ -26,14 +28,16 @@ class PhonexCsvModifier:
             source_column: str,
             phonex_dict: Dict[str, bool],
             config: Optional[Config] = None,
-            same_file: bool = True
+            same_file: bool = True,
+            on_chunk: Optional[Callable[..., None]] = None
     ):
         self._config = config or Config()
         self._source_column = source_column
         self._filepath = filepath
         self._separator = separator
-        self._phonex_dict = PhoneticDictValidator(phonex_dict).validate()
+        self._phonex_dict = PhoneticDictValidator(phonex_dict, self._config).validate()
         self._same_file = same_file
+        self._on_chunk = on_chunk
         self._chunk_encoder = PhoneticChunkEncoder(
             phonex_dict=self._phonex_dict,
             source_column=self._source_column,
@@ -62,6 +66,7 @@ class PhonexCsvModifier:
         if not self._apply_chunk_modifier(self._encode_chunk, output_columns):
             return False
 
+        logger.info(f"PhonexChunkModifier - Statistiques d'encodage : {self._chunk_encoder.stats}")
         return True
 
     def _is_valid_source(self) -> bool:
@@ -85,9 +90,13 @@ class PhonexCsvModifier:
                 csv_reader=self._csv_reader,
                 source_column=self._source_column,
                 modify_func=modify_func,
-                output_columns=output_columns
+                output_columns=output_columns,
+                on_chunk=self._on_chunk
             )
-            modifier.process_and_save(new_file_path)
+            if new_file_path is None:
+                modifier.process_to_overlay()
+            else:
+                modifier.process_and_save(new_file_path)
             return True
         except Exception as e:
             logger.error(f"PhonexChunkModifier - Erreur lors du traitement : {e}")
@@ -1,7 +1,13 @@
 import csv
+import os
+import shutil
+import tempfile
 import uuid
 from pathlib import Path
-from typing import Optional, List
+from typing import IO, Optional, List, Union
+
+# Taille du buffer d'écriture des fichiers réécrits
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
 
 
 class FileUtils:
@@ -125,6 +131,66 @@ class FileUtils:
         return Path(*parts).resolve()
 
 
+class AtomicFileWriter:
+    """
+    Écrit un fichier texte via un fichier temporaire voisin (écritures bufferisées) : commit() synchronise le
+    fichier sur disque puis le renomme atomiquement sur la cible, abort() le supprime. La cible n'est donc
+    jamais visible partiellement écrite.
+    S'utilise comme gestionnaire de contexte : commit en sortie normale, abort sur exception.
+    """
+
+    def __init__(self, path: Union[str, Path], encoding: str = "utf-8", buffering: int = WRITE_BUFFER_SIZE):
+        self._path = Path(path)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{self._path.name}.", suffix=".tmp", dir=self._path.parent)
+        self._tmp_path = Path(tmp_name)
+        self._file: IO[str] = os.fdopen(fd, "w", encoding=encoding, newline="", buffering=buffering)
+        self._done = False
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def file(self) -> IO[str]:
+        return self._file
+
+    def commit(self) -> None:
+        if self._done:
+            return
+        self._done = True
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            if self._path.exists():
+                shutil.copymode(self._path, self._tmp_path)
+            self._replace(self._tmp_path)
+        except BaseException:
+            self._file.close()
+            self._tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _replace(self, tmp_path: Path) -> None:
+        """Met le fichier temporaire complet à la place de la cible."""
+        os.replace(tmp_path, self._path)
+
+    def abort(self) -> None:
+        if self._done:
+            return
+        self._done = True
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "AtomicFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
 if __name__ == "__main__":
     fu_test = FileUtils()
     fp_test = "C:/dev/py/csv_importer/files/datas/curiexplore-pays.csv"
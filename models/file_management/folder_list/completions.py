@@ -2,21 +2,16 @@ from pathlib import Path
 from typing import Optional, List
 
 from config import Config
+from models.file_management.completion.catalog import get_completion_catalog
 
 
 class CompletionsFolderList:
-    def __init__(self, config: Optional[Config] = None):
-        config = config or Config()
-        self._filenames_list: List[str] = []
-        self._filepaths_list: List[Path] = []
-        self._folder = Path(config.files_folder) / "completions"
-        self._list_files()
+    """Liste des fichiers de complétion, lue dans le catalogue en mémoire du dossier."""
 
-    def _list_files(self):
-        for file in self._folder.iterdir():
-            if file.is_file():
-                self._filenames_list.append(file.name)
-                self._filepaths_list.append(file)
+    def __init__(self, config: Optional[Config] = None):
+        self._catalog = get_completion_catalog(config)
+        self._folder = self._catalog.folder
+        self._filenames_list: List[str] = self._catalog.filenames()
 
     @property
     def filenames_list(self) -> List[str]:
@@ -26,9 +21,9 @@ class CompletionsFolderList:
     @property
     def filepaths_list(self) -> List[Path]:
         """List of all file paths in the folder."""
-        return self._filepaths_list
+        return [self._folder / filename for filename in self._filenames_list]
 
     @property
     def folder_path(self) -> Path:
         """Path to the folder."""
-        return self._folder
\ No newline at end of file
+        return self._folder
@@ -0,0 +1,291 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, List, Optional, Union
+
+import pandas as pd
+
+from config import Config
+from models.file_management.versions import get_file_versions
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST = "manifest.json"
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_hash(filepath: Union[str, Path]) -> str:
+    """Empreinte SHA-256 du contenu d'un fichier, lu par blocs."""
+    digest = hashlib.sha256()
+    with Path(filepath).open("rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ColumnOverlay:
+    """
+    Colonnes dérivées d'un fichier CSV (phonétique, complétion...) stockées à part, un fichier CSV par colonne,
+    alignées ligne à ligne sur le fichier de base. Le fichier de base n'est jamais réécrit : ajouter une colonne
+    ne coûte que l'écriture de cette colonne. CsvFileReader joint les colonnes à la lecture.
+
+    Les colonnes sont rattachées à l'empreinte du contenu du fichier de base : si celui-ci change, elles sont
+    ignorées. L'empreinte n'est recalculée que si la taille ou la date de modification du fichier changent.
+    Les fichiers de colonnes ne sont jamais modifiés : une colonne remplacée ou supprimée n'est effacée qu'une fois
+    partis les lecteurs du fichier qui peuvent encore la lire (cf. FileVersions.discard).
+    """
+
+    def __init__(self, base_filepath: Union[str, Path], config: Optional[Config] = None):
+        """
+        :param base_filepath: Fichier CSV de base
+        :param config: Configuration (dossier des overlays)
+        """
+        config = config or Config()
+        self._base_filepath = Path(base_filepath).resolve()
+        key = hashlib.sha1(str(self._base_filepath).encode()).hexdigest()
+        self._folder = Path(config.overlay_folder) / key
+        self._versions = get_file_versions(config)
+        self._manifest: Optional[Dict[str, Any]] = None
+
+    @property
+    def base_filepath(self) -> Path:
+        return self._base_filepath
+
+    @property
+    def folder(self) -> Path:
+        return self._folder
+
+    @property
+    def columns(self) -> List[Dict[str, str]]:
+        """Colonnes valides pour le contenu actuel du fichier de base : {'name', 'file', 'after'}."""
+        if self._manifest is None:
+            self._manifest = self._load_manifest()
+        return self._manifest["columns"]
+
+    def refresh(self) -> List[Dict[str, str]]:
+        """Relit le manifeste : les colonnes restent ensuite figées jusqu'au prochain appel."""
+        self._manifest = self._load_manifest()
+        return self._manifest["columns"]
+
+    @property
+    def column_names(self) -> List[str]:
+        return [column["name"] for column in self.columns]
+
+    def merge_headers(self, base_headers: List[str]) -> List[str]:
+        """
+        Insère les colonnes dérivées dans les entêtes du fichier de base, chacune après sa colonne d'ancrage
+        (la colonne source, ou la colonne dérivée précédente du même ajout). Une colonne dérivée portant le nom
+        d'une colonne de base est ignorée.
+        """
+        headers = list(base_headers)
+        for column in self.columns:
+            if column["name"] in headers:
+                continue
+            after = column.get("after")
+            index = headers.index(after) + 1 if after in headers else len(headers)
+            headers.insert(index, column["name"])
+        return headers
+
+    def join(self, base: pd.DataFrame, start: int = 0) -> pd.DataFrame:
+        """
+        Ajoute à des lignes du fichier de base les colonnes dérivées correspondantes.
+
+        :param base: Lignes lues dans le fichier de base
+        :param start: Index de la première ligne (hors entête)
+        """
+        if not self.columns or base.empty:
+            return base
+        return self._assemble(base, self.read(start, len(base)))
+
+    def read(self, start: int, nrows: int) -> pd.DataFrame:
+        """Lit une portion des colonnes dérivées."""
+        skiprows = range(1, start + 1) if start > 0 else None
+        return pd.DataFrame({
+            column["name"]: self._read_column(column, skiprows=skiprows, nrows=nrows).to_numpy()
+            for column in self.columns
+        })
+
+    def iter_join(self, base_chunks: Iterator[pd.DataFrame], chunk_size: int,
+                  keep_default_na: bool = True) -> Iterator[pd.DataFrame]:
+        """
+        Joint les colonnes dérivées à un flux de chunks du fichier de base, en lisant chaque fichier de colonne
+        une seule fois, au même rythme que le fichier de base.
+
+        :param keep_default_na: Même option de lecture que les chunks du fichier de base
+        """
+        if not self.columns:
+            yield from base_chunks
+            return
+        readers = {column["name"]: self._read_column(column, chunksize=chunk_size, keep_default_na=keep_default_na)
+                   for column in self.columns}
+        for base in base_chunks:
+            values = pd.DataFrame({name: next(reader).to_numpy() for name, reader in readers.items()})
+            yield self._assemble(base, values)
+
+    def writer(self, columns: List[str], after: str) -> "OverlayWriter":
+        """
+        Prépare l'écriture de nouvelles colonnes, insérées après la colonne `after`.
+        Les colonnes existantes de même nom sont remplacées à la validation.
+        """
+        return OverlayWriter(self, columns, after)
+
+    def delete(self) -> None:
+        """Supprime toutes les colonnes dérivées du fichier."""
+        if self._folder.is_dir():
+            (self._folder / _MANIFEST).unlink(missing_ok=True)
+            for path in self._folder.glob("*.tmp"):
+                path.unlink(missing_ok=True)
+            self._versions.discard(self._base_filepath, list(self._folder.glob("*.csv")))
+            try:
+                self._folder.rmdir()
+            except OSError:
+                # Colonnes encore lues : le dossier reste jusqu'à leur suppression
+                pass
+        self._manifest = None
+
+    def _assemble(self, base: pd.DataFrame, values: pd.DataFrame) -> pd.DataFrame:
+        if len(values) != len(base):
+            raise ValueError(f"ColumnOverlay - {len(values)} valeurs dérivées pour {len(base)} lignes "
+                             f"({self._base_filepath})")
+        df = base.reset_index(drop=True)
+        new_columns = {name: values[name].to_numpy() for name in values.columns if name not in df.columns}
+        df = pd.concat([df, pd.DataFrame(new_columns)], axis=1)
+        return df[self.merge_headers(list(base.columns))]
+
+    def _read_column(self, column: Dict[str, str], **kwargs) -> Any:
+        reader = pd.read_csv(self._folder / column["file"], dtype=str, **kwargs)
+        if kwargs.get("chunksize"):
+            return (chunk[column["name"]] for chunk in reader)
+        return reader[column["name"]]
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        manifest = self._read_manifest()
+        if not manifest["columns"]:
+            return manifest
+        if not self._refresh_base_stat(manifest):
+            logger.warning(f"ColumnOverlay - Fichier de base modifié, colonnes dérivées ignorées : "
+                           f"{self._base_filepath}")
+            return {"columns": []}
+        return manifest
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        path = self._folder / _MANIFEST
+        if not path.is_file():
+            return {"columns": []}
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.error(f"ColumnOverlay - Manifeste illisible {path} : {e}")
+            return {"columns": []}
+
+    def _refresh_base_stat(self, manifest: Dict[str, Any]) -> bool:
+        """
+        Vérifie que le fichier de base correspond à l'empreinte du manifeste.
+        Si seule la date de modification a changé (contenu identique), le manifeste est mis à jour.
+        """
+        stat = self._base_filepath.stat()
+        if manifest.get("base_size") == stat.st_size and manifest.get("base_mtime_ns") == stat.st_mtime_ns:
+            return True
+        if manifest.get("base_size") != stat.st_size or manifest.get("base_hash") != file_hash(self._base_filepath):
+            return False
+        manifest["base_mtime_ns"] = stat.st_mtime_ns
+        self._write_manifest(manifest)
+        return True
+
+    def _commit(self, columns: List[Dict[str, str]], rows: int) -> None:
+        """Enregistre des colonnes écrites par un OverlayWriter (appelé une fois les fichiers en place)."""
+        manifest = self._read_manifest()
+        if manifest["columns"] and not self._refresh_base_stat(manifest):
+            self._remove_files(manifest["columns"])
+            manifest["columns"] = []
+        names = {column["name"] for column in columns}
+        replaced = [column for column in manifest["columns"] if column["name"] in names]
+        kept = [column for column in manifest["columns"] if column["name"] not in names]
+        stat = self._base_filepath.stat()
+        if not (manifest["columns"] and manifest.get("base_mtime_ns") == stat.st_mtime_ns):
+            manifest["base_hash"] = file_hash(self._base_filepath)
+        manifest.update({
+            "base": str(self._base_filepath),
+            "base_size": stat.st_size,
+            "base_mtime_ns": stat.st_mtime_ns,
+            "rows": rows,
+            "columns": kept + columns,
+        })
+        self._write_manifest(manifest)
+        self._remove_files(replaced)
+        self._manifest = None
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        self._folder.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=_MANIFEST + ".", suffix=".tmp", dir=self._folder)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self._folder / _MANIFEST)
+
+    def _remove_files(self, columns: List[Dict[str, str]]) -> None:
+        self._versions.discard(self._base_filepath, [self._folder / column["file"] for column in columns])
+
+
+class OverlayWriter:
+    """
+    Écrit de nouvelles colonnes dérivées chunk par chunk, dans des fichiers temporaires.
+    Les colonnes ne sont visibles qu'après commit() ; en cas d'erreur (ou abort()), rien n'est conservé.
+    S'utilise comme gestionnaire de contexte : commit en sortie normale, abort sur exception.
+    """
+
+    def __init__(self, overlay: ColumnOverlay, columns: List[str], after: str):
+        self._overlay = overlay
+        self._columns = list(columns)
+        self._after = after
+        self._rows = 0
+        overlay.folder.mkdir(parents=True, exist_ok=True)
+        self._files: Dict[str, str] = {name: f"{uuid.uuid4().hex}.csv" for name in self._columns}
+        self._handles: Dict[str, IO[str]] = {}
+        for name, filename in self._files.items():
+            handle = (overlay.folder / f"{filename}.tmp").open("w", encoding="utf-8", newline="")
+            self._handles[name] = handle
+            pd.DataFrame(columns=[name]).to_csv(handle, index=False, lineterminator="\n")
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    def append(self, values: pd.DataFrame) -> None:
+        """Ajoute les valeurs d'un chunk (une colonne par colonne déclarée)."""
+        for name, handle in self._handles.items():
+            values[[name]].to_csv(handle, index=False, header=False, lineterminator="\n")
+        self._rows += len(values)
+
+    def commit(self) -> None:
+        self._close()
+        for filename in self._files.values():
+            os.replace(self._overlay.folder / f"{filename}.tmp", self._overlay.folder / filename)
+        anchors = [self._after] + self._columns[:-1]
+        self._overlay._commit(
+            [{"name": name, "file": self._files[name], "after": anchor} for name, anchor in zip(self._columns, anchors)],
+            self._rows,
+        )
+        logger.info(f"ColumnOverlay - Colonnes {self._columns} ajoutées ({self._rows} lignes) à "
+                    f"{self._overlay.base_filepath}")
+
+    def abort(self) -> None:
+        self._close()
+        for filename in self._files.values():
+            (self._overlay.folder / f"{filename}.tmp").unlink(missing_ok=True)
+
+    def _close(self) -> None:
+        for handle in self._handles.values():
+            handle.close()
+
+    def __enter__(self) -> "OverlayWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
@@ -22,6 +22,11 @@ class BaseFileReader(ABC):
         if not self.validate_structure():
             raise ValueError(f"Le fichier '{self.filepath}' n'a pas une structure valide.")
 
+    @property
+    def file_size(self) -> int:
+        """Taille du fichier en octets."""
+        return self.filepath.stat().st_size
+
     @staticmethod
     def _normalize_encoding(encoding: str) -> str:
         """Transforme 'utf-8' en 'utf-8-sig' pour gérer les fichiers avec BOM."""
@@ -1,16 +1,25 @@
 import math
-from typing import List, Optional, Tuple
+import weakref
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 
 from config import Config
+from models.file_management.overlay import ColumnOverlay
 from models.file_management.readers.base_file_reader import BaseFileReader
 from models.file_management.file_utls import FileUtils
+from models.file_management.versions import FileVersion, get_file_versions
 
 
 class CsvFileReader(BaseFileReader):
     """
     Gère la lecture, la validation et l'extraction des données d'un fichier CSV.
+    Les colonnes dérivées stockées dans l'overlay du fichier (ColumnOverlay) sont jointes à la lecture :
+    entêtes, chunks et lecture complète les incluent comme si elles faisaient partie du fichier.
+    Le lecteur est rattaché à la version du fichier existant à sa création (cf. FileVersions) : une réécriture
+    concurrente du fichier ne modifie pas ce qu'il lit. Le rattachement prend fin avec close() ou la disparition
+    du lecteur.
     """
 
     def __init__(
@@ -21,8 +30,12 @@ class CsvFileReader(BaseFileReader):
             encoding: str = "utf-8",
             chunk_size: Optional[int] = None,
             num_chunks: Optional[int] = None,
-            config: Optional[Config] = None
+            config: Optional[Config] = None,
+            use_overlay: bool = True
     ):
+        """
+        :param use_overlay: Joint les colonnes dérivées de l'overlay du fichier (False : fichier de base seul)
+        """
         config = config or Config()
         self._headers: Optional[List[str]] = headers
         self._sep = sep
@@ -31,12 +44,31 @@ class CsvFileReader(BaseFileReader):
         self._chunk_size = chunk_size or config.chunksize
         self._num_chunks = num_chunks
         super().__init__(filepath, encoding)
+        self._versions = get_file_versions(config)
+        self._overlay = ColumnOverlay(self.filepath, config) if use_overlay else None
+        self._pin()
+
+    def _pin(self) -> None:
+        self._version = self._versions.pin(self.filepath)
+        self._release = weakref.finalize(self, self._versions.release, self._version)
+        if self._overlay is not None:
+            # Colonnes dérivées figées avec la version
+            self._overlay.refresh()
+
+    @property
+    def version(self) -> FileVersion:
+        """Version du fichier lue par ce lecteur."""
+        return self._version
+
+    def close(self) -> None:
+        """Détache le lecteur de sa version (les copies figées devenues inutiles sont supprimées)."""
+        self._release()
 
     @property
     def nrows(self) -> int:
         """Nombre de lignes du fichier."""
         if self._nrows is None:
-            self._nrows = self._count_lines()
+            self._nrows = self._version.cached(("nrows", self.encoding), self._count_lines)
         return self._nrows
 
     @property
@@ -68,35 +100,57 @@ class CsvFileReader(BaseFileReader):
         return self._sep
 
     @property
-    def headers(self) -> List[str]:
-        """Liste des entêtes du fichier CSV."""
+    def overlay(self) -> Optional[ColumnOverlay]:
+        """Colonnes dérivées du fichier (None si l'overlay n'est pas utilisé)."""
+        return self._overlay
+
+    @property
+    def base_headers(self) -> List[str]:
+        """Entêtes du fichier CSV de base, sans les colonnes dérivées."""
         if self._headers is None:
-            self._headers = self._load_headers()
+            self._headers = list(self._version.cached(("headers", self.sep, self.encoding), self._load_headers))
         return self._headers
 
+    @property
+    def headers(self) -> List[str]:
+        """Liste des entêtes du fichier CSV, colonnes dérivées comprises."""
+        if self._overlay is None:
+            return self.base_headers
+        return self._overlay.merge_headers(self.base_headers)
+
     @headers.setter
     def headers(self, value: List[str]):
         if isinstance(value, list):
             self._headers = value
 
+    def reload(self) -> None:
+        """Rattache le lecteur à la version courante du fichier, après une réécriture."""
+        self._release()
+        self._pin()
+        self._headers = None
+        self._nrows = None
+        self._num_chunks = None
+
     def _load_headers(self) -> List[str]:
-        df = pd.read_csv(self.filepath, sep=self.sep, encoding=self.encoding, nrows=0, dtype=str)
+        with self._version.open() as f:
+            df = pd.read_csv(f, sep=self.sep, encoding=self.encoding, nrows=0, dtype=str)
 
         return list(df.columns)
 
     def _count_lines(self) -> int:
-        with self.filepath.open(encoding=self.encoding) as f:
+        with self._version.open("r", self.encoding) as f:
             return sum(1 for _ in f)
 
     def _read_csv(self, skiprows=None, nrows: Optional[int] = None) -> pd.DataFrame:
-        return pd.read_csv(
-            self.filepath,
-            sep=self.sep,
-            encoding=self.encoding,
-            dtype=str,
-            skiprows=skiprows,
-            nrows=nrows
-        )
+        with self._version.open() as f:
+            return pd.read_csv(
+                f,
+                sep=self.sep,
+                encoding=self.encoding,
+                dtype=str,
+                skiprows=skiprows,
+                nrows=nrows
+            )
 
     def get_chunk(self, chunk_size: Optional[int] = None, chunk_index: int = 0,
                   max_cols: Optional[int] = None) -> pd.DataFrame:
@@ -120,7 +174,7 @@ class CsvFileReader(BaseFileReader):
         """
         if self.sep is None:
             self._sep = FileUtils.detect_separator(str(self.filepath), encoding=self.encoding)
-        df = self._read_csv()
+        df = self._join_overlay(self._read_csv())
         return df.iloc[:, :max_cols] if max_cols else df
 
     def read_partial(self, start: int, size: int, **kwargs) -> pd.DataFrame:
@@ -139,7 +193,69 @@ class CsvFileReader(BaseFileReader):
         nrows = min(size, self.nrows - start)
 
         df = self._read_csv(skiprows=skiprows, nrows=nrows)
-        return df
+        return self._join_overlay(df, start)
+
+    def iter_chunks(self, chunk_size: Optional[int] = None, keep_default_na: bool = True) -> Iterator[pd.DataFrame]:
+        """
+        Parcourt le fichier chunk par chunk en un seul passage (fichier de base et colonnes dérivées
+        lus au même rythme).
+
+        :param keep_default_na: False pour lire les valeurs telles quelles ('NA' reste 'NA', cellule vide : '')
+        """
+        size = chunk_size or self.chunk_size
+        with self._version.open() as f:
+            chunks = pd.read_csv(f, sep=self.sep, encoding=self.encoding, dtype=str, chunksize=size,
+                                 keep_default_na=keep_default_na)
+            if self._overlay is None:
+                yield from chunks
+            else:
+                yield from self._overlay.iter_join(chunks, size, keep_default_na=keep_default_na)
+
+    def iter_column(self, column_name: str, chunk_size: Optional[int] = None) -> Iterator[pd.Series]:
+        """
+        Parcourt les valeurs d'une colonne chunk par chunk, en un seul passage (cf. iter_columns).
+        """
+        for chunk in self.iter_columns([column_name], chunk_size):
+            yield chunk[column_name]
+
+    def iter_columns(self, column_names: List[str], chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Parcourt quelques colonnes chunk par chunk, en un seul passage. Les valeurs sont lues telles quelles
+        ('NA' reste 'NA', cellule vide : ''), colonnes dérivées comprises ; si toutes sont des colonnes du fichier
+        de base, seules ces colonnes sont analysées.
+        """
+        size = chunk_size or self.chunk_size
+        column_names = list(dict.fromkeys(column_names))
+        if not set(column_names) <= set(self.base_headers):
+            for chunk in self.iter_chunks(size, keep_default_na=False):
+                yield chunk[column_names]
+            return
+        with self._version.open() as f:
+            chunks = pd.read_csv(f, sep=self.sep, encoding=self.encoding, dtype=str, usecols=column_names,
+                                 keep_default_na=False, chunksize=size)
+            for chunk in chunks:
+                yield chunk[column_names]
+
+    def export(self, output_path: Union[str, Path], sep: Optional[str] = None, **to_csv_kwargs) -> Path:
+        """
+        Matérialise le fichier fusionné (fichier de base et colonnes dérivées) dans un nouveau CSV.
+
+        :param output_path: Fichier de sortie
+        :param sep: Séparateur de sortie (par défaut celui du fichier)
+        :param to_csv_kwargs: Options supplémentaires de DataFrame.to_csv (quoting...)
+        """
+        output_path = Path(output_path)
+        sep = sep or self.sep
+        with output_path.open("w", encoding=self.encoding, newline="") as f:
+            pd.DataFrame(columns=self.headers).to_csv(f, index=False, sep=sep, lineterminator="\n", **to_csv_kwargs)
+            for chunk in self.iter_chunks():
+                chunk.to_csv(f, index=False, header=False, sep=sep, lineterminator="\n", **to_csv_kwargs)
+        return output_path
+
+    def _join_overlay(self, df: pd.DataFrame, start: int = 0) -> pd.DataFrame:
+        if self._overlay is None:
+            return df
+        return self._overlay.join(df, start)
 
     def validate_structure(self) -> bool:
         """
@@ -0,0 +1,265 @@
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from config import Config
+from models.file_management.file_utls import WRITE_BUFFER_SIZE, AtomicFileWriter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class FileVersion:
+    """
+    Version d'un fichier de données (fichier@vN) à laquelle des lecteurs sont rattachés.
+    Tant qu'un lecteur la référence, son contenu reste lisible : si le fichier est remplacé ou supprimé via le
+    registre, la version lit une copie figée de l'ancien contenu.
+    Les métadonnées coûteuses (nombre de lignes, entêtes...) sont mémorisées par version : une nouvelle version
+    part d'un cache vide, sans toucher à celui des autres fichiers.
+    """
+
+    def __init__(self, registry: "FileVersions", path: Path, number: int, stat: os.stat_result):
+        self._registry = registry
+        self._path = path
+        self._number = number
+        self._size = stat.st_size
+        self._mtime_ns = stat.st_mtime_ns
+        self._data_path = path
+        self._pins = 0
+        self._superseded = False
+        self._cache: Dict[Tuple[Any, ...], Any] = {}
+        self._cache_lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Chemin du fichier de données."""
+        return self._path
+
+    @property
+    def number(self) -> int:
+        return self._number
+
+    @property
+    def label(self) -> str:
+        return f"{self._path.name}@v{self._number}"
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def data_path(self) -> Path:
+        """Fichier contenant cette version : le fichier lui-même, ou sa copie figée une fois remplacé."""
+        return self._data_path
+
+    @property
+    def superseded(self) -> bool:
+        """Vrai si une version plus récente du fichier a été publiée."""
+        return self._superseded
+
+    def is_current(self, stat: os.stat_result) -> bool:
+        return (stat.st_size, stat.st_mtime_ns) == (self._size, self._mtime_ns)
+
+    def open(self, mode: str = "rb", encoding: Optional[str] = None) -> IO:
+        """
+        Ouvre le contenu de la version. Le descripteur ouvert reste sur ce contenu même si le fichier
+        est remplacé pendant la lecture.
+        """
+        return self._registry.open(self, mode, encoding)
+
+    def cached(self, key: Tuple[Any, ...], compute: Callable[[], T]) -> T:
+        """Valeur mémorisée pour cette version, calculée au premier appel."""
+        with self._cache_lock:
+            value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            with self._cache_lock:
+                value = self._cache.setdefault(key, value)
+        return value
+
+
+class FileVersions:
+    """
+    Registre des versions des fichiers de données du processus (les jobs s'exécutent dans le processus
+    de l'application : lecteurs et rédacteurs passent par ce registre).
+
+    Copie sur écriture : un rédacteur écrit le nouveau contenu à part puis le publie (publish), ce qui remplace
+    atomiquement le fichier et crée la version suivante. Les lecteurs rattachés à l'ancienne version (pin)
+    continuent de la lire : elle est conservée sous forme de lien physique (copie si le lien est impossible)
+    dans le dossier des versions, supprimé au départ du dernier lecteur. Sans lecteur, rien n'est copié.
+    Une modification faite hors du registre est détectée (taille, date) et crée une nouvelle version, sans
+    protection des lecteurs en cours.
+    """
+
+    def __init__(self, folder: Union[str, Path]):
+        """
+        :param folder: Dossier des copies figées des versions remplacées
+        """
+        self._folder = Path(folder)
+        self._lock = threading.Lock()
+        self._current: Dict[Path, FileVersion] = {}
+        self._numbers: Dict[Path, int] = {}
+        # Lecteurs rattachés à chaque fichier, toutes versions confondues
+        self._pins: Dict[Path, int] = {}
+        # Fichiers annexes à supprimer au départ du dernier lecteur du fichier
+        self._discarded: Dict[Path, List[Path]] = {}
+
+    @property
+    def folder(self) -> Path:
+        return self._folder
+
+    def current(self, path: Union[str, Path]) -> FileVersion:
+        """Version courante d'un fichier (sans rattachement)."""
+        path = Path(path).resolve()
+        with self._lock:
+            return self._current_version(path)
+
+    def pin(self, path: Union[str, Path]) -> FileVersion:
+        """
+        Rattache un lecteur à la version courante d'un fichier ; release() doit être appelé à la fin de la lecture.
+
+        :raises FileNotFoundError: Si le fichier n'existe pas.
+        """
+        path = Path(path).resolve()
+        with self._lock:
+            version = self._current_version(path)
+            version._pins += 1
+            self._pins[path] = self._pins.get(path, 0) + 1
+            return version
+
+    def release(self, version: FileVersion) -> None:
+        """Détache un lecteur ; les fichiers qui ne sont plus lisibles par personne sont supprimés."""
+        removed: List[Path] = []
+        with self._lock:
+            version._pins -= 1
+            if version._pins == 0 and version._data_path != version._path:
+                removed.append(version._data_path)
+            remaining = self._pins.get(version._path, 1) - 1
+            if remaining > 0:
+                self._pins[version._path] = remaining
+            else:
+                self._pins.pop(version._path, None)
+                removed += self._discarded.pop(version._path, [])
+        for path in removed:
+            path.unlink(missing_ok=True)
+
+    def open(self, version: FileVersion, mode: str = "rb", encoding: Optional[str] = None) -> IO:
+        # Sous verrou : une publication ne peut pas s'intercaler entre le choix du fichier et son ouverture
+        with self._lock:
+            return open(version._data_path, mode, encoding=encoding)
+
+    def publish(self, path: Union[str, Path], new_path: Optional[Union[str, Path]] = None,
+                owner: Optional[FileVersion] = None) -> Optional[FileVersion]:
+        """
+        Remplace atomiquement un fichier par un nouveau contenu (ou le supprime) et crée sa version suivante.
+
+        :param path: Fichier de données
+        :param new_path: Fichier complet à mettre en place (même système de fichiers) ; None supprime le fichier
+        :param owner: Version lue par le rédacteur lui-même : son rattachement ne justifie pas de copie figée
+        :return: La nouvelle version (None après une suppression)
+        """
+        path = Path(path).resolve()
+        with self._lock:
+            previous = self._current.get(path)
+            if previous is not None:
+                readers = previous._pins - (1 if owner is previous else 0)
+                if readers > 0 and path.is_file() and previous.is_current(path.stat()):
+                    previous._data_path = self._snapshot(previous)
+                previous._superseded = True
+            if new_path is None:
+                path.unlink(missing_ok=True)
+                self._current.pop(path, None)
+                return None
+            os.replace(new_path, path)
+            version = self._new_version(path, path.stat())
+        logger.info(f"FileVersions - {version.label} publiée")
+        return version
+
+    def discard(self, path: Union[str, Path], files: Iterable[Path]) -> None:
+        """
+        Supprime des fichiers annexes d'un fichier de données (colonnes d'overlay remplacées...) ;
+        la suppression est différée tant que des lecteurs du fichier peuvent encore les lire.
+        """
+        path = Path(path).resolve()
+        files = list(files)
+        with self._lock:
+            if self._pins.get(path):
+                self._discarded.setdefault(path, []).extend(files)
+                return
+        for file in files:
+            file.unlink(missing_ok=True)
+
+    def _current_version(self, path: Path) -> FileVersion:
+        stat = path.stat()
+        version = self._current.get(path)
+        if version is None or not version.is_current(stat):
+            if version is not None:
+                version._superseded = True
+                logger.warning(f"FileVersions - {version.label} modifié hors registre")
+            version = self._new_version(path, stat)
+        return version
+
+    def _new_version(self, path: Path, stat: os.stat_result) -> FileVersion:
+        number = self._numbers.get(path, 0) + 1
+        self._numbers[path] = number
+        version = self._current[path] = FileVersion(self, path, number, stat)
+        return version
+
+    def _snapshot(self, version: FileVersion) -> Path:
+        self._folder.mkdir(parents=True, exist_ok=True)
+        key = hashlib.sha1(str(version.path).encode()).hexdigest()[:16]
+        snapshot = self._folder / f"{key}@v{version.number}_{version.path.name}"
+        snapshot.unlink(missing_ok=True)
+        try:
+            os.link(version.path, snapshot)
+        except OSError:
+            shutil.copy2(version.path, snapshot)
+        logger.info(f"FileVersions - {version.label} conservée pour {version._pins} lecteur(s) : {snapshot}")
+        return snapshot
+
+
+class VersionedFileWriter(AtomicFileWriter):
+    """
+    AtomicFileWriter dont la validation publie le fichier comme nouvelle version (cf. FileVersions.publish) :
+    les lecteurs de la version remplacée ne voient pas le changement.
+    """
+
+    def __init__(self, path: Union[str, Path], encoding: str = "utf-8", owner: Optional[FileVersion] = None,
+                 config: Optional[Config] = None, buffering: int = WRITE_BUFFER_SIZE):
+        """
+        :param owner: Version du fichier lue par le rédacteur (cf. FileVersions.publish)
+        """
+        super().__init__(path, encoding, buffering)
+        self._versions = get_file_versions(config)
+        self._owner = owner
+        self._version: Optional[FileVersion] = None
+
+    @property
+    def version(self) -> Optional[FileVersion]:
+        """Version publiée (après commit)."""
+        return self._version
+
+    def _replace(self, tmp_path: Path) -> None:
+        self._version = self._versions.publish(self.path, tmp_path, owner=self._owner)
+
+
+_registries: Dict[Path, FileVersions] = {}
+_registries_lock = threading.Lock()
+
+
+def get_file_versions(config: Optional[Config] = None) -> FileVersions:
+    """Registre des versions partagé par le processus."""
+    config = config or Config()
+    folder = Path(config.versions_folder).resolve()
+    with _registries_lock:
+        registry = _registries.get(folder)
+        if registry is None:
+            registry = _registries[folder] = FileVersions(folder)
+        return registry
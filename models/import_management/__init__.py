@@ -0,0 +1,3 @@
+from models.import_management.doc_ids import DocumentIdBuilder
+from models.import_management.data_import import EsDataImport
+from models.import_management.pipeline import ImportPipeline
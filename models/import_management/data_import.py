@@ -0,0 +1,334 @@
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from elastic_manager import ElasticManager
+from models.file_management.completion.lookup import get_replacement_table
+from models.file_management.completion.synonyms import get_synonym_expander
+from models.file_management.readers.csv_file_reader import CsvFileReader
+from models.import_management.delta import ImportHashState, hash_rows
+from models.import_management.doc_ids import KEY_DTYPE, DocumentIdBuilder
+from utils import get_dict_from_json
+
+logger = logging.getLogger(__name__)
+
+# Catégories de champs complétés à partir d'un fichier de complétion
+COMPLETION_CATEGORIES = ("remplacement", "phonetic")
+
+
+def _as_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in {"true", "1", "yes", "on", "oui"}
+    return bool(value)
+
+
+def build_documents(fields: Dict[str, Dict[str, Any]], chunk: pd.DataFrame) -> pd.DataFrame:
+    """
+    Construit les documents d'un chunk selon les champs du mapping :
+    les champs source sont renommés, les champs à valeur fixe sont ajoutés, les champs de complétion
+    (dont le fichier a été résolu dans 'completion_filepath') reçoivent la liste des valeurs de complétion
+    de leur champ d'origine, par jointure sur la table du fichier ; pour les synonymes, chaque terme présent
+    dans la valeur est développé (automate d'Aho-Corasick).
+    Fonction de module afin de pouvoir être exécutée dans un pool de processus.
+    """
+    columns: Dict[str, Any] = {}
+    for target, field in fields.items():
+        if not isinstance(field, dict) or field.get("mapped") is False:
+            continue
+        if field.get("category") == "fixed_value" or field.get("fixed_value"):
+            columns[target] = field.get("value")
+            continue
+        if field.get("completion_filepath"):
+            original_field = field.get("original_field")
+            if original_field not in chunk.columns:
+                logger.warning(f"EsDataImport - Colonne d'origine '{original_field}' absente, champ '{target}' ignoré")
+                continue
+            values = chunk[original_field].to_numpy()
+            keep_original = _as_bool(field.get("keep_original"))
+            if field.get("type_completion") == "synonymes":
+                columns[target] = get_synonym_expander(field["completion_filepath"]).expand_many(values, keep_original)
+            else:
+                table = get_replacement_table(field["completion_filepath"], _as_bool(field.get("use_first_column")))
+                columns[target] = table.complete(values, keep_original)
+            continue
+        source_field = field.get("source_field") or target
+        if source_field in chunk.columns:
+            columns[target] = chunk[source_field].to_numpy()
+        else:
+            logger.warning(f"EsDataImport - Colonne source '{source_field}' absente, champ '{target}' ignoré")
+    documents = pd.DataFrame(columns, index=range(len(chunk)))
+    return documents.replace({np.nan: None})
+
+
+def transform_chunk(fields: Dict[str, Dict[str, Any]], id_columns: Optional[List[str]],
+                    chunk: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[np.ndarray]]:
+    """
+    Transforme un chunk brut en (documents, hash des clés).
+    """
+    documents = build_documents(fields, chunk)
+    key_hashes = DocumentIdBuilder(id_columns).hash_keys(chunk) if id_columns else None
+    return documents, key_hashes
+
+
+class EsDataImport:
+    """
+    Import d'un fichier de données CSV dans un index Elasticsearch, chunk par chunk.
+    Les documents sont construits à partir des champs du mapping (champs source et valeurs fixes).
+    Si des colonnes clés sont fournies, les _id sont dérivés de ces colonnes : un ré-import
+    écrase les documents existants au lieu de les dupliquer.
+    En mode incrémental, seules les lignes nouvelles ou modifiées depuis le dernier import sont envoyées
+    et les clés disparues sont supprimées de l'index.
+    """
+
+    OP_TYPES = ("index", "create", "update")
+
+    def __init__(
+            self,
+            index_name: str,
+            datas_filepath: Union[str, Path],
+            mapping: Dict[str, Any],
+            separator: Optional[str] = None,
+            id_columns: Optional[Sequence[str]] = None,
+            op_type: str = "index",
+            config: Optional[Config] = None,
+            on_chunk: Optional[Callable[..., None]] = None,
+            incremental: bool = False,
+            state_name: Optional[str] = None
+    ):
+        """
+        :param index_name: Index cible
+        :param datas_filepath: Chemin du fichier de données
+        :param mapping: Contenu du fichier de mapping (clé 'mapping' : champ cible -> définition)
+        :param separator: Séparateur du CSV (détecté si absent)
+        :param id_columns: Colonnes source servant à calculer les _id déterministes
+        :param op_type: 'index', 'create' ou 'update' (doc_as_upsert)
+        :param on_chunk: Callback de progression appelé après chaque chunk envoyé
+        :param incremental: N'envoie que le delta par rapport au dernier import (nécessite id_columns)
+        :param state_name: Nom de l'état des empreintes (par défaut le nom de l'index)
+        """
+        if op_type not in self.OP_TYPES:
+            raise ValueError(f"op_type invalide : {op_type}")
+        if op_type == "update" and not id_columns:
+            raise ValueError("op_type 'update' nécessite des colonnes clés (id_columns).")
+        if incremental and (not id_columns or op_type == "create"):
+            raise ValueError("Le mode incrémental nécessite des colonnes clés et un op_type 'index' ou 'update'.")
+        self._config = config or Config()
+        self._index_name = index_name
+        self._datas_filepath = Path(datas_filepath)
+        self._fields: Dict[str, Dict[str, Any]] = self._resolve_completions((mapping or {}).get("mapping", {}))
+        self._separator = separator
+        self._id_builder = DocumentIdBuilder(id_columns) if id_columns else None
+        self._op_type = op_type
+        self._on_chunk = on_chunk
+        self._incremental = incremental
+        self._state_name = state_name or index_name
+        self._elastic_manager: Optional[ElasticManager] = None
+
+    @classmethod
+    def from_importer_file(cls, importer_filename: str, config: Optional[Config] = None,
+                           on_chunk: Optional[Callable[..., None]] = None,
+                           incremental: bool = False) -> "EsDataImport":
+        """
+        Construit l'import à partir d'un fichier d'importer (dossier importers) et des fichiers
+        de données et de mapping qu'il référence.
+        """
+        config = config or Config()
+        file_types = config.file_types
+        importer = get_dict_from_json(str(file_types.importers.folder_path / importer_filename))
+        if not importer:
+            raise ValueError(f"Importer introuvable ou invalide : {importer_filename}")
+        mapping = get_dict_from_json(str(file_types.mappings.folder_path / importer["mapping_filename"]))
+        return cls(
+            index_name=importer["index_name"],
+            datas_filepath=file_types.datas.folder_path / importer["datas_filename"],
+            mapping=mapping,
+            separator=importer.get("datas_separator"),
+            id_columns=importer.get("id_columns"),
+            op_type=importer.get("op_type") or "index",
+            config=config,
+            on_chunk=on_chunk,
+            incremental=incremental,
+            state_name=Path(importer_filename).stem,
+        )
+
+    def _resolve_completions(self, fields: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Ajoute aux champs de complétion le chemin de leur fichier ('completion_filepath').
+        Un champ dont le fichier est introuvable est ignoré.
+        """
+        resolved = {}
+        for target, field in fields.items():
+            if (isinstance(field, dict) and field.get("category") in COMPLETION_CATEGORIES
+                    and field.get("filename")):
+                filepath = Path(self._config.file_types.completions.folder_path) / field["filename"]
+                if not filepath.is_file():
+                    logger.warning(f"EsDataImport - Fichier de complétion introuvable pour '{target}' : {filepath}")
+                    continue
+                field = {**field, "completion_filepath": str(filepath)}
+            resolved[target] = field
+        return resolved
+
+    @property
+    def index_name(self) -> str:
+        return self._index_name
+
+    @property
+    def op_type(self) -> str:
+        return self._op_type
+
+    @property
+    def fields(self) -> Dict[str, Dict[str, Any]]:
+        return self._fields
+
+    @property
+    def id_columns(self) -> Optional[List[str]]:
+        return self._id_builder.id_columns if self._id_builder else None
+
+    @property
+    def incremental(self) -> bool:
+        return self._incremental
+
+    @property
+    def state_filepath(self) -> Path:
+        """Fichier des empreintes du dernier import (mode incrémental)."""
+        return self._config.import_state_folder / f"{self._state_name}.npz"
+
+    @property
+    def elastic_manager(self) -> ElasticManager:
+        if self._elastic_manager is None:
+            self._elastic_manager = ElasticManager(self._config)
+        return self._elastic_manager
+
+    # --- LECTURE ---
+    def open_reader(self) -> CsvFileReader:
+        reader = CsvFileReader(filepath=str(self._datas_filepath), sep=self._separator, config=self._config)
+        if self._id_builder:
+            missing = self._id_builder.check_columns(reader.headers)
+            if missing:
+                raise ValueError(f"Colonnes clés absentes du fichier de données : {missing}")
+        return reader
+
+    def iter_chunks(self, reader: CsvFileReader) -> Iterator[pd.DataFrame]:
+        """Lit le fichier de données chunk par chunk en un seul passage (colonnes dérivées comprises)."""
+        yield from reader.iter_chunks()
+
+    # --- TRANSFORMATION ---
+    def build_documents(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Construit les documents d'un chunk selon le mapping.
+        """
+        return build_documents(self._fields, chunk)
+
+    def transform(self, chunk: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[np.ndarray]]:
+        """
+        Transforme un chunk brut en (documents, hash des clés).
+        """
+        return transform_chunk(self._fields, self.id_columns, chunk)
+
+    @staticmethod
+    def select_changes(state: ImportHashState, documents: pd.DataFrame, key_hashes: np.ndarray,
+                       content_hashes: np.ndarray) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Ne conserve que les lignes nouvelles ou modifiées par rapport à l'état précédent.
+        """
+        mask = state.changed_mask(key_hashes, content_hashes)
+        return documents[mask], key_hashes[mask]
+
+    def to_actions(self, documents: pd.DataFrame,
+                   key_hashes: Optional[np.ndarray]) -> Tuple[List[Dict[str, Any]], Optional[List[str]]]:
+        """Convertit les documents d'un chunk en (liste de documents, _id)."""
+        ids = DocumentIdBuilder.to_ids(key_hashes) if key_hashes is not None else None
+        return documents.to_dict(orient="records"), ids
+
+    # --- ENVOI ---
+    def send(self, documents: List[Dict[str, Any]], ids: Optional[List[str]]) -> bool:
+        """Envoie un lot de documents à Elasticsearch."""
+        return self.elastic_manager.tools.bulk_import(
+            self._index_name, documents, ids=ids, op_type=self._op_type, refresh=False
+        )
+
+    def delete(self, key_hashes: np.ndarray) -> bool:
+        """Supprime de l'index les documents dont la clé a disparu."""
+        return self.elastic_manager.tools.bulk_delete(
+            self._index_name, DocumentIdBuilder.to_ids(key_hashes), refresh=False
+        )
+
+    def run(self) -> Union[Dict[str, Any], bool]:
+        """
+        Exécute l'import complet (ou le delta en mode incrémental).
+
+        :return: Statistiques de l'import, ou False en cas d'échec.
+        """
+        try:
+            reader = self.open_reader()
+        except (ValueError, FileNotFoundError) as e:
+            logger.error(f"EsDataImport - Fichier de données invalide : {e}")
+            return False
+
+        state = self.open_state()
+        seen_keys: List[np.ndarray] = []
+        seen_contents: List[np.ndarray] = []
+
+        num_chunks = reader.num_chunks
+        rows = 0
+        docs = 0
+        for chunk_index, chunk in enumerate(self.iter_chunks(reader)):
+            documents, key_hashes = self.transform(chunk)
+            if state is not None:
+                content_hashes = hash_rows(documents)
+                seen_keys.append(key_hashes)
+                seen_contents.append(content_hashes)
+                documents, key_hashes = self.select_changes(state, documents, key_hashes, content_hashes)
+
+            batch, ids = self.to_actions(documents, key_hashes)
+            if batch and not self.send(batch, ids):
+                logger.error(f"EsDataImport - Échec de l'envoi du chunk {chunk_index}")
+                return False
+            rows += len(chunk)
+            docs += len(batch)
+            if self._on_chunk is not None:
+                self._on_chunk(chunk_index, num_chunks, rows=len(chunk),
+                               total_bytes=reader.file_size, docs=len(batch))
+
+        return self.finalize(state, seen_keys, seen_contents, rows, docs)
+
+    def open_state(self) -> Optional[ImportHashState]:
+        """Charge l'état des empreintes en mode incrémental (None sinon)."""
+        return ImportHashState(self.state_filepath).load() if self._incremental else None
+
+    def finalize(self, state: Optional[ImportHashState], seen_keys: List[np.ndarray],
+                 seen_contents: List[np.ndarray], rows: int, docs: int) -> Union[Dict[str, Any], bool]:
+        """
+        Termine l'import : suppression des clés disparues et sauvegarde de l'état (mode incrémental),
+        puis rafraîchissement de l'index.
+
+        :return: Statistiques de l'import, ou False en cas d'échec.
+        """
+        deleted = 0
+        if state is not None:
+            all_keys = np.concatenate(seen_keys) if seen_keys else np.empty(0, dtype=KEY_DTYPE)
+            all_contents = np.concatenate(seen_contents) if seen_contents else np.empty(0, dtype=np.uint64)
+            vanished = state.vanished_keys(all_keys)
+            if len(vanished) and not self.delete(vanished):
+                logger.error("EsDataImport - Échec de la suppression des documents disparus")
+                return False
+            deleted = len(vanished)
+            # L'état n'est enregistré qu'après un import complet réussi
+            state.save(all_keys, all_contents)
+
+        self.elastic_manager.tools.refresh(self._index_name)
+        logger.info(f"EsDataImport - {docs}/{rows} documents envoyés, {deleted} supprimés "
+                    f"dans '{self._index_name}' ({self._op_type})")
+        return {
+            "index_name": self._index_name,
+            "op_type": self._op_type,
+            "incremental": self._incremental,
+            "rows": rows,
+            "docs": docs,
+            "unchanged": rows - docs if state is not None else 0,
+            "deleted": deleted,
+        }
@@ -0,0 +1,125 @@
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from models.import_management.doc_ids import KEY_DTYPE
+
+logger = logging.getLogger(__name__)
+
+
+# Empreinte exacte (clé, contenu) d'une ligne : les octets de la clé suivis des 8 octets du hash de contenu
+_PAIR_DTYPE = np.dtype(f"S{KEY_DTYPE.itemsize + 8}")
+
+
+def _pair_hashes(keys: np.ndarray, contents: np.ndarray) -> np.ndarray:
+    key_bytes = np.ascontiguousarray(keys, dtype=KEY_DTYPE).view(np.uint8).reshape(len(keys), KEY_DTYPE.itemsize)
+    content_bytes = contents.astype(">u8").view(np.uint8).reshape(len(keys), 8)
+    return np.hstack([key_bytes, content_bytes]).view(_PAIR_DTYPE).ravel()
+
+
+class ImportHashState:
+    """
+    Empreintes du dernier import réussi d'un importer : hash de la clé et hash du contenu de chaque ligne.
+    Stockées triées par clé dans un fichier .npz pour des recherches vectorisées (np.searchsorted).
+    Une clé présente plusieurs fois dans le fichier n'est conservée qu'une fois, avec le contenu de sa dernière
+    ligne (celle qu'Elasticsearch garde, l'identifiant étant le même) ; les lignes précédentes sont mémorisées
+    à part, pour ne pas être considérées comme modifiées à chaque import.
+    """
+
+    def __init__(self, filepath: Union[str, Path]):
+        self._filepath = Path(filepath)
+        self._keys = np.empty(0, dtype=KEY_DTYPE)
+        self._contents = np.empty(0, dtype=np.uint64)
+        self._shadowed = np.empty(0, dtype=_PAIR_DTYPE)
+
+    @property
+    def filepath(self) -> Path:
+        return self._filepath
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self._keys
+
+    @property
+    def exists(self) -> bool:
+        return self._filepath.exists()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def load(self) -> "ImportHashState":
+        """Charge l'état précédent ; un état absent ou illisible équivaut à un premier import."""
+        if not self.exists:
+            return self
+        try:
+            with np.load(self._filepath) as data:
+                if data["keys"].dtype != KEY_DTYPE:
+                    # État antérieur aux clés 128 bits : ses _id ne correspondent plus, import complet
+                    raise ValueError(f"format de clé obsolète ({data['keys'].dtype})")
+                self._keys = data["keys"]
+                self._contents = data["contents"]
+                self._shadowed = data["shadowed"]
+        except (OSError, KeyError, ValueError) as e:
+            logger.error(f"ImportHashState - État illisible {self._filepath}, import complet : {e}")
+            self._keys = np.empty(0, dtype=KEY_DTYPE)
+            self._contents = np.empty(0, dtype=np.uint64)
+            self._shadowed = np.empty(0, dtype=_PAIR_DTYPE)
+        return self
+
+    def save(self, keys: np.ndarray, contents: np.ndarray) -> None:
+        """
+        Remplace l'état par les empreintes du dernier import (écriture atomique).
+        Les clés sont dédoublonnées en gardant leur dernière ligne (ordre du fichier).
+        """
+        _, reversed_index = np.unique(keys[::-1], return_index=True)
+        last = len(keys) - 1 - reversed_index
+        shadowed = np.ones(len(keys), dtype=bool)
+        shadowed[last] = False
+        self._keys = keys[last]
+        self._contents = contents[last]
+        self._shadowed = np.unique(_pair_hashes(keys[shadowed], contents[shadowed]))
+        tmp_path = self._filepath.with_name(self._filepath.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, keys=self._keys, contents=self._contents, shadowed=self._shadowed)
+        os.replace(tmp_path, self._filepath)
+
+    def changed_mask(self, keys: np.ndarray, contents: np.ndarray) -> np.ndarray:
+        """
+        Masque des lignes nouvelles ou modifiées par rapport à l'état précédent (une ligne identique à une
+        ligne précédente d'une clé en double n'est pas modifiée).
+        """
+        if not len(self._keys):
+            return np.ones(len(keys), dtype=bool)
+        positions = np.searchsorted(self._keys, keys)
+        positions = np.minimum(positions, len(self._keys) - 1)
+        found = self._keys[positions] == keys
+        changed = ~found | (self._contents[positions] != contents)
+        if len(self._shadowed) and changed.any():
+            changed &= ~np.isin(_pair_hashes(keys, contents), self._shadowed)
+        return changed
+
+    def vanished_keys(self, seen_keys: np.ndarray) -> np.ndarray:
+        """Clés présentes lors de l'import précédent et absentes de l'import courant."""
+        if not len(self._keys):
+            return self._keys
+        return self._keys[~np.isin(self._keys, seen_keys, assume_unique=False)]
+
+
+def hash_rows(df: pd.DataFrame) -> np.ndarray:
+    """
+    Hash 64 bits du contenu de chaque ligne d'un DataFrame (vectorisé).
+    Les noms des colonnes, dans leur ordre, servent de graine : renommer, ajouter ou réordonner des champs
+    du mapping change l'empreinte de toutes les lignes, même si leurs valeurs sont identiques.
+    """
+    if df.empty:
+        return np.empty(0, dtype=np.uint64)
+    normalized = df.fillna("").astype(str)
+    columns = "\x1f".join(str(column) for column in df.columns)
+    hash_key = hashlib.blake2b(columns.encode("utf-8"), digest_size=8).hexdigest()
+    return pd.util.hash_pandas_object(normalized, index=False, hash_key=hash_key).to_numpy()
+
@@ -0,0 +1,60 @@
+from typing import List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+# Hash de clé sur 128 bits (deux hash 64 bits à graines distinctes, gros-boutiste) : avec 64 bits, une
+# collision devient probable vers quelques milliards de clés et écraserait silencieusement un autre document
+KEY_DTYPE = np.dtype("S16")
+_KEY_HASH_SEEDS = ("doc_ids/hi/00000", "doc_ids/lo/00000")  # 16 caractères, exigés par hash_pandas_object
+
+
+class DocumentIdBuilder:
+    """
+    Calcule des identifiants de documents (_id) déterministes à partir de colonnes clés.
+    Le hash est vectorisé sur le chunk (pandas.util.hash_pandas_object, deux graines fixes, 128 bits) :
+    une même clé produit toujours le même _id, d'un import à l'autre.
+    """
+
+    def __init__(self, id_columns: Union[str, Sequence[str]]):
+        self._id_columns: List[str] = [id_columns] if isinstance(id_columns, str) else list(id_columns)
+        if not self._id_columns:
+            raise ValueError("Au moins une colonne clé est nécessaire pour calculer les _id.")
+
+    @property
+    def id_columns(self) -> List[str]:
+        return self._id_columns
+
+    def check_columns(self, columns: Sequence[str]) -> List[str]:
+        """Retourne la liste des colonnes clés absentes de `columns`."""
+        return [col for col in self._id_columns if col not in columns]
+
+    def hash_keys(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Hash 128 bits des colonnes clés de chaque ligne.
+
+        :param df: Chunk contenant les colonnes clés
+        :return: Tableau KEY_DTYPE (16 octets par ligne), dans l'ordre des lignes du chunk
+        """
+        missing = self.check_columns(df.columns)
+        if missing:
+            raise ValueError(f"Colonnes clés absentes : {missing}")
+        keys = df[self._id_columns].fillna("").astype(str)
+        halves = np.empty((len(keys), 2), dtype=">u8")
+        for i, seed in enumerate(_KEY_HASH_SEEDS):
+            halves[:, i] = pd.util.hash_pandas_object(keys, index=False, hash_key=seed).to_numpy()
+        return halves.view(KEY_DTYPE).ravel()
+
+    @staticmethod
+    def to_ids(key_hashes: np.ndarray) -> List[str]:
+        """Convertit des hash de clé en _id (hexadécimal sur 32 caractères)."""
+        # tobytes() conserve les octets nuls finaux que l'accès élément par élément d'un tableau S16 supprime
+        hexed = np.ascontiguousarray(key_hashes, dtype=KEY_DTYPE).tobytes().hex()
+        width = 2 * KEY_DTYPE.itemsize
+        return [hexed[i:i + width] for i in range(0, len(hexed), width)]
+
+    def build(self, df: pd.DataFrame) -> List[str]:
+        """
+        Calcule les _id des lignes du chunk.
+        """
+        return self.to_ids(self.hash_keys(df))
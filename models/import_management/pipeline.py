@@ -0,0 +1,329 @@
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from elastic_manager.estools import ElasticSearchTools
+from models.import_management.data_import import EsDataImport, transform_chunk
+from models.import_management.delta import hash_rows
+
+logger = logging.getLogger(__name__)
+
+# Marqueur de fin de flux entre deux étages
+_END = object()
+
+
+class StageStats:
+    """
+    Statistiques d'un étage du pipeline : nombre d'éléments traités et temps d'occupation.
+    L'utilisation est le rapport entre le temps occupé et le temps disponible (durée × nombre de workers) :
+    un étage proche de 100 % est le goulot d'étranglement.
+    """
+
+    def __init__(self, name: str, workers: int = 1):
+        self.name = name
+        self.workers = max(workers, 1)
+        self.items = 0
+        self.busy = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, busy: float, items: int = 1) -> None:
+        with self._lock:
+            self.busy += busy
+            self.items += items
+
+    def utilization(self, elapsed: float) -> float:
+        if elapsed <= 0:
+            return 0.0
+        return min(self.busy / (elapsed * self.workers), 1.0)
+
+    def to_dict(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "items": self.items,
+            "busy": round(self.busy, 3),
+            "utilization": round(self.utilization(elapsed), 3),
+        }
+
+
+def _timed_transform(fields: Dict[str, Dict[str, Any]], id_columns: Optional[List[str]], chunk: pd.DataFrame,
+                     with_content_hash: bool) -> Tuple[pd.DataFrame, Optional[np.ndarray], Optional[np.ndarray], float]:
+    """Transformation exécutée dans le pool de processus ; retourne aussi sa durée."""
+    start = time.perf_counter()
+    documents, key_hashes = transform_chunk(fields, id_columns, chunk)
+    content_hashes = hash_rows(documents) if with_content_hash else None
+    return documents, key_hashes, content_hashes, time.perf_counter() - start
+
+
+class ImportPipeline:
+    """
+    Exécute un EsDataImport sous forme de pipeline à étages reliés par des files bornées :
+    lecture (thread) -> transformation (pool de processus) -> sérialisation NDJSON (thread)
+    -> envoi bulk (N threads). Les files bornées assurent la contre-pression entre étages.
+    """
+
+    def __init__(
+            self,
+            data_import: EsDataImport,
+            config: Optional[Config] = None,
+            transform_workers: Optional[int] = None,
+            sender_threads: Optional[int] = None,
+            queue_size: Optional[int] = None,
+            on_chunk: Optional[Callable[..., None]] = None
+    ):
+        """
+        :param data_import: Import à exécuter (mapping, clés, op_type, mode incrémental)
+        :param transform_workers: Nombre de processus de transformation (0 : transformation dans le thread ;
+            les processus sont démarrés en 'spawn', les champs du mapping doivent donc être picklables)
+        :param sender_threads: Nombre de threads d'envoi bulk
+        :param queue_size: Taille maximale des files entre étages
+        :param on_chunk: Callback de progression appelé après chaque chunk envoyé
+        """
+        self._config = config or Config()
+        self._import = data_import
+        self._transform_workers = (self._config.import_transform_workers
+                                   if transform_workers is None else transform_workers)
+        self._sender_threads = max(sender_threads or self._config.import_sender_threads, 1)
+        self._queue_size = max(queue_size or self._config.import_queue_size, 1)
+        self._on_chunk = on_chunk
+
+        self._failed = threading.Event()
+        self._error: Optional[str] = None
+        self._progress_lock = threading.Lock()
+        self._sent_chunks = 0
+        self._stats = {
+            "read": StageStats("read"),
+            "transform": StageStats("transform", self._transform_workers or 1),
+            "serialize": StageStats("serialize"),
+            "send": StageStats("send", self._sender_threads),
+        }
+
+    @property
+    def stats(self) -> Dict[str, StageStats]:
+        return self._stats
+
+    def _fail(self, message: str) -> None:
+        if not self._failed.is_set():
+            self._error = message
+            logger.error(f"ImportPipeline - {message}")
+        self._failed.set()
+
+    def _put(self, target: queue.Queue, item: Any) -> bool:
+        """Dépose un élément dans une file bornée en restant attentif à un échec d'un autre étage."""
+        while not self._failed.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue) -> Any:
+        while not self._failed.is_set():
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _new_tools(self) -> ElasticSearchTools:
+        return ElasticSearchTools(self._config.get_host_str(), self._config.es_username, self._config.es_password)
+
+    # --- ETAGES ---
+    def _read_stage(self, reader, out_queue: queue.Queue) -> None:
+        stats = self._stats["read"]
+        try:
+            chunks = self._import.iter_chunks(reader)
+            while True:
+                start = time.perf_counter()
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                stats.add(time.perf_counter() - start)
+                if not self._put(out_queue, chunk):
+                    return
+        except Exception as e:
+            self._fail(f"Erreur de lecture : {e}")
+        finally:
+            self._put_end(out_queue)
+
+    def _transform_stage(self, in_queue: queue.Queue, out_queue: queue.Queue) -> None:
+        stats = self._stats["transform"]
+        fields = self._import.fields
+        id_columns = self._import.id_columns
+        with_content_hash = self._import.incremental
+        # 'spawn' : un fork hériterait des verrous et threads des autres étages dans leur état du moment
+        pool = (ProcessPoolExecutor(max_workers=self._transform_workers,
+                                    mp_context=multiprocessing.get_context("spawn"))
+                if self._transform_workers else None)
+        pending: List[Tuple[int, Future]] = []
+        try:
+            while True:
+                chunk = self._get(in_queue)
+                if chunk is _END:
+                    break
+                if pool is None:
+                    *result, busy = _timed_transform(fields, id_columns, chunk, with_content_hash)
+                    stats.add(busy)
+                    if not self._put(out_queue, (len(chunk), *result)):
+                        return
+                    continue
+                pending.append((len(chunk), pool.submit(_timed_transform, fields, id_columns, chunk,
+                                                        with_content_hash)))
+                # Nombre de chunks en vol borné pour conserver la contre-pression
+                while len(pending) >= self._transform_workers * 2:
+                    if not self._forward_transformed(pending.pop(0), out_queue):
+                        return
+            while pending:
+                if not self._forward_transformed(pending.pop(0), out_queue):
+                    return
+        except Exception as e:
+            self._fail(f"Erreur de transformation : {e}")
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+            self._put_end(out_queue)
+
+    def _forward_transformed(self, item: Tuple[int, Future], out_queue: queue.Queue) -> bool:
+        rows, future = item
+        *result, busy = future.result()
+        self._stats["transform"].add(busy)
+        return self._put(out_queue, (rows, *result))
+
+    def _serialize_stage(self, in_queue: queue.Queue, out_queue: queue.Queue, state,
+                         seen_keys: List[np.ndarray], seen_contents: List[np.ndarray],
+                         totals: Dict[str, int]) -> None:
+        stats = self._stats["serialize"]
+        tools = self._new_tools()
+        try:
+            while True:
+                item = self._get(in_queue)
+                if item is _END:
+                    break
+                start = time.perf_counter()
+                rows, documents, key_hashes, content_hashes = item
+                if state is not None:
+                    seen_keys.append(key_hashes)
+                    seen_contents.append(content_hashes)
+                    documents, key_hashes = EsDataImport.select_changes(state, documents, key_hashes,
+                                                                        content_hashes)
+                batch, ids = self._import.to_actions(documents, key_hashes)
+                body = None
+                if batch:
+                    actions = tools.build_bulk_actions(self._import.index_name, batch, ids, self._import.op_type)
+                    if actions is None:
+                        self._fail("Actions bulk invalides")
+                        return
+                    body = tools.serialize_bulk_actions(actions)
+                totals["rows"] += rows
+                totals["docs"] += len(batch)
+                stats.add(time.perf_counter() - start)
+                if not self._put(out_queue, (totals["chunks"], rows, len(batch), body)):
+                    return
+                totals["chunks"] += 1
+        except Exception as e:
+            self._fail(f"Erreur de sérialisation : {e}")
+        finally:
+            for _ in range(self._sender_threads):
+                self._put_end(out_queue)
+
+    def _send_stage(self, in_queue: queue.Queue, num_chunks: int, total_bytes: int) -> None:
+        stats = self._stats["send"]
+        # Un client par thread : ElasticSearchTools n'est pas partageable entre threads
+        tools = self._new_tools()
+        ignore_conflicts = self._import.op_type == "create"
+        while True:
+            item = self._get(in_queue)
+            if item is _END:
+                return
+            chunk_index, rows, docs, body = item
+            start = time.perf_counter()
+            if body is not None and not tools.send_bulk_body(body, ignore_conflicts=ignore_conflicts):
+                self._fail(f"Échec de l'envoi du chunk {chunk_index}")
+                return
+            stats.add(time.perf_counter() - start)
+            with self._progress_lock:
+                # Les chunks peuvent se terminer dans le désordre : la progression compte les chunks envoyés
+                self._sent_chunks += 1
+                if self._on_chunk is not None:
+                    try:
+                        self._on_chunk(self._sent_chunks - 1, num_chunks, rows=rows, total_bytes=total_bytes,
+                                       docs=docs)
+                    except Exception as e:
+                        self._fail(f"Import interrompu : {e}")
+                        return
+
+    def _put_end(self, target: queue.Queue) -> None:
+        # Le marqueur de fin doit passer même si la file est pleine et qu'un étage a échoué
+        while True:
+            try:
+                target.put(_END, timeout=0.1)
+                return
+            except queue.Full:
+                if self._failed.is_set():
+                    try:
+                        target.get_nowait()
+                    except queue.Empty:
+                        pass
+
+    def run(self) -> Union[Dict[str, Any], bool]:
+        """
+        Exécute l'import en pipeline.
+
+        :return: Statistiques de l'import (dont l'utilisation de chaque étage), ou False en cas d'échec.
+        """
+        try:
+            reader = self._import.open_reader()
+        except (ValueError, FileNotFoundError) as e:
+            logger.error(f"ImportPipeline - Fichier de données invalide : {e}")
+            return False
+
+        state = self._import.open_state()
+        seen_keys: List[np.ndarray] = []
+        seen_contents: List[np.ndarray] = []
+        totals = {"rows": 0, "docs": 0, "chunks": 0}
+
+        raw_queue: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        transformed_queue: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        serialized_queue: queue.Queue = queue.Queue(maxsize=self._queue_size)
+
+        threads = [
+            threading.Thread(target=self._read_stage, args=(reader, raw_queue), name="import-read"),
+            threading.Thread(target=self._transform_stage, args=(raw_queue, transformed_queue),
+                             name="import-transform"),
+            threading.Thread(target=self._serialize_stage,
+                             args=(transformed_queue, serialized_queue, state, seen_keys, seen_contents, totals),
+                             name="import-serialize"),
+        ]
+        threads += [
+            threading.Thread(target=self._send_stage, args=(serialized_queue, reader.num_chunks, reader.file_size),
+                             name=f"import-send-{i}")
+            for i in range(self._sender_threads)
+        ]
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        stages = {name: stats.to_dict(elapsed) for name, stats in self._stats.items()}
+        logger.info(f"ImportPipeline - Utilisation des étages : "
+                    f"{ {name: stage['utilization'] for name, stage in stages.items()} }")
+        if self._failed.is_set():
+            return False
+
+        result = self._import.finalize(state, seen_keys, seen_contents, totals["rows"], totals["docs"])
+        if result is False:
+            return False
+        result["elapsed"] = round(elapsed, 3)
+        result["stages"] = stages
+        return result
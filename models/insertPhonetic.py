@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
 from config import Config
 from models.file_management.filepath_codec import FilePathCodec
@@ -14,8 +14,10 @@ class PhoneticRequestInserter:
     Service d'insertion de colonnes phonétiques dans un fichier à partir d'une requête utilisateur.
     """
 
-    def __init__(self, config: Optional[Config] = None) -> None:
+    def __init__(self, config: Optional[Config] = None,
+                 on_chunk: Optional[Callable[..., None]] = None) -> None:
         self._config: Config = config or Config()
+        self._on_chunk = on_chunk
         self._filepathcodec = FilePathCodec()
         self._request_validator: PhoneticRequestValidator = None
 
@@ -50,6 +52,7 @@ class PhoneticRequestInserter:
                 source_column=self._request_validator.column,
                 phonex_dict=self._request_validator.phonetic,
                 config=self._config,
+                on_chunk=self._on_chunk,
             )
             return phonetic_modifier.process()
         except Exception as e:
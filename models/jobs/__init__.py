@@ -0,0 +1,4 @@
+from models.jobs.job import Job, JobStatus
+from models.jobs.context import JobContext, JobCancelledError
+from models.jobs.store import JobStore
+from models.jobs.manager import JobManager, get_job_manager
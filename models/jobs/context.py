@@ -0,0 +1,65 @@
+import threading
+from typing import Callable, Optional
+
+from models.jobs.job import Job
+
+
+class JobCancelledError(Exception):
+    """
+    Levée par un handler lorsque l'annulation du job a été demandée.
+    """
+
+
+class JobContext:
+    """
+    Contexte transmis au handler d'un job : remontée de la progression et signal d'annulation.
+    """
+
+    def __init__(self, job: Job, persist: Optional[Callable[[Job], None]] = None):
+        """
+        :param job: Job en cours d'exécution
+        :param persist: Fonction appelée après chaque mise à jour de progression (sauvegarde, notification)
+        """
+        self._job = job
+        self._persist = persist
+        self._cancel_event = threading.Event()
+
+    @property
+    def job(self) -> Job:
+        return self._job
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Indique si l'annulation du job a été demandée."""
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """Demande l'annulation coopérative du job."""
+        self._cancel_event.set()
+
+    def raise_if_cancelled(self) -> None:
+        """Lève JobCancelledError si l'annulation a été demandée."""
+        if self.is_cancelled:
+            raise JobCancelledError(f"Job {self._job.id} annulé")
+
+    def on_chunk(self, chunk_index: int, num_chunks: int, rows: int = 0,
+                 total_bytes: Optional[int] = None, docs: int = 0) -> None:
+        """
+        Callback à passer aux traitements chunk par chunk.
+        Met à jour la progression et les compteurs, les publie puis vérifie l'annulation.
+
+        :param chunk_index: Index (0-based) du chunk qui vient d'être traité
+        :param num_chunks: Nombre total de chunks
+        :param rows: Nombre de lignes du chunk
+        :param total_bytes: Taille du fichier source ; les octets lus sont estimés au prorata des chunks
+        :param docs: Nombre de documents indexés pour ce chunk
+        """
+        done = chunk_index + 1
+        self._job.set_progress(done, num_chunks)
+        counters = self._job.counters
+        total_bytes = total_bytes if total_bytes is not None else counters.total_bytes
+        bytes_read = total_bytes * done // num_chunks if total_bytes and num_chunks else None
+        counters.update(rows=rows, bytes_read=bytes_read, docs=docs, total_bytes=total_bytes)
+        if self._persist is not None:
+            self._persist(self._job)
+        self.raise_if_cancelled()
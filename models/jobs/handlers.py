@@ -0,0 +1,83 @@
+from typing import Any, Callable, Dict
+
+from config import Config
+from models.file_management.completion.empty import MappingCompletionEmptyFileCreator
+from models.file_management.completion.multi import MultiCompletionFileCreator
+from models.file_management.completion.phonetic import PhoneticFileCreator
+from models.file_management.file_modifier.column_pipeline import ColumnPipeline
+from models.import_management import EsDataImport, ImportPipeline
+from models.insertPhonetic import PhoneticRequestInserter
+from models.jobs.context import JobContext
+from models.phonetc_basics.code_store import get_code_store
+
+JobHandler = Callable[[Dict[str, Any], JobContext, Config], Any]
+
+
+def phonetic_insert_handler(payload: Dict[str, Any], context: JobContext, config: Config) -> Any:
+    """Ajout de colonnes phonétiques dans un fichier existant."""
+    return PhoneticRequestInserter(config, on_chunk=context.on_chunk).insert(payload)
+
+
+def phonetic_completion_handler(payload: Dict[str, Any], context: JobContext, config: Config) -> Any:
+    """Création d'un fichier de complétion enrichi de colonnes phonétiques."""
+    return PhoneticFileCreator(payload, config, on_chunk=context.on_chunk).create()
+
+
+def empty_completion_handler(payload: Dict[str, Any], context: JobContext, config: Config) -> Any:
+    """Création d'un fichier de complétion avec des colonnes vides."""
+    return MappingCompletionEmptyFileCreator(payload, config, on_chunk=context.on_chunk).create()
+
+
+def multi_completion_handler(payload: Dict[str, Any], context: JobContext, config: Config) -> Any:
+    """
+    Création des fichiers de complétion de plusieurs colonnes d'un même fichier, en une seule lecture.
+    Options du payload : 'completions' (liste de complétions 'empty' ou 'phonetic').
+    """
+    return MultiCompletionFileCreator(payload, config, on_chunk=context.on_chunk).create()
+
+
+def column_pipeline_handler(payload: Dict[str, Any], context: JobContext, config: Config) -> Any:
+    """
+    Application de plusieurs transformations de colonnes à un fichier en un seul passage.
+    Options du payload : 'transforms' (liste de spécifications), 'mode' ('overlay', 'file' ou 'in_place').
+    """
+    pipeline = ColumnPipeline.from_spec(payload, config, on_chunk=context.on_chunk)
+    return pipeline.run(payload.get("mode", "overlay"))
+
+
+def es_import_handler(payload: Dict[str, Any], context: JobContext, config: Config) -> Any:
+    """
+    Import d'un fichier de données dans Elasticsearch à partir d'un importer.
+    Options du payload : 'incremental' (delta uniquement), 'pipeline' (exécution par étages parallèles).
+    """
+    incremental = bool(payload.get("incremental"))
+    if payload.get("pipeline"):
+        data_import = EsDataImport.from_importer_file(payload["importer_filename"], config, incremental=incremental)
+        return ImportPipeline(data_import, config, on_chunk=context.on_chunk).run()
+    data_import = EsDataImport.from_importer_file(
+        payload["importer_filename"], config, on_chunk=context.on_chunk, incremental=incremental
+    )
+    return data_import.run()
+
+
+def phonetic_store_compact_handler(payload: Dict[str, Any], context: JobContext, config: Config) -> Any:
+    """
+    Compaction du dictionnaire phonétique persistant : suppression des entrées les moins récemment utilisées
+    au-delà de la limite (option 'max_entries' du payload) et récupération de l'espace disque.
+    """
+    store = get_code_store(config)
+    if store is None:
+        return {"enabled": False}
+    removed = store.compact(payload.get("max_entries"))
+    return {"enabled": True, "removed": removed, **store.stats()}
+
+
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    "phonetic_insert": phonetic_insert_handler,
+    "phonetic_completion": phonetic_completion_handler,
+    "empty_completion": empty_completion_handler,
+    "multi_completion": multi_completion_handler,
+    "column_pipeline": column_pipeline_handler,
+    "es_import": es_import_handler,
+    "phonetic_store_compact": phonetic_store_compact_handler,
+}
@@ -0,0 +1,173 @@
+import uuid
+from typing import Any, Dict, Optional
+
+from models.date_formater import MultiDateFormater
+from models.jobs.progress import ProgressCounters
+
+
+class JobStatus:
+    """
+    Statuts possibles d'un job.
+    """
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    INTERRUPTED = "interrupted"
+
+    FINISHED = frozenset({SUCCEEDED, FAILED, CANCELLED, INTERRUPTED})
+
+
+class Job:
+    """
+    Représente un traitement long exécuté en arrière-plan (type, paramètres, statut, progression, résultat).
+    Sérialisable en dictionnaire pour être persisté par le JobStore.
+    """
+
+    def __init__(self, job_type: str, payload: Optional[Dict[str, Any]] = None, job_id: Optional[str] = None):
+        self._id: str = job_id or uuid.uuid4().hex
+        self._job_type: str = job_type
+        self._payload: Dict[str, Any] = payload or {}
+        self._status: str = JobStatus.PENDING
+        self._done: int = 0
+        self._total: Optional[int] = None
+        self._counters: ProgressCounters = ProgressCounters()
+        self._result: Any = None
+        self._error: Optional[str] = None
+        self._created_at: str = MultiDateFormater.to_es()
+        self._started_at: Optional[str] = None
+        self._finished_at: Optional[str] = None
+
+    # --- GETTERS ---
+    @property
+    def id(self) -> str:
+        """Identifiant unique du job."""
+        return self._id
+
+    @property
+    def job_type(self) -> str:
+        """Type de traitement (clé du registre des handlers)."""
+        return self._job_type
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        """Paramètres transmis au handler."""
+        return self._payload
+
+    @property
+    def status(self) -> str:
+        """Statut courant du job."""
+        return self._status
+
+    @property
+    def is_finished(self) -> bool:
+        """Indique si le job est dans un état terminal."""
+        return self._status in JobStatus.FINISHED
+
+    @property
+    def done(self) -> int:
+        """Nombre d'étapes (chunks) traitées."""
+        return self._done
+
+    @property
+    def total(self) -> Optional[int]:
+        """Nombre total d'étapes, si connu."""
+        return self._total
+
+    @property
+    def progress(self) -> Optional[float]:
+        """Progression entre 0 et 1, ou None si le total est inconnu."""
+        if self._status == JobStatus.SUCCEEDED:
+            return 1.0
+        if not self._total:
+            return None
+        return min(self._done / self._total, 1.0)
+
+    @property
+    def counters(self) -> ProgressCounters:
+        """Compteurs détaillés (lignes, octets, documents, débit, ETA)."""
+        return self._counters
+
+    @property
+    def result(self) -> Any:
+        """Résultat retourné par le handler."""
+        return self._result
+
+    @property
+    def error(self) -> Optional[str]:
+        """Message d'erreur en cas d'échec."""
+        return self._error
+
+    # --- TRANSITIONS ---
+    def set_progress(self, done: int, total: Optional[int] = None) -> None:
+        """Met à jour la progression du job."""
+        self._done = done
+        if total is not None:
+            self._total = total
+
+    def mark_running(self) -> None:
+        self._status = JobStatus.RUNNING
+        self._started_at = MultiDateFormater.to_es()
+        self._counters.start()
+
+    def mark_succeeded(self, result: Any = None) -> None:
+        self._status = JobStatus.SUCCEEDED
+        self._result = result
+        self._finished_at = MultiDateFormater.to_es()
+
+    def mark_failed(self, error: str) -> None:
+        self._status = JobStatus.FAILED
+        self._error = error
+        self._finished_at = MultiDateFormater.to_es()
+
+    def mark_cancelled(self) -> None:
+        self._status = JobStatus.CANCELLED
+        self._finished_at = MultiDateFormater.to_es()
+
+    def mark_interrupted(self) -> None:
+        self._status = JobStatus.INTERRUPTED
+        self._error = "Le processus a été arrêté pendant l'exécution du job."
+        self._finished_at = MultiDateFormater.to_es()
+
+    # --- SERIALISATION ---
+    @property
+    def dict(self) -> Dict[str, Any]:
+        """
+        Retourne le job sous forme de dictionnaire sérialisable en JSON.
+        """
+        return {
+            "id": self._id,
+            "job_type": self._job_type,
+            "payload": self._payload,
+            "status": self._status,
+            "done": self._done,
+            "total": self._total,
+            "progress": self.progress,
+            "counters": self._counters.to_dict(self._done, self._total),
+            "result": self._result,
+            "error": self._error,
+            "created_at": self._created_at,
+            "started_at": self._started_at,
+            "finished_at": self._finished_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        """
+        Reconstruit un job à partir de son dictionnaire persisté.
+        """
+        job = cls(job_type=data["job_type"], payload=data.get("payload"), job_id=data["id"])
+        job._status = data.get("status", JobStatus.PENDING)
+        job._done = data.get("done", 0)
+        job._total = data.get("total")
+        job._counters = ProgressCounters.from_dict(data.get("counters"))
+        job._result = data.get("result")
+        job._error = data.get("error")
+        job._created_at = data.get("created_at") or job._created_at
+        job._started_at = data.get("started_at")
+        job._finished_at = data.get("finished_at")
+        return job
+
+    def __repr__(self) -> str:
+        return f"<Job id={self._id}, type={self._job_type}, status={self._status}, done={self._done}/{self._total}>"
@@ -0,0 +1,200 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from config import Config
+from models.jobs.context import JobCancelledError, JobContext
+from models.jobs.job import Job, JobStatus
+from models.jobs.store import JobStore
+
+logger = logging.getLogger(__name__)
+
+
+class JobManager:
+    """
+    File de jobs exécutés en arrière-plan par un pool de workers.
+    Les jobs sont persistés dans le JobStore : au redémarrage, les jobs en attente sont relancés
+    et ceux interrompus en cours d'exécution sont marqués comme tels.
+    """
+    # Intervalle minimal (secondes) entre deux sauvegardes d'un job pendant sa progression
+    PERSIST_INTERVAL = 1.0
+
+    def __init__(
+            self,
+            config: Optional[Config] = None,
+            store: Optional[JobStore] = None,
+            handlers: Optional[Dict[str, Callable[..., Any]]] = None,
+            max_workers: Optional[int] = None
+    ):
+        self._config = config or Config()
+        self._store = store or JobStore(self._config.jobs_folder)
+        if handlers is None:
+            from models.jobs.handlers import JOB_HANDLERS
+            handlers = JOB_HANDLERS
+        self._handlers = dict(handlers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or self._config.job_workers,
+            thread_name_prefix="job-worker"
+        )
+        self._lock = threading.Lock()
+        self._updated = threading.Condition(self._lock)
+        self._version = 0
+        self._jobs: Dict[str, Job] = {}
+        self._contexts: Dict[str, JobContext] = {}
+        self._last_persist: Dict[str, float] = {}
+        self._restore()
+
+    @property
+    def job_types(self) -> List[str]:
+        return list(self._handlers.keys())
+
+    def _restore(self) -> None:
+        """Recharge les jobs persistés et relance ceux qui n'avaient pas démarré."""
+        for job in self._store.load_all():
+            self._jobs[job.id] = job
+            if job.status == JobStatus.RUNNING:
+                job.mark_interrupted()
+                self._store.save(job)
+            elif job.status == JobStatus.PENDING:
+                self._schedule(job)
+
+    def _persist(self, job: Job) -> None:
+        try:
+            self._store.save(job)
+        except OSError as e:
+            logger.error(f"JobManager - Impossible de sauvegarder le job {job.id} : {e}")
+
+    def _notify(self) -> None:
+        """Signale un changement d'état aux abonnés (à appeler avec le verrou détenu)."""
+        self._version += 1
+        self._updated.notify_all()
+
+    def _on_progress(self, job: Job) -> None:
+        """Publie la progression d'un job ; la sauvegarde disque est limitée à PERSIST_INTERVAL."""
+        now = time.monotonic()
+        if now - self._last_persist.get(job.id, 0.0) >= self.PERSIST_INTERVAL:
+            self._last_persist[job.id] = now
+            self._persist(job)
+        with self._lock:
+            self._notify()
+
+    def wait_for_update(self, version: int, timeout: Optional[float] = None) -> int:
+        """
+        Bloque jusqu'à un changement d'état postérieur à `version` ou jusqu'au timeout.
+
+        :param version: Dernière version connue par l'appelant
+        :param timeout: Délai maximal d'attente en secondes
+        :return: Version courante
+        """
+        with self._updated:
+            self._updated.wait_for(lambda: self._version != version, timeout=timeout)
+            return self._version
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def _schedule(self, job: Job) -> None:
+        context = JobContext(job, persist=self._on_progress)
+        self._contexts[job.id] = context
+        self._executor.submit(self._run, job, context)
+
+    def submit(self, job_type: str, payload: Optional[Dict[str, Any]] = None) -> Job:
+        """
+        Ajoute un job à la file.
+
+        :param job_type: Type de traitement (clé du registre des handlers)
+        :param payload: Paramètres transmis au handler
+        :return: Le job créé (statut pending)
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"Type de job inconnu : {job_type}")
+        job = Job(job_type, payload)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._persist(job)
+            self._schedule(job)
+            self._notify()
+        logger.info(f"JobManager - Job {job.id} ({job_type}) ajouté à la file")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Demande l'annulation d'un job. Un job en attente est annulé immédiatement,
+        un job en cours s'arrête au prochain chunk.
+
+        :return: True si la demande a été prise en compte, False si le job est inconnu ou déjà terminé.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            context = self._contexts.get(job_id)
+            if job is None or job.is_finished or context is None:
+                return False
+            context.cancel()
+            if job.status == JobStatus.PENDING:
+                job.mark_cancelled()
+                self._persist(job)
+            self._notify()
+        return True
+
+    def _run(self, job: Job, context: JobContext) -> None:
+        with self._lock:
+            if job.is_finished:
+                self._contexts.pop(job.id, None)
+                return
+            job.mark_running()
+            self._persist(job)
+            self._notify()
+
+        handler = self._handlers[job.job_type]
+        try:
+            result = handler(job.payload, context, self._config)
+            if context.is_cancelled:
+                job.mark_cancelled()
+            elif result is False:
+                job.mark_failed("Le traitement a échoué, voir les logs pour le détail.")
+            else:
+                job.mark_succeeded(result)
+        except JobCancelledError:
+            job.mark_cancelled()
+        except Exception as e:
+            logger.exception(f"JobManager - Erreur durant l'exécution du job {job.id}")
+            job.mark_failed(str(e))
+
+        with self._lock:
+            self._persist(job)
+            self._contexts.pop(job.id, None)
+            self._last_persist.pop(job.id, None)
+            self._notify()
+        logger.info(f"JobManager - Job {job.id} terminé avec le statut {job.status}")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Arrête le pool de workers."""
+        self._executor.shutdown(wait=wait)
+
+
+_job_manager: Optional[JobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager(config: Optional[Config] = None) -> JobManager:
+    """
+    Retourne l'instance partagée du JobManager, créée au premier appel
+    (évite un double démarrage des workers avec le reloader de Flask).
+    """
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager(config)
+        return _job_manager
@@ -0,0 +1,82 @@
+import time
+from typing import Any, Dict, Optional
+
+
+class ProgressCounters:
+    """
+    Compteurs de progression d'un job mis à jour par les boucles de traitement chunk par chunk :
+    lignes traitées, octets lus, documents indexés. Calcule le débit et l'estimation du temps restant.
+    """
+
+    def __init__(self, rows: int = 0, bytes_read: int = 0, total_bytes: Optional[int] = None, docs: int = 0):
+        self.rows: int = rows
+        self.bytes_read: int = bytes_read
+        self.total_bytes: Optional[int] = total_bytes
+        self.docs: int = docs
+        self._started: Optional[float] = None
+
+    def start(self) -> None:
+        """Démarre le chronomètre utilisé pour le débit et l'ETA."""
+        self._started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """Secondes écoulées depuis le démarrage."""
+        if self._started is None:
+            return 0.0
+        return time.monotonic() - self._started
+
+    def update(self, rows: int = 0, bytes_read: Optional[int] = None, docs: int = 0,
+               total_bytes: Optional[int] = None) -> None:
+        """
+        Incrémente les compteurs.
+
+        :param rows: Nombre de lignes traitées à ajouter
+        :param bytes_read: Nombre total d'octets lus depuis le début (valeur absolue)
+        :param docs: Nombre de documents indexés à ajouter
+        :param total_bytes: Taille totale de la source, si connue
+        """
+        self.rows += rows
+        self.docs += docs
+        if total_bytes is not None:
+            self.total_bytes = total_bytes
+        if bytes_read is not None:
+            self.bytes_read = bytes_read
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """Débit courant en lignes par seconde."""
+        elapsed = self.elapsed
+        if elapsed <= 0 or not self.rows:
+            return None
+        return self.rows / elapsed
+
+    def eta(self, done: int, total: Optional[int]) -> Optional[float]:
+        """
+        Estime le temps restant (secondes) à partir de l'avancement done/total.
+        """
+        if not total or not done or self._started is None:
+            return None
+        return max(self.elapsed / done * (total - done), 0.0)
+
+    def to_dict(self, done: int = 0, total: Optional[int] = None) -> Dict[str, Any]:
+        throughput = self.throughput
+        eta = self.eta(done, total)
+        return {
+            "rows": self.rows,
+            "bytes_read": self.bytes_read,
+            "total_bytes": self.total_bytes,
+            "docs": self.docs,
+            "throughput": round(throughput, 2) if throughput is not None else None,
+            "eta": round(eta, 2) if eta is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "ProgressCounters":
+        data = data or {}
+        return cls(
+            rows=data.get("rows", 0),
+            bytes_read=data.get("bytes_read", 0),
+            total_bytes=data.get("total_bytes"),
+            docs=data.get("docs", 0),
+        )
@@ -0,0 +1,64 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+
+from models.jobs.job import Job
+
+logger = logging.getLogger(__name__)
+
+
+class JobStore:
+    """
+    Persistance des jobs sur disque : un fichier JSON par job dans le dossier des jobs.
+    L'écriture passe par un fichier temporaire renommé afin de ne jamais laisser un fichier tronqué.
+    """
+
+    def __init__(self, folder: Union[str, Path]):
+        self._folder = Path(folder)
+        self._folder.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def folder(self) -> Path:
+        return self._folder
+
+    def _path(self, job_id: str) -> Path:
+        return self._folder / f"{job_id}.json"
+
+    def save(self, job: Job) -> None:
+        """Sauvegarde (ou remplace) l'état d'un job."""
+        path = self._path(job.id)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(job.dict, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+    def load(self, job_id: str) -> Optional[Job]:
+        """Charge un job à partir de son identifiant, ou None s'il n'existe pas."""
+        path = self._path(job_id)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return Job.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"JobStore - Impossible de lire le job {job_id} : {e}")
+            return None
+
+    def load_all(self) -> List[Job]:
+        """Charge tous les jobs persistés."""
+        jobs = []
+        for path in sorted(self._folder.glob("*.json")):
+            job = self.load(path.stem)
+            if job is not None:
+                jobs.append(job)
+        return jobs
+
+    def delete(self, job_id: str) -> bool:
+        """Supprime le fichier d'un job."""
+        path = self._path(job_id)
+        if not path.exists():
+            return False
+        path.unlink()
+        return True
@@ -7,7 +7,8 @@ from models.mapping_management.fields_management.remplacement import Replacement
 class PhoneticField(ReplacementField):
 
     def __init__(self, name: str, data: dict, config: Optional[Config] = None):
-        self._default_phonetic = {"soundex": False, "metaphone": False, "metaphone3": False}
+        self._default_phonetic = {"soundex": False, "metaphone": False, "metaphone3": False,
+                                  "doublemetaphone": False}
         super().__init__(name, data, config)
         data["type_completion"] = "phonetic"
         self._phonetics = Dict[str, bool]
@@ -52,6 +53,10 @@ class PhoneticField(ReplacementField):
     def is_metaphone3(self) -> bool:
         return self.phonetics.get("metaphone3", False)
 
+    @property
+    def is_doublemetaphone(self) -> bool:
+        return self.phonetics.get("doublemetaphone", False)
+
     @property
     def dict(self) -> Dict[str, Any]:
         data = super().dict
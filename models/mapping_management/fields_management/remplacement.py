@@ -4,6 +4,7 @@ from typing import List, Optional
 import pandas as pd
 
 from config import Config
+from models.file_management.completion.lookup import ReplacementTable, get_replacement_table
 from models.mapping_management.fields_management.base import BaseMappingField
 
 
@@ -80,28 +81,32 @@ class ReplacementField(BaseMappingField):
         """Nom du fichier contenant les correspondances."""
         return self._filename
 
+    @property
+    def filepath(self) -> Path:
+        """Chemin du fichier contenant les correspondances."""
+        return self._folder / self._filename
+
+    @property
+    def lookup_table(self) -> ReplacementTable:
+        """Table de correspondance du fichier, chargée une fois et partagée par le processus."""
+        return get_replacement_table(self.filepath, self._use_first_column)
+
     def load_all_values(self) -> pd.DataFrame:
         """
-        Charge l'ensemble des correspondances depuis le fichier CSV.
+        Retourne une copie des correspondances du fichier CSV, telles que chargées dans la table partagée :
+        valeurs lues en texte ('NA' reste 'NA'), une seule ligne par clé (la première du fichier).
         """
-        return pd.read_csv(self._folder / self._filename)
+        return self.lookup_table.frame.copy()
 
     def get_chunk_values(self, chunk_index: int = 0, exclude_first_column: bool = False) -> pd.DataFrame:
         """
-        Charge un chunk de données depuis le fichier CSV.
+        Retourne une copie d'un chunk des correspondances du fichier CSV (cf. load_all_values).
         """
-        skiprows = chunk_index * self._chunk_size
-        df_iter = pd.read_csv(
-            self._folder / self._filename,
-            skiprows=skiprows,
-            chunksize=self._chunk_size,
-            header=None
-        )
-
-        chunk = next(df_iter)
+        start = chunk_index * self._chunk_size
+        chunk = self.lookup_table.frame.iloc[start:start + self._chunk_size]
         if exclude_first_column:
             chunk = chunk.iloc[:, 1:]
-        return chunk
+        return chunk.copy()
 
     @property
     def type_completion(self) -> str:
@@ -3,7 +3,7 @@ from typing import Dict, Any, List, Union, Optional
 from config import Config
 import logging
 
-from models.file_management.readers.csv_file_reader import CsvFileReader
+from models.file_management.completion.catalog import get_completion_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +97,9 @@ class RequestRemplacementFieldsManager:
             if phonetic_info.get("metaphone3"):
                 column_names.append(f"{original_field}_metaphone3_primary")
                 column_names.append(f"{original_field}_metaphone3_secondary")
+            if phonetic_info.get("doublemetaphone"):
+                column_names.append(f"{original_field}_doublemetaphone_primary")
+                column_names.append(f"{original_field}_doublemetaphone_secondary")
 
         return column_names
 
@@ -104,7 +107,8 @@ class RequestRemplacementFieldsManager:
             self, mapping: dict
     ) -> Optional[List[str]]:
         """
-        Récupère les noms de colonnes depuis un fichier CSV spécifié dans le mapping.
+        Récupère les noms de colonnes depuis un fichier CSV spécifié dans le mapping
+        (entêtes gardés en mémoire par le catalogue des complétions).
 
         Args:
             mapping (dict): Dictionnaire de mapping.
@@ -116,22 +120,14 @@ class RequestRemplacementFieldsManager:
         filename = mapping.get("filename")
         if not filename or category not in {"remplacement", "phonetic"}:
             return None
-        ft = self._config.file_types
-        fpath = ft.completions.folder_path
-        filepath = fpath / filename
-
-        try:
-            csv_reader = CsvFileReader(filepath=filepath, config=self._config)
-            column_names = csv_reader.headers
-            if not column_names:
-                logger.error("Fichier CSV '%s' sans entêtes.", filename)
-                return None
-            return column_names
-        except Exception as e:
-            logger.error(
-                "Erreur lors de la lecture du fichier CSV '%s': %s", filename, e
-            )
+        column_names = get_completion_catalog(self._config).headers(filename)
+        if column_names is None:
+            logger.error("Fichier CSV '%s' introuvable ou illisible.", filename)
             return None
+        if not column_names:
+            logger.error("Fichier CSV '%s' sans entêtes.", filename)
+            return None
+        return column_names
 
 
 if __name__ == "__main__":
@@ -1,13 +1,57 @@
-from typing import List, Union, Any, Dict, Callable
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Union, Any, Dict, Callable, Hashable, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 
 from config import Config
-from ext_lib.phonetic import PhoneticWrapper
+from ext_lib.phonetic import PhoneticWrapper, get_library_registry
+from models.phonetc_basics.code_cache import code_cache_stats, get_code_cache
+from models.phonetc_basics.code_store import get_code_store, store_namespace
+from models.phonetc_basics.normalizer import PhoneticNormalizer
+
+# Paramètres d'encodage par algorithme : ils font partie de la clé du cache des codes
+CODE_LENGTH = 8
+METAPHONE3_ENCODE_VOWELS = False
+METAPHONE3_ENCODE_EXACT = True
+
+# Librairie C de chaque algorithme : son empreinte fait partie de l'espace de noms du dictionnaire persistant
+ALGORITHM_LIBRARIES = {"soundex": "phonex", "metaphone": "metaphone", "metaphone3": "metaphone3",
+                       "doublemetaphone": "doublemetaphone"}
+
+# Fonction d'encodage par lot : une colonne de codes par sortie de l'algorithme
+BatchEncoder = Callable[[List[str]], Tuple[np.ndarray, ...]]
+
+_pools: Dict[int, ThreadPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def get_encoding_pool(workers: int) -> ThreadPoolExecutor:
+    """
+    Pool de threads d'encodage partagé par le processus (un par nombre de workers).
+    Les bibliothèques C n'ont aucun état global modifiable (fonctions réentrantes)
+    et ctypes relâche le GIL pendant chaque appel : les sous-lots s'exécutent en parallèle.
+    """
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="phonetic")
+        return pool
 
 
 class PhoneticChunkEncoder:
     """
     Encode des données textuelles en phonétique selon différents algorithmes.
+    Si PHONETIC_NORMALIZATION l'active (désactivée par défaut), les valeurs sont d'abord normalisées (accents, casse,
+    ponctuation) afin que leurs variantes partagent un même code ; la colonne source éventuellement incluse reste
+    inchangée.
+    Chaque chunk est factorisé en valeurs uniques : seules celles absentes du cache des codes
+    (LRU partagé par le processus) sont envoyées aux bibliothèques C, puis les codes sont
+    rediffusés sur toutes les lignes.
+    Les valeurs absentes du cache sont ensuite recherchées par lot dans le dictionnaire phonétique persistant
+    (partagé entre fichiers) ; les nouveaux codes y sont enregistrés par lot.
+    Avec plusieurs workers, les valeurs à encoder sont découpées en sous-lots et les sous-lots de tous
+    les algorithmes activés s'exécutent en parallèle ; les résultats sont réassemblés dans l'ordre.
     """
 
     def __init__(
@@ -16,18 +60,42 @@ class PhoneticChunkEncoder:
             source_column: str,
             config: Config = None,
             include_source_column: bool = False,
+            workers: Optional[int] = None,
+            cache_size: Optional[int] = None,
+            use_store: Optional[bool] = None,
+            normalization: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Args:
-            phonex_dict: Dictionnaire d'activation des algorithmes (soundex, metaphone, metaphone3).
+            phonex_dict: Dictionnaire d'activation des algorithmes (soundex, american_soundex, metaphone, metaphone3,
+                doublemetaphone).
             source_column: Nom de la colonne source à encoder.
             config: Instance optionnelle de Config.
             include_source_column: Si True, inclut la colonne source dans le résultat.
+            workers: Nombre de threads d'encodage (par défaut PHONETIC_WORKERS ; 1 : encodage séquentiel).
+            cache_size: Taille du cache des codes (par défaut PHONETIC_CACHE_SIZE ; 0 : sans cache).
+            use_store: Consulte le dictionnaire persistant (par défaut si PHONETIC_STORE_MAX_ENTRIES > 0).
+            normalization: Étapes de normalisation (par défaut PHONETIC_NORMALIZATION ; vide : aucune).
         """
-        self._processor = PhoneticWrapper(config or Config())
+        config = config or Config()
+        self._config = config
+        self._processor = PhoneticWrapper(config)
         self._phonex_dict = phonex_dict
         self._source_column = source_column
         self._include_source_column = include_source_column
+        self._cache_size = config.phonetic_cache_size if cache_size is None else cache_size
+        self._workers = max(config.phonetic_workers if workers is None else workers, 1)
+        self._sub_batch_size = max(config.phonetic_sub_batch_size, 1)
+        self._store = get_code_store(config) if use_store is not False else None
+        self._normalizer = PhoneticNormalizer(config.phonetic_normalization if normalization is None
+                                              else normalization)
+        self._algorithms = self._build_algorithms()
+        self._namespaces: Dict[str, str] = {}
+        self._rows = 0
+        self._distinct_values = 0
+        self._unique_values = 0
+        self._encoded_values = 0
+        self._stored_values = 0
 
     def encode(self, chunk: Union[List[Any], pd.Series]) -> pd.DataFrame:
         """
@@ -46,15 +114,21 @@ class PhoneticChunkEncoder:
             source_df = pd.DataFrame({self._source_column: clean_chunk})
             dfs.append(source_df)
 
-        encoders: Dict[str, Callable[[List[str]], pd.DataFrame]] = {
-            "soundex": self._encode_soundex,
-            "metaphone": self._encode_metaphone,
-            "metaphone3": self._encode_metaphone3,
-        }
+        # Valeurs uniques + indices inverses : les noms sont très répétitifs.
+        # Seules les valeurs distinctes sont normalisées, puis leurs variantes regroupées.
+        inverse, uniques = pd.factorize(pd.Series(clean_chunk, dtype=object))
+        self._rows += len(clean_chunk)
+        self._distinct_values += len(uniques)
+        inverse, uniques = self._normalizer.regroup(inverse, uniques.tolist())
+        self._unique_values += len(uniques)
 
-        for algo, encoder in encoders.items():
-            if self._phonex_dict.get(algo):
-                dfs.append(encoder(clean_chunk))
+        # Tous les sous-lots de tous les algorithmes sont soumis avant d'attendre le premier résultat
+        enabled = [algo for algo in self._algorithms if self._phonex_dict.get(algo)]
+        plans = [self._plan(algo, uniques) for algo in enabled]
+        for algo, plan in zip(enabled, plans):
+            names = self._algorithms[algo][2]
+            columns = self._collect(plan)
+            dfs.append(pd.DataFrame({name: column[inverse] for name, column in zip(names, columns)}))
 
         if not dfs:
             raise ValueError("Aucun algorithme activé dans phonex_dict et source non demandée.")
@@ -67,17 +141,62 @@ class PhoneticChunkEncoder:
         Retourne les noms des colonnes générées selon les algorithmes activés.
         """
         names = []
-        if self._phonex_dict.get("soundex"):
-            names.append(f"{self._source_column}_soundex")
-        if self._phonex_dict.get("metaphone"):
-            names.append(f"{self._source_column}_metaphone")
-        if self._phonex_dict.get("metaphone3"):
-            names += [
-                f"{self._source_column}_metaphone3_primary",
-                f"{self._source_column}_metaphone3_secondary"
-            ]
+        for algo, (_, _, columns) in self._algorithms.items():
+            if self._phonex_dict.get(algo):
+                names += columns
         return names
 
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistiques de l'encodeur : lignes traitées, valeurs distinctes avant et après normalisation,
+        valeurs réellement encodées par la bibliothèque C, valeurs lues dans le dictionnaire persistant (les autres proviennent du cache),
+        métriques des caches et coût de chargement des librairies du processus.
+        """
+        return {
+            "rows": self._rows,
+            "distinct_values": self._distinct_values,
+            "unique_values": self._unique_values,
+            "encoded_values": self._encoded_values,
+            "stored_values": self._stored_values,
+            "workers": self._workers,
+            "cache": code_cache_stats(),
+            "libraries": get_library_registry().stats(),
+        }
+
+    def _build_algorithms(self) -> Dict[str, Tuple[Tuple[Hashable, ...], BatchEncoder, List[str]]]:
+        """Algorithme -> (paramètres d'encodage, fonction d'encodage par lot, colonnes générées)."""
+        processor = self._processor
+        metaphone3_params = (CODE_LENGTH, METAPHONE3_ENCODE_VOWELS, METAPHONE3_ENCODE_EXACT)
+        return {
+            "soundex": (
+                (CODE_LENGTH,),
+                lambda batch: (processor.soundex_encode_array(batch, CODE_LENGTH),),
+                [f"{self._source_column}_soundex"],
+            ),
+            "american_soundex": (
+                (CODE_LENGTH,),
+                lambda batch: (processor.american_soundex_encode_array(batch, CODE_LENGTH),),
+                [f"{self._source_column}_american_soundex"],
+            ),
+            "metaphone": (
+                (CODE_LENGTH,),
+                lambda batch: (processor.metaphone_encode_array(batch, CODE_LENGTH),),
+                [f"{self._source_column}_metaphone"],
+            ),
+            "metaphone3": (
+                metaphone3_params,
+                lambda batch: processor.metaphone3_encode_array(batch, *metaphone3_params),
+                [f"{self._source_column}_metaphone3_primary", f"{self._source_column}_metaphone3_secondary"],
+            ),
+            "doublemetaphone": (
+                (CODE_LENGTH,),
+                lambda batch: processor.doublemetaphone_encode_array(batch, CODE_LENGTH),
+                [f"{self._source_column}_doublemetaphone_primary",
+                 f"{self._source_column}_doublemetaphone_secondary"],
+            ),
+        }
+
     @staticmethod
     def _prepare_input(series: Union[pd.Series, List[Any]]) -> List[str]:
         """
@@ -89,30 +208,84 @@ class PhoneticChunkEncoder:
             series = pd.Series(series)
         return series.fillna("").astype(str).str.strip().tolist()
 
-    def _encode_soundex(self, clean_chunk: List[str]) -> pd.DataFrame:
+    def _plan(self, algorithm: str, uniques: List[str]) -> Dict[str, Any]:
         """
-        Encode avec Soundex.
+        Recherche les valeurs uniques dans le cache puis dans le dictionnaire persistant,
+        et soumet l'encodage des valeurs restantes par sous-lots.
         """
-        values = self._processor.phonex_encode(clean_chunk)
-        return pd.DataFrame({f"{self._source_column}_soundex": values})
+        params, encode, _ = self._algorithms[algorithm]
+        cache = get_code_cache(algorithm, params, self._cache_size) if self._cache_size and uniques else None
+        store = self._store if uniques else None
+        if cache is None and store is None:
+            codes, missing = None, np.arange(len(uniques))
+        elif cache is None:
+            codes, missing = [None] * len(uniques), np.arange(len(uniques))
+        else:
+            codes, missing = cache.lookup(uniques)
 
-    def _encode_metaphone(self, clean_chunk: List[str]) -> pd.DataFrame:
-        """
-        Encode avec Metaphone.
-        """
-        values = self._processor.metaphone_encode(clean_chunk)
-        return pd.DataFrame({f"{self._source_column}_metaphone": values})
+        namespace = self._store_namespace(algorithm, params) if store is not None else None
+        if store is not None and len(missing):
+            found = store.get_many(namespace, [uniques[i] for i in missing])
+            if found:
+                remaining = []
+                for i in missing:
+                    value_codes = found.get(uniques[i])
+                    if value_codes is None:
+                        remaining.append(i)
+                    else:
+                        codes[i] = value_codes
+                if cache is not None:
+                    cache.store(list(found), list(found.values()))
+                missing = np.asarray(remaining, dtype=np.intp)
+                self._stored_values += len(found)
+
+        missing_values = [uniques[i] for i in missing]
+        futures = [self._submit(encode, missing_values[start:start + self._sub_batch_size])
+                   for start in range(0, len(missing_values), self._sub_batch_size)] or [self._submit(encode, [])]
+        self._encoded_values += len(missing_values)
+        return {"cache": cache, "store": store, "namespace": namespace, "codes": codes, "missing": missing,
+                "missing_values": missing_values, "futures": futures}
 
-    def _encode_metaphone3(self, clean_chunk: List[str]) -> pd.DataFrame:
+    def _store_namespace(self, algorithm: str, params: Tuple[Hashable, ...]) -> str:
+        namespace = self._namespaces.get(algorithm)
+        if namespace is None:
+            lib_name = ALGORITHM_LIBRARIES.get(algorithm)
+            library = get_library_registry().fingerprint(lib_name, self._config) if lib_name else None
+            namespace = self._namespaces[algorithm] = store_namespace(algorithm, params, library)
+        return namespace
+
+    def _collect(self, plan: Dict[str, Any]) -> List[np.ndarray]:
         """
-        Encode avec Metaphone3 en séparant primary/secondary.
+        Réassemble les sous-lots dans l'ordre, alimente le cache et le dictionnaire persistant,
+        et retourne une colonne de codes par sortie de l'algorithme, alignée sur les valeurs uniques.
         """
-        encoded = self._processor.metaphone3_encode(clean_chunk)
-        primaries, secondaries = zip(*encoded) if encoded else ([], [])
-        return pd.DataFrame({
-            f"{self._source_column}_metaphone3_primary": primaries,
-            f"{self._source_column}_metaphone3_secondary": secondaries
-        })
+        batches = [future.result() for future in plan["futures"]]
+        encoded = [np.concatenate(parts) for parts in zip(*batches)]
+        codes = plan["codes"]
+        if codes is None:
+            return encoded
+
+        missing = plan["missing"]
+        if len(missing):
+            rows = list(zip(*(column.tolist() for column in encoded)))
+            if plan["cache"] is not None:
+                plan["cache"].store(plan["missing_values"], rows)
+            if plan["store"] is not None:
+                plan["store"].put_many(plan["namespace"], plan["missing_values"], rows)
+            for i, value_codes in zip(missing, rows):
+                codes[i] = value_codes
+        return [np.asarray(column, dtype=str) for column in zip(*codes)]
+
+    def _submit(self, encode: BatchEncoder, batch: List[str]) -> Future:
+        """Exécute un sous-lot dans le pool d'encodage, ou immédiatement en mode séquentiel."""
+        if self._workers > 1:
+            return get_encoding_pool(self._workers).submit(encode, batch)
+        future: Future = Future()
+        try:
+            future.set_result(encode(batch))
+        except Exception as e:
+            future.set_exception(e)
+        return future
 
 
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
+
+import numpy as np
+
+
+class PhoneticCodeCache:
+    """
+    Cache LRU borné valeur -> codes phonétiques pour un algorithme et un jeu de paramètres donnés.
+    Partagé entre chunks et entre requêtes (voir get_code_cache) ; protégé par un verrou.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        :param max_size: Nombre maximal de valeurs conservées (les moins récemment utilisées sont évincées)
+        """
+        self._max_size = max(max_size, 1)
+        self._entries: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def lookup(self, values: Sequence[str]) -> Tuple[List[Any], np.ndarray]:
+        """
+        Recherche un lot de valeurs.
+
+        :return: Codes connus (None pour les valeurs absentes) et positions des valeurs absentes.
+        """
+        found: List[Any] = [None] * len(values)
+        missing: List[int] = []
+        with self._lock:
+            entries = self._entries
+            for i, value in enumerate(values):
+                codes = entries.get(value)
+                if codes is None:
+                    missing.append(i)
+                else:
+                    entries.move_to_end(value)
+                    found[i] = codes
+            self._hits += len(values) - len(missing)
+            self._misses += len(missing)
+        return found, np.asarray(missing, dtype=np.intp)
+
+    def store(self, values: Sequence[str], codes: Sequence[Tuple[str, ...]]) -> None:
+        """Enregistre les codes d'un lot de valeurs en évinçant les plus anciennes au-delà de la taille maximale."""
+        with self._lock:
+            entries = self._entries
+            for value, value_codes in zip(values, codes):
+                entries[value] = value_codes
+                entries.move_to_end(value)
+            while len(entries) > self._max_size:
+                entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "max_size": self._max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+_caches: Dict[Tuple[Hashable, ...], PhoneticCodeCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_code_cache(algorithm: str, params: Tuple[Hashable, ...], max_size: int) -> PhoneticCodeCache:
+    """
+    Retourne le cache du processus associé à un algorithme et à ses paramètres (longueur, options) :
+    deux jeux de paramètres différents ne partagent jamais leurs codes.
+    """
+    key = (algorithm, *params)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = PhoneticCodeCache(max_size)
+        return cache
+
+
+def code_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Métriques (taille, succès, échecs, taux de succès) de chaque cache du processus."""
+    with _caches_lock:
+        caches = dict(_caches)
+    return {":".join(str(part) for part in key): cache.to_dict() for key, cache in caches.items()}
+
+
+def clear_code_caches() -> None:
+    """Vide tous les caches du processus."""
+    with _caches_lock:
+        _caches.clear()
@@ -0,0 +1,206 @@
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Séparateur des codes d'une valeur (codes phonétiques ASCII : jamais présent dans un code)
+_CODES_SEPARATOR = "\x1f"
+# Nombre maximal de paramètres par requête SQLite
+_SQL_BATCH = 900
+# La compaction automatique se déclenche au-delà de max_entries + 10 %
+_COMPACTION_MARGIN = 1.1
+# Date de dernière utilisation rafraîchie au plus une fois par heure (évite une écriture à chaque lecture)
+_TOUCH_INTERVAL = 3600
+
+
+def _batched(values: Sequence[Any], size: int = _SQL_BATCH) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class PhoneticCodeStore:
+    """
+    Dictionnaire phonétique persistant (SQLite) partagé entre fichiers et redémarrages :
+    (algorithme et paramètres, valeur) -> code(s).
+    Les lectures et écritures se font par lots. Le nombre d'entrées est borné : au-delà, les entrées
+    les moins récemment utilisées sont supprimées (compaction).
+    Une connexion par thread ; le mode WAL permet des lectures concurrentes pendant une écriture.
+    """
+
+    def __init__(self, filepath: Union[str, Path], max_entries: int):
+        """
+        :param filepath: Fichier SQLite (créé au premier accès)
+        :param max_entries: Nombre maximal d'entrées conservées
+        """
+        self._filepath = Path(filepath)
+        self._max_entries = max(max_entries, 1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._approx_count: Optional[int] = None
+
+    @property
+    def filepath(self) -> Path:
+        return self._filepath
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self._filepath.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._filepath, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS codes ("
+                " namespace TEXT NOT NULL, value TEXT NOT NULL, codes TEXT NOT NULL, last_used INTEGER NOT NULL,"
+                " PRIMARY KEY (namespace, value)) WITHOUT ROWID"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS codes_last_used ON codes (last_used)")
+            connection.commit()
+            self._local.connection = connection
+        return connection
+
+    def get_many(self, namespace: str, values: Sequence[str]) -> Dict[str, Tuple[str, ...]]:
+        """
+        Recherche un lot de valeurs et marque les entrées trouvées comme récemment utilisées
+        (à l'heure près : seules les dates plus anciennes que _TOUCH_INTERVAL sont réécrites).
+
+        :param namespace: Algorithme et paramètres (ex. 'metaphone3:8:False:True')
+        :return: Valeur -> codes, pour les valeurs présentes uniquement.
+        """
+        found: Dict[str, Tuple[str, ...]] = {}
+        if not values:
+            return found
+        now = int(time.time())
+        stale: List[str] = []
+        connection = self._connection
+        for batch in _batched(values):
+            placeholders = ",".join("?" * len(batch))
+            rows = connection.execute(
+                f"SELECT value, codes, last_used FROM codes WHERE namespace = ? AND value IN ({placeholders})",
+                (namespace, *batch),
+            ).fetchall()
+            for value, codes, last_used in rows:
+                found[value] = tuple(codes.split(_CODES_SEPARATOR))
+                if now - last_used >= _TOUCH_INTERVAL:
+                    stale.append(value)
+        if stale:
+            with connection:
+                connection.executemany(
+                    "UPDATE codes SET last_used = ? WHERE namespace = ? AND value = ?",
+                    ((now, namespace, value) for value in stale),
+                )
+        return found
+
+    def put_many(self, namespace: str, values: Sequence[str], codes: Sequence[Tuple[str, ...]]) -> None:
+        """Enregistre les codes d'un lot de valeurs en une transaction, puis compacte si la limite est dépassée."""
+        if not values:
+            return
+        now = int(time.time())
+        connection = self._connection
+        with connection:
+            connection.executemany(
+                "INSERT INTO codes (namespace, value, codes, last_used) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (namespace, value) DO UPDATE SET codes = excluded.codes, last_used = excluded.last_used",
+                ((namespace, value, _CODES_SEPARATOR.join(value_codes), now)
+                 for value, value_codes in zip(values, codes)),
+            )
+        with self._lock:
+            if self._approx_count is None:
+                self._approx_count = self.count()
+            else:
+                self._approx_count += len(values)
+            over_limit = self._approx_count > self._max_entries * _COMPACTION_MARGIN
+        if over_limit:
+            self.compact(vacuum=False)
+
+    def count(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM codes").fetchone()[0]
+
+    def compact(self, max_entries: Optional[int] = None, vacuum: bool = True) -> int:
+        """
+        Supprime les entrées les moins récemment utilisées au-delà de la limite, puis récupère
+        l'espace disque (VACUUM).
+
+        :param max_entries: Limite à appliquer (par défaut celle du store)
+        :param vacuum: Réécrit le fichier pour libérer l'espace
+        :return: Nombre d'entrées supprimées
+        """
+        limit = self._max_entries if max_entries is None else max(max_entries, 0)
+        connection = self._connection
+        excess = self.count() - limit
+        removed = 0
+        if excess > 0:
+            with connection:
+                removed = connection.execute(
+                    "DELETE FROM codes WHERE (namespace, value) IN"
+                    " (SELECT namespace, value FROM codes ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                ).rowcount
+            logger.info(f"PhoneticCodeStore - {removed} entrées supprimées (limite {limit})")
+        if vacuum:
+            connection.execute("VACUUM")
+        with self._lock:
+            self._approx_count = self.count()
+        return removed
+
+    def clear(self) -> None:
+        with self._connection as connection:
+            connection.execute("DELETE FROM codes")
+        with self._lock:
+            self._approx_count = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "filepath": str(self._filepath),
+            "entries": self.count(),
+            "max_entries": self._max_entries,
+            "size_bytes": self._filepath.stat().st_size if self._filepath.exists() else 0,
+        }
+
+    def close(self) -> None:
+        """Ferme la connexion du thread courant."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+_stores: Dict[Path, PhoneticCodeStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_code_store(config: Optional[Config] = None) -> Optional[PhoneticCodeStore]:
+    """
+    Store partagé par le processus pour le fichier configuré, ou None si le dictionnaire persistant
+    est désactivé (PHONETIC_STORE_MAX_ENTRIES=0).
+    """
+    config = config or Config()
+    if config.phonetic_store_max_entries <= 0:
+        return None
+    filepath = Path(config.phonetic_store_filepath)
+    with _stores_lock:
+        store = _stores.get(filepath)
+        if store is None:
+            store = _stores[filepath] = PhoneticCodeStore(filepath, config.phonetic_store_max_entries)
+        return store
+
+
+def store_namespace(algorithm: str, params: Sequence[Any], library: Optional[str] = None) -> str:
+    """
+    Clé d'espace de noms d'un algorithme et de ses paramètres (même forme que les clés du cache), suivie de
+    l'empreinte de la librairie qui a produit les codes : une autre compilation ne relit pas les anciens codes.
+    """
+    parts = (algorithm, *params) if library is None else (algorithm, *params, library)
+    return ":".join(str(part) for part in parts)
+
@@ -0,0 +1,90 @@
+import threading
+import unicodedata
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Étapes disponibles, appliquées dans cet ordre
+NORMALIZATION_STEPS = ("nfkd", "accents", "casefold", "punctuation")
+# Ligatures et lettres sans décomposition NFKD
+_LIGATURES = {"œ": "oe", "Œ": "OE", "æ": "ae", "Æ": "AE", "ø": "o", "Ø": "O", "ł": "l", "Ł": "L", "đ": "d", "Đ": "D"}
+# Apostrophes supprimées (O'Neil -> ONeil) ; les autres ponctuations séparent les mots
+_APOSTROPHES = {"'", "’", "‘", "`", "´"}
+
+_tables: Dict[Tuple[str, ...], Dict[int, str]] = {}
+_tables_lock = threading.Lock()
+
+
+def _translate_char(char: str, steps: Tuple[str, ...]) -> str:
+    """Applique les étapes de normalisation à un caractère."""
+    if "nfkd" in steps:
+        char = unicodedata.normalize("NFKD", char)
+    if "accents" in steps:
+        char = "".join(_LIGATURES.get(c, c) for c in char if not unicodedata.combining(c))
+    if "casefold" in steps:
+        char = char.casefold()
+    if "punctuation" in steps:
+        char = "".join("" if c in _APOSTROPHES else " " if unicodedata.category(c)[0] in "PS" else c for c in char)
+    return char
+
+
+class PhoneticNormalizer:
+    """
+    Normalise les valeurs avant l'encodage phonétique (décomposition NFKD, suppression des accents,
+    casefold, suppression de la ponctuation) : 'Hélène', 'HELENE' et 'helene' deviennent une seule valeur,
+    encodée une seule fois.
+    Les étapes sont appliquées caractère par caractère via une table de traduction partagée par le processus,
+    complétée au fil des caractères rencontrés : une valeur est traduite par un seul str.translate.
+    """
+
+    def __init__(self, steps: Sequence[str]):
+        """
+        :param steps: Étapes à appliquer parmi NORMALIZATION_STEPS (vide : aucune normalisation)
+        :raises ValueError: Si une étape est inconnue.
+        """
+        unknown = set(steps) - set(NORMALIZATION_STEPS)
+        if unknown:
+            raise ValueError(f"Étapes de normalisation inconnues : {sorted(unknown)}")
+        self._steps = tuple(step for step in NORMALIZATION_STEPS if step in steps)
+        with _tables_lock:
+            self._table = _tables.setdefault(self._steps, {})
+
+    @property
+    def steps(self) -> Tuple[str, ...]:
+        return self._steps
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._steps)
+
+    def normalize(self, values: List[str]) -> List[str]:
+        """Normalise une liste de valeurs (les espaces multiples sont réduits, les bords supprimés)."""
+        if not self._steps or not values:
+            return values
+        self._extend_table(values)
+        table = self._table
+        return [" ".join(value.translate(table).split()) for value in values]
+
+    def regroup(self, inverse: np.ndarray, uniques: List[str]) -> Tuple[np.ndarray, List[str]]:
+        """
+        Normalise les valeurs uniques d'un chunk factorisé et regroupe les variantes devenues identiques.
+
+        :param inverse: Indices des lignes dans uniques
+        :param uniques: Valeurs distinctes du chunk
+        :return: Indices des lignes dans les valeurs normalisées, valeurs normalisées distinctes
+        """
+        if not self._steps:
+            return inverse, uniques
+        normalized_inverse, normalized = pd.factorize(pd.Series(self.normalize(uniques), dtype=object))
+        return normalized_inverse[inverse], normalized.tolist()
+
+    def _extend_table(self, values: List[str]) -> None:
+        """Ajoute à la table les caractères non encore rencontrés."""
+        table = self._table
+        new_chars = {char for char in set("".join(values)) if ord(char) not in table}
+        if not new_chars:
+            return
+        translations = {ord(char): _translate_char(char, self._steps) for char in new_chars}
+        with _tables_lock:
+            table.update(translations)
@@ -1,17 +1,40 @@
-from typing import Dict
+from typing import Dict, Optional
 import logging
 
+from config import Config
+from ext_lib.phonetic.wrappers.registry import get_library_registry
+
 logger = logging.getLogger(__name__)
 
+# Algorithmes dont la librairie n'est pas livrée avec l'application : algorithme -> librairie
+OPTIONAL_ALGORITHM_LIBRARIES = {"doublemetaphone": "doublemetaphone"}
+
+
+def is_algorithm_available(algorithm: str, config: Optional[Config] = None) -> bool:
+    """Indique si la librairie d'un algorithme est disponible (toujours vrai pour les librairies livrées)."""
+    lib_name = OPTIONAL_ALGORITHM_LIBRARIES.get(algorithm)
+    return lib_name is None or get_library_registry().is_available(lib_name, config)
+
+
 class PhoneticDictValidator:
 
-    def __init__(self, user_dict: Dict[str, bool]):
-        self._default_dict = {"soundex": False, "metaphone": False, "metaphone3": False}
+    def __init__(self, user_dict: Dict[str, bool], config: Optional[Config] = None):
+        self._default_dict = {"soundex": False, "american_soundex": False, "metaphone": False, "metaphone3": False,
+                              "doublemetaphone": False}
         self._user_dict = user_dict
+        self._config = config
 
     def validate(self) -> Dict[str, bool]:
-        """Valide et nettoie le dictionnaire des algorithmes phonétiques."""
+        """
+        Valide et nettoie le dictionnaire des algorithmes phonétiques.
+
+        :raises ValueError: Si un algorithme demandé n'a pas sa librairie dans ext_lib.
+        """
         if not isinstance(self._user_dict, dict):
             logger.error("PhoneticChunkTransformer - phonex_dict doit être un dictionnaire")
-            return self._default_dict
-        return {k: self._user_dict.get(k, False) for k in self._default_dict}
\ No newline at end of file
+            return dict(self._default_dict)
+        validated = {k: self._user_dict.get(k, False) for k in self._default_dict}
+        for algorithm in OPTIONAL_ALGORITHM_LIBRARIES:
+            if validated[algorithm] and not is_algorithm_available(algorithm, self._config):
+                raise ValueError(f"Algorithme phonétique indisponible (librairie absente) : {algorithm}")
+        return validated
\ No newline at end of file
@@ -0,0 +1,102 @@
+import json
+from typing import Any, Iterator
+
+from flask import Blueprint, Response, jsonify, stream_with_context
+import logging
+
+from config import Config
+from models.jobs import get_job_manager
+from routes.handle_payload import handle_json_payload
+
+logger = logging.getLogger(__name__)
+config = Config()
+
+jobs_road = Blueprint("jobs_road", __name__)
+
+# Délai (secondes) après lequel un commentaire keep-alive est envoyé si rien n'a changé
+SSE_KEEPALIVE = 15.0
+
+
+@jobs_road.route("/jobs/submit/<job_type>", methods=["POST"])
+def submit_job(job_type: str) -> Any:
+    """
+    Ajoute un traitement long à la file des jobs et retourne immédiatement son identifiant.
+
+    Returns:
+        Flask Response: 202 avec l'identifiant du job, 400 si le payload ou le type est invalide.
+    """
+    payload = handle_json_payload()
+    if payload is False:
+        return jsonify({"error": "JSON invalide"}), 400
+    try:
+        job = get_job_manager(config).submit(job_type, payload)
+    except ValueError as e:
+        logger.error(f"Soumission de job refusée : {e}")
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"job_id": job.id, "status": job.status}), 202
+
+
+@jobs_road.route("/jobs/", methods=["GET"])
+def list_jobs() -> Any:
+    """
+    Liste l'ensemble des jobs connus.
+    """
+    jobs = get_job_manager(config).list()
+    return jsonify([job.dict for job in jobs]), 200
+
+
+@jobs_road.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id: str) -> Any:
+    """
+    Retourne le statut et la progression d'un job.
+    """
+    job = get_job_manager(config).get(job_id)
+    if job is None:
+        return jsonify({"error": "Job introuvable"}), 404
+    return jsonify(job.dict), 200
+
+
+def _job_events(job_id: str) -> Iterator[str]:
+    """
+    Génère les évènements SSE d'un job : un message `progress` à chaque mise à jour,
+    puis un message `end` lorsque le job est terminé. Sans mise à jour pendant SSE_KEEPALIVE secondes,
+    seul un commentaire `: keepalive` est envoyé pour maintenir la connexion.
+    """
+    manager = get_job_manager(config)
+    version = manager.version
+    while True:
+        job = manager.get(job_id)
+        payload = json.dumps(job.dict, default=str)
+        if job.is_finished:
+            yield f"event: end\ndata: {payload}\n\n"
+            return
+        yield f"event: progress\ndata: {payload}\n\n"
+        new_version = manager.wait_for_update(version, timeout=SSE_KEEPALIVE)
+        while new_version == version:
+            yield ": keepalive\n\n"
+            new_version = manager.wait_for_update(version, timeout=SSE_KEEPALIVE)
+        version = new_version
+
+
+@jobs_road.route("/jobs/<job_id>/events", methods=["GET"])
+def job_events(job_id: str) -> Any:
+    """
+    Flux server-sent events de la progression d'un job (lignes, octets, documents, débit, ETA).
+    """
+    if get_job_manager(config).get(job_id) is None:
+        return jsonify({"error": "Job introuvable"}), 404
+    return Response(
+        stream_with_context(_job_events(job_id)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@jobs_road.route("/jobs/<job_id>/cancel", methods=["POST"])
+def cancel_job(job_id: str) -> Any:
+    """
+    Demande l'annulation d'un job en attente ou en cours.
+    """
+    if not get_job_manager(config).cancel(job_id):
+        return jsonify({"error": "Job introuvable ou déjà terminé"}), 404
+    return jsonify({"success": True}), 200
@@ -129,13 +129,14 @@ async function addPhoneticColumnToFile() {
 }
 
 /**
- * Récupère les valeurs des switches (Soundex, Metaphone, Double Metaphone) dans la card.
+ * Récupère les valeurs des switches (Soundex, Metaphone, Metaphone3, Double Metaphone) dans la card.
  */
 function getAllPhoneticValues() {
     return {
         "soundex": isChecked("switch-soundex"),
         "metaphone": isChecked("switch-metaphone"),
-        "metaphone3": isChecked("switch-dblmetaphone")
+        "metaphone3": isChecked("switch-dblmetaphone"),
+        "doublemetaphone": isChecked("switch-doublemetaphone")
     };
 }
 
@@ -148,7 +148,7 @@ function defineMappingPhonexFieldInfos(fieldName, sourceField) {
         type_completion: "phonetic",
         original_field: sourceField,
         column_names: [sourceField],
-        phonetic: { soundex: false, metaphone: false, metaphone3: false }
+        phonetic: { soundex: false, metaphone: false, metaphone3: false, doublemetaphone: false }
     };
 }
 
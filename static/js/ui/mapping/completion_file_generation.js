@@ -1,7 +1,7 @@
 import { getEncodedFilepathMappingDatas } from "./getters-mapping.js";
 import { queryRemplacementFile } from "../../loader/generate_remplacement.js";
 
-const PHONEX_MAPPING_FIELDS_TYPES = ["soundex", "metaphone", "metaphone3"];
+const PHONEX_MAPPING_FIELDS_TYPES = ["soundex", "metaphone", "metaphone3", "doublemetaphone"];
 
 /**
  * Génère un fichier de remplacement à partir des informations du champ caché.
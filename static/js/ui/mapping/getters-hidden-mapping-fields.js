@@ -1,7 +1,7 @@
 import { getSwitchValue } from "./utils-mapping.js";
 import { getMappingRowDescriptionBySourceName } from "./getters-mapping.js";
 
-const PHONEX_MAPPING_FIELDS_TYPES = ["soundex", "metaphone", "metaphone3"];
+const PHONEX_MAPPING_FIELDS_TYPES = ["soundex", "metaphone", "metaphone3", "doublemetaphone"];
 
 // ----------- Helpers génériques -----------
 function getDivMappingFieldByAttributeName(divs, attrName, valueSearch) {
@@ -91,6 +91,22 @@ class TestElasticSearchTools(unittest.TestCase):
             result = self.tools.bulk_import("index", [{"field": "value"}])
             self.assertTrue(result)
 
+    @patch("elastic_manager.estools.helpers.bulk")
+    def test_bulk_import_upsert_with_ids(self, mock_bulk):
+        with patch.object(self.tools, 'es_connection') as mock_ctx:
+            mock_ctx.return_value.__enter__.return_value = self.mock_es
+            result = self.tools.bulk_import("index", [{"field": "value", "_id": "x"}], ids=["abc"], op_type="update")
+            self.assertTrue(result)
+        action = mock_bulk.call_args.args[1][0]
+        self.assertEqual(action["_id"], "abc")
+        self.assertEqual(action["_op_type"], "update")
+        self.assertTrue(action["doc_as_upsert"])
+        self.assertEqual(action["doc"]["field"], "value")
+        self.assertNotIn("_id", action["doc"])
+
+    def test_bulk_import_update_requires_ids(self):
+        self.assertFalse(self.tools.bulk_import("index", [{"field": "value"}], op_type="update"))
+
     def test_update_doc(self):
         self.tools.is_index_exist = MagicMock(return_value=True)
         with patch.object(self.tools, 'es_connection') as mock_ctx:
@@ -0,0 +1,97 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
+import pandas as pd
+
+from config import Config
+from models.file_management.file_modifier.csv_file_modifier import CsvChunkAutoModifier
+from models.file_management.overlay import ColumnOverlay
+from models.file_management.readers.csv_file_reader import CsvFileReader
+
+
+class TestColumnOverlay(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        patcher = patch.object(Config, "overlay_folder", new_callable=PropertyMock,
+                               return_value=self.folder / "overlays")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.filepath = self.folder / "data.csv"
+        self.filepath.write_text("id;nom;ville\n1;Dupont;Paris\n2;Durand;Lyon\n3;Martin;Nantes\n4;Petit;Lille\n"
+                                 "5;Roux;Brest\n", encoding="utf-8")
+        self.base_content = self.filepath.read_bytes()
+
+    def _add_upper_column(self, chunk_size: int = 2) -> None:
+        reader = CsvFileReader(str(self.filepath), sep=";", chunk_size=chunk_size)
+        modifier = CsvChunkAutoModifier(reader, "nom", lambda s: pd.DataFrame({"u": s.str.upper(), "l": s.str.lower()}),
+                                        ["nom_upper", "nom_lower"])
+        modifier.process_to_overlay()
+
+    def test_columns_are_joined_without_rewriting_the_file(self):
+        self._add_upper_column()
+        self.assertEqual(self.filepath.read_bytes(), self.base_content)
+
+        reader = CsvFileReader(str(self.filepath), sep=";", chunk_size=2)
+        self.assertEqual(reader.headers, ["id", "nom", "nom_upper", "nom_lower", "ville"])
+        self.assertEqual(reader.get_chunk(chunk_index=1)["nom_upper"].tolist(), ["MARTIN", "PETIT"])
+        self.assertEqual(reader.get_all()["nom_lower"].tolist(), ["dupont", "durand", "martin", "petit", "roux"])
+        chunks = list(reader.iter_chunks())
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(chunks[2].columns.tolist(), reader.headers)
+        self.assertEqual(CsvFileReader(str(self.filepath), sep=";", use_overlay=False).headers, ["id", "nom", "ville"])
+
+    def test_iter_columns_reads_values_verbatim_with_overlay_columns(self):
+        self.filepath.write_text("id;nom;ville\n1;Dupont;Paris\n2;NA;Lyon\n3;;Nantes\n", encoding="utf-8")
+        self._add_upper_column()
+        reader = CsvFileReader(str(self.filepath), sep=";", chunk_size=2)
+        base_only = pd.concat(reader.iter_columns(["nom"]))
+        mixed = pd.concat(reader.iter_columns(["nom_upper", "nom"]))
+        self.assertEqual(base_only["nom"].tolist(), ["Dupont", "NA", ""])
+        self.assertEqual(mixed["nom"].tolist(), base_only["nom"].tolist())
+        self.assertEqual(mixed["nom_upper"].tolist()[0], "DUPONT")
+        self.assertFalse(mixed.isna().any().any())
+
+    def test_export_materializes_merged_file(self):
+        self._add_upper_column()
+        output = CsvFileReader(str(self.filepath), sep=";").export(self.folder / "merged.csv")
+        merged = pd.read_csv(output, sep=";", dtype=str)
+        self.assertEqual(merged.columns.tolist(), ["id", "nom", "nom_upper", "nom_lower", "ville"])
+        self.assertEqual(merged["nom_upper"].tolist(), ["DUPONT", "DURAND", "MARTIN", "PETIT", "ROUX"])
+
+    def test_adding_same_columns_again_replaces_them(self):
+        self._add_upper_column()
+        self._add_upper_column(chunk_size=3)
+        overlay = ColumnOverlay(self.filepath)
+        self.assertEqual(overlay.column_names, ["nom_upper", "nom_lower"])
+        self.assertEqual(len(list(overlay.folder.glob("*.csv"))), 2)
+
+    def test_columns_are_ignored_when_base_file_changes(self):
+        self._add_upper_column()
+        with self.filepath.open("a", encoding="utf-8") as f:
+            f.write("6;Moreau;Caen\n")
+        self.assertEqual(CsvFileReader(str(self.filepath), sep=";").headers, ["id", "nom", "ville"])
+
+    def test_failed_chunk_leaves_no_column(self):
+        reader = CsvFileReader(str(self.filepath), sep=";", chunk_size=2)
+        calls = []
+
+        def failing(series):
+            calls.append(len(series))
+            if len(calls) == 2:
+                raise ValueError("échec")
+            return pd.DataFrame({"u": series.str.upper()})
+
+        with self.assertRaises(RuntimeError):
+            CsvChunkAutoModifier(reader, "nom", failing, ["nom_upper"]).process_to_overlay()
+        overlay = ColumnOverlay(self.filepath)
+        self.assertEqual(overlay.column_names, [])
+        self.assertEqual(list(overlay.folder.glob("*")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
+import pandas as pd
+
+from config import Config
+from models.file_management.file_modifier.column_pipeline import ColumnPipeline, ColumnTransform, build_transform
+from models.file_management.filepath_codec import FilePathCodec
+from models.file_management.readers.csv_file_reader import CsvFileReader
+
+
+class TestColumnPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        patcher = patch.object(Config, "overlay_folder", new_callable=PropertyMock,
+                               return_value=self.folder / "overlays")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.filepath = self.folder / "data.csv"
+        pd.DataFrame({"id": range(5), "nom": ["Hélène", "Dupont", "Durand", "Martin", "Petit"],
+                      "ville": ["Paris", "Lyon", "Nantes", "Lille", "Brest"]}) \
+            .to_csv(self.filepath, index=False, sep=";")
+        self.spec = {
+            "filepath": FilePathCodec.encode(str(self.filepath)),
+            "sep": ";",
+            "transforms": [
+                {"type": "upper", "column": "nom"},
+                {"type": "normalize", "column": "nom_upper", "steps": ["nfkd", "accents"]},
+                {"type": "lower", "column": "ville", "output_columns": ["ville_min"], "after": "id"},
+            ],
+        }
+
+    def _pipeline(self) -> ColumnPipeline:
+        pipeline = ColumnPipeline.from_spec(self.spec)
+        pipeline.csv_reader.chunk_size = 2
+        return pipeline
+
+    def test_all_transforms_in_one_read_pass(self):
+        pipeline = self._pipeline()
+        output_path = self.folder / "output.csv"
+        with patch.object(CsvFileReader, "iter_chunks", autospec=True,
+                          side_effect=CsvFileReader.iter_chunks) as iter_chunks:
+            pipeline.process_and_save(str(output_path))
+        self.assertEqual(iter_chunks.call_count, 1)
+        output = pd.read_csv(output_path, sep=";", dtype=str)
+        self.assertEqual(output.columns.tolist(),
+                         ["id", "ville_min", "nom", "nom_upper", "nom_upper_normalized", "ville"])
+        self.assertEqual(output["nom_upper_normalized"].tolist(), ["HELENE", "DUPONT", "DURAND", "MARTIN", "PETIT"])
+        self.assertEqual(output["ville_min"].tolist(), ["paris", "lyon", "nantes", "lille", "brest"])
+
+    def test_overlay_mode_keeps_source_file(self):
+        before = self.filepath.read_bytes()
+        result = self._pipeline().run("overlay")
+        self.assertEqual(result["columns"], ["nom_upper", "nom_upper_normalized", "ville_min"])
+        self.assertEqual(self.filepath.read_bytes(), before)
+        reader = CsvFileReader(str(self.filepath), sep=";")
+        self.assertEqual(reader.headers, ["id", "ville_min", "nom", "nom_upper", "nom_upper_normalized", "ville"])
+        self.assertEqual(reader.get_all()["nom_upper"].tolist(), ["HÉLÈNE", "DUPONT", "DURAND", "MARTIN", "PETIT"])
+
+    def test_failed_transform_cancels_all_columns(self):
+        def failing(series):
+            raise ValueError("échec")
+
+        reader = CsvFileReader(str(self.filepath), sep=";")
+        pipeline = ColumnPipeline(reader, [build_transform({"type": "upper", "column": "nom"}),
+                                           ColumnTransform("ville", failing, ["ville_x"])])
+        with self.assertRaises(RuntimeError):
+            pipeline.process_to_overlay()
+        self.assertEqual(CsvFileReader(str(self.filepath), sep=";").headers, ["id", "nom", "ville"])
+
+    def test_invalid_spec(self):
+        with self.assertRaises(ValueError):
+            build_transform({"type": "inconnu", "column": "nom"})
+        with self.assertRaises(ValueError):
+            self._pipeline().plan_headers(["id", "nom", "nom_upper", "ville"])
+
+
+if __name__ == "__main__":
+    unittest.main()
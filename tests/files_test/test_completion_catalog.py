@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from models.file_management.completion.catalog import CompletionCatalog, CompletionFileInfo
+
+
+class TestCompletionCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        (self.folder / "synonymes.csv").write_text("nom;syn1;syn2\nParis;Lutèce;\nLyon;;\n", encoding="utf-8")
+        self.catalog = CompletionCatalog(self.folder)
+
+    def _touch(self, path: Path) -> None:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def test_infos_are_cached_until_file_changes(self):
+        info = self.catalog.get("synonymes.csv")
+        self.assertEqual((info.headers, info.sep, info.rows), (["nom", "syn1", "syn2"], ";", 2))
+        with patch.object(CompletionFileInfo, "__init__", side_effect=AssertionError("relecture")):
+            self.assertIs(self.catalog.get("synonymes.csv"), info)
+
+        path = self.folder / "synonymes.csv"
+        path.write_text("terme,alt\nParis,Paname\n", encoding="utf-8")
+        self._touch(path)
+        self.assertEqual(self.catalog.headers("synonymes.csv"), ["terme", "alt"])
+        self.assertIsNone(self.catalog.get("absent.csv"))
+
+    def test_bom_is_not_part_of_headers(self):
+        (self.folder / "bom.csv").write_text("nom;syn1\nParis;Lutèce\n", encoding="utf-8-sig")
+        self.assertEqual(self.catalog.headers("bom.csv"), ["nom", "syn1"])
+
+    def test_listing_follows_folder_changes(self):
+        self.assertEqual(self.catalog.filenames(), ["synonymes.csv"])
+        (self.folder / "codes.csv").write_text("nom,code\n", encoding="utf-8")
+        self._touch(self.folder)
+        self.assertEqual(self.catalog.filenames(), ["codes.csv", "synonymes.csv"])
+        (self.folder / "synonymes.csv").unlink()
+        self._touch(self.folder)
+        self.assertEqual([info.name for info in self.catalog.infos()], ["codes.csv"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
+import pandas as pd
+
+from config import Config
+from models.file_management.file_modifier.csv_file_modifier import CsvChunkAutoModifier
+from models.file_management.readers.csv_file_reader import CsvFileReader
+
+
+def upper(series: pd.Series) -> pd.DataFrame:
+    return pd.DataFrame({"u": series.str.upper()})
+
+
+class TestProcessAndSave(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        patcher = patch.object(Config, "overlay_folder", new_callable=PropertyMock,
+                               return_value=self.folder / "overlays")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.names = [f"nom{i}" for i in range(11)]
+        self.filepath = self.folder / "data.csv"
+        pd.DataFrame({"id": range(11), "nom": self.names}).to_csv(self.filepath, index=False, sep=";")
+
+    def _modifier(self, modify_func=upper) -> CsvChunkAutoModifier:
+        reader = CsvFileReader(str(self.filepath), sep=";", chunk_size=3)
+        return CsvChunkAutoModifier(reader, "nom", modify_func, ["nom_upper"])
+
+    def _read(self, path: Path) -> pd.DataFrame:
+        return pd.read_csv(path, sep=";", dtype=str)
+
+    def test_in_place_rewrite_reads_each_row_once(self):
+        modifier = self._modifier()
+        modifier.process_and_save()
+        output = self._read(self.filepath)
+        self.assertEqual(output.columns.tolist(), ["id", "nom", "nom_upper"])
+        self.assertEqual(output["nom"].tolist(), self.names)
+        self.assertEqual(output["nom_upper"].tolist(), [name.upper() for name in self.names])
+        self.assertEqual(modifier.csv_reader.headers, ["id", "nom", "nom_upper"])
+        self.assertEqual(list(self.folder.glob("*.tmp")), [])
+
+    def test_failed_chunk_keeps_source_intact(self):
+        before = self.filepath.read_bytes()
+        calls = []
+
+        def failing(series):
+            calls.append(len(series))
+            if len(calls) == 3:
+                raise ValueError("échec")
+            return upper(series)
+
+        with self.assertRaises(RuntimeError):
+            self._modifier(failing).process_and_save()
+        self.assertEqual(self.filepath.read_bytes(), before)
+        self.assertEqual(list(self.folder.glob("*.tmp")), [])
+
+    def test_process_pool_keeps_chunk_order(self):
+        output_path = self.folder / "output.csv"
+        self._modifier().process_and_save(str(output_path), workers=2)
+        output = self._read(output_path)
+        self.assertEqual(output["id"].tolist(), [str(i) for i in range(11)])
+        self.assertEqual(output["nom_upper"].tolist(), [name.upper() for name in self.names])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import gc
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
+import pandas as pd
+
+from config import Config
+from models.file_management.file_modifier.csv_file_modifier import CsvChunkAutoModifier
+from models.file_management.readers.csv_file_reader import CsvFileReader
+from models.file_management.versions import get_file_versions
+
+
+def _upper(series: pd.Series) -> pd.DataFrame:
+    return pd.DataFrame({"u": series.str.upper()})
+
+
+class TestFileVersions(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        for name in ("overlay_folder", "versions_folder"):
+            patcher = patch.object(Config, name, new_callable=PropertyMock, return_value=self.folder / name)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.versions = get_file_versions()
+        self.filepath = self.folder / "data.csv"
+        pd.DataFrame({"id": range(5), "nom": ["Dupont", "Durand", "Martin", "Petit", "Roux"]}) \
+            .to_csv(self.filepath, index=False, sep=";")
+
+    def _rewrite_in_place(self) -> None:
+        reader = CsvFileReader(str(self.filepath), sep=";")
+        CsvChunkAutoModifier(reader, "nom", _upper, ["nom_upper"]).process_and_save()
+        self.assertFalse(reader.version.superseded)
+        reader.close()
+
+    def test_reader_stays_on_its_version(self):
+        reader = CsvFileReader(str(self.filepath), sep=";", chunk_size=2)
+        chunks = reader.iter_chunks()
+        first = next(chunks)
+        self._rewrite_in_place()
+
+        self.assertTrue(reader.version.superseded)
+        self.assertEqual(reader.headers, ["id", "nom"])
+        self.assertEqual(pd.concat([first, *chunks])["nom"].tolist(), ["Dupont", "Durand", "Martin", "Petit", "Roux"])
+        self.assertEqual(reader.get_chunk(2, 1)["nom"].tolist(), ["Martin", "Petit"])
+        current = CsvFileReader(str(self.filepath), sep=";")
+        self.assertEqual(current.version.number, reader.version.number + 1)
+        self.assertEqual(current.get_all()["nom_upper"].tolist()[:2], ["DUPONT", "DURAND"])
+
+        snapshot = reader.version.data_path
+        self.assertTrue(snapshot.is_file())
+        del reader, chunks
+        gc.collect()
+        self.assertFalse(snapshot.exists())
+
+    def test_no_snapshot_without_readers(self):
+        self._rewrite_in_place()
+        self.assertEqual(list(self.versions.folder.glob("*")), [])
+
+    def test_metadata_cached_per_version(self):
+        with patch.object(CsvFileReader, "_count_lines", autospec=True,
+                          side_effect=CsvFileReader._count_lines) as count_lines:
+            self.assertEqual(CsvFileReader(str(self.filepath), sep=";").nrows, 6)
+            self.assertEqual(CsvFileReader(str(self.filepath), sep=";").nrows, 6)
+            self.assertEqual(count_lines.call_count, 1)
+            with self.filepath.open("a", encoding="utf-8") as f:
+                f.write("5;Moreau\n")
+            self.assertEqual(CsvFileReader(str(self.filepath), sep=";").nrows, 7)
+            self.assertEqual(count_lines.call_count, 2)
+
+    def test_replaced_overlay_columns_outlive_their_readers(self):
+        CsvChunkAutoModifier(CsvFileReader(str(self.filepath), sep=";"), "nom", _upper, ["x"]).process_to_overlay()
+        reader = CsvFileReader(str(self.filepath), sep=";")
+        CsvChunkAutoModifier(CsvFileReader(str(self.filepath), sep=";"), "nom",
+                             lambda series: pd.DataFrame({"x": series.str.lower()}), ["x"]).process_to_overlay()
+
+        self.assertEqual(reader.get_all()["x"].tolist()[0], "DUPONT")
+        self.assertEqual(CsvFileReader(str(self.filepath), sep=";").get_all()["x"].tolist()[0], "dupont")
+        self.assertEqual(len(list(reader.overlay.folder.glob("*.csv"))), 2)
+        reader.close()
+        self.assertEqual(len(list(reader.overlay.folder.glob("*.csv"))), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from models.file_management.completion.creator import CsvManualMultiColumnsBuilder
+
+
+class TestInjectValuesStream(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        source = self.folder / "source.csv"
+        pd.DataFrame({"id": range(7), "nom": ["Dupont", "Bernard", "Durand", "Martin", "Petit", "Roux", "Moreau"]}) \
+            .to_csv(source, index=False, sep=";")
+        patcher = patch("models.file_management.completion.creator.ElasticManager")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.builder = CsvManualMultiColumnsBuilder("nom", ["code", "alt"], original_filepath=str(source),
+                                                    separator=";", chunk_size=3)
+        self.builder._output_csv = self.folder / "output.csv"
+        self.builder.create_csv()
+
+    def _output(self) -> pd.DataFrame:
+        return pd.read_csv(self.builder.output_path, sep=";", dtype=str, keep_default_na=False)
+
+    def test_frames_of_any_size_are_merged_in_one_pass(self):
+        names = ["Dupont", "Bernard", "Durand", "Martin", "Petit", "Roux", "Moreau"]
+        frames = (pd.DataFrame({"code": [n.upper() for n in part], "alt": [n.lower() for n in part]})
+                  for part in (names[:2], names[2:7]))
+        self.assertEqual(self.builder.inject_values_stream(frames), 7)
+        output = self._output()
+        self.assertEqual(output["nom"].tolist(), names)
+        self.assertEqual(output["code"].tolist(), [n.upper() for n in names])
+        self.assertEqual(list(self.folder.glob("*.tmp")), [])
+
+    def test_file_permissions_are_kept(self):
+        self.builder.output_path.chmod(0o644)
+        self.builder.inject_values_stream([pd.DataFrame({"code": ["A"], "alt": ["a"]})])
+        self.assertEqual(self.builder.output_path.stat().st_mode & 0o777, 0o644)
+
+    def test_only_empty_cells_are_filled_from_start_row(self):
+        self.builder.inject_values_in_chunks(pd.DataFrame({"code": ["A", "B"], "alt": ["a", "b"]}), 2)
+        self.builder.inject_values_in_chunks(pd.DataFrame({"code": ["X", "Y", "Z"], "alt": ["x", "", "z"]}), 1)
+        output = self._output()
+        self.assertEqual(output["code"].tolist(), ["", "X", "A", "B", "", "", ""])
+        self.assertEqual(output["alt"].tolist(), ["", "x", "a", "b", "", "", ""])
+
+    def test_too_many_values_keep_the_file_unchanged(self):
+        before = self.builder.output_path.read_text()
+        with self.assertRaises(ValueError):
+            self.builder.inject_values_in_chunks(pd.DataFrame({"code": list("abcde"), "alt": list("abcde")}), 3)
+        self.assertEqual(self.builder.output_path.read_text(), before)
+        self.assertEqual(list(self.folder.glob("*.tmp")), [])
+
+    def test_create_csv_quotes_only_special_values(self):
+        source = self.folder / "special.csv"
+        names = ["NA", "a;b", 'dit "x"', "ligne\nsuite", ""]
+        pd.DataFrame({"id": range(5), "nom": names}).to_csv(source, index=False, sep=";")
+        builder = CsvManualMultiColumnsBuilder("nom", ["code", "alt"], original_filepath=str(source), separator=";",
+                                               chunk_size=2)
+        builder._output_csv = self.folder / "special_output.csv"
+        on_chunk = MagicMock()
+        self.assertEqual(builder.create_csv(on_chunk), "special_output.csv")
+        expected = pd.DataFrame({"nom": names, "code": "", "alt": ""}).to_csv(index=False, sep=";",
+                                                                             lineterminator="\n")
+        self.assertEqual(builder.output_path.read_text(), expected)
+        self.assertEqual(on_chunk.call_count, 3)
+
+    def test_missing_column(self):
+        with self.assertRaises(ValueError):
+            self.builder.inject_values_in_chunks(pd.DataFrame({"code": ["A"]}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pandas as pd
+
+from config import Config
+from models.file_management.completion.multi import MultiCompletionFileCreator
+from models.file_management.completion.phonetic import PhoneticFileCreator
+from models.file_management.file_modifier.csv_file_modifier import CsvChunkAutoModifier
+from models.file_management.file_utls import AtomicFileWriter
+from models.file_management.filepath_codec import FilePathCodec
+from models.file_management.readers.csv_file_reader import CsvFileReader
+from models.phonetc_basics.code_cache import clear_code_caches
+from tests.phonetic_test.test_code_cache import FakeProcessor
+
+
+class TestMultiCompletionFileCreator(unittest.TestCase):
+
+    def setUp(self):
+        clear_code_caches()
+        self.folder = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        self.completions = self.folder / "completions"
+        self.completions.mkdir()
+        file_types_patcher = patch.object(Config, "file_types", new_callable=PropertyMock)
+        file_types_patcher.start().return_value.completions.folder_path = self.completions
+        self.addCleanup(file_types_patcher.stop)
+        env_patcher = patch.dict(os.environ, {"PHONETIC_STORE_MAX_ENTRIES": "0", "PHONETIC_NORMALIZATION": ""})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        patcher = patch("models.phonetc_basics.chunk_encoder.PhoneticWrapper", FakeProcessor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.filepath = self.folder / "data.csv"
+        pd.DataFrame({"id": range(5), "nom": ["Dupont", "NA", "Durand", "a;b", "Petit"],
+                      "ville": ["Paris", "Lyon", "Nantes", "Lille", "Brest"]}) \
+            .to_csv(self.filepath, index=False, sep=";")
+
+    def _creator(self, completions, **kwargs) -> MultiCompletionFileCreator:
+        request = {"filepath": FilePathCodec.encode(str(self.filepath)), "sep": ";", "completions": completions}
+        return MultiCompletionFileCreator(request, **kwargs)
+
+    def test_all_completion_files_in_one_read(self):
+        on_chunk = MagicMock()
+        creator = self._creator([
+            {"type": "empty", "column": "nom", "new_columns": ["syn1", "syn2"], "filename": "noms.csv"},
+            {"category": "phonetic", "original_field": "ville", "phonetic": {"soundex": True}},
+        ], on_chunk=on_chunk, queue_size=1)
+        with patch.object(CsvFileReader, "iter_columns", autospec=True,
+                          side_effect=CsvFileReader.iter_columns) as iter_columns:
+            result = creator.create()
+        self.assertEqual(iter_columns.call_count, 1)
+        self.assertTrue(on_chunk.called)
+        self.assertEqual([(entry["column"], entry["type"]) for entry in result],
+                         [("nom", "empty"), ("ville", "phonetic")])
+
+        empty = pd.read_csv(self.completions / "noms.csv", sep=";", dtype=str, keep_default_na=False)
+        self.assertEqual(empty.columns.tolist(), ["nom", "syn1", "syn2"])
+        self.assertEqual(empty["nom"].tolist(), ["Dupont", "NA", "Durand", "a;b", "Petit"])
+        phonetic = pd.read_csv(self.completions / result[1]["filename"], sep=";", dtype=str)
+        self.assertEqual(phonetic.columns[0], "ville")
+        self.assertEqual(phonetic.iloc[:, 1].tolist(), ["PARIS", "LYON", "NANTES", "LILLE", "BREST"])
+
+    def test_failed_worker_leaves_no_file(self):
+        creator = self._creator([
+            {"type": "empty", "column": "nom", "filename": "noms.csv"},
+            {"type": "phonetic", "column": "ville", "phonetic": {"soundex": True}, "filename": "villes.csv"},
+        ], queue_size=1)
+        with patch.object(FakeProcessor, "soundex_encode_array", side_effect=RuntimeError("échec")):
+            self.assertFalse(creator.create())
+        self.assertEqual(list(self.completions.iterdir()), [])
+
+    def test_overlay_and_base_columns_give_the_same_values(self):
+        patcher = patch.object(Config, "overlay_folder", new_callable=PropertyMock,
+                               return_value=self.folder / "overlays")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.filepath.write_text("id;nom\n1;Dupont\n2;NA\n3;\n", encoding="utf-8")
+        CsvChunkAutoModifier(CsvFileReader(str(self.filepath), sep=";"), "nom",
+                             lambda series: pd.DataFrame({"x": series.fillna("").str.lower()}),
+                             ["nom_x"]).process_to_overlay()
+
+        result = self._creator([
+            {"type": "empty", "column": "nom_x", "filename": "e1.csv"},
+            {"type": "empty", "column": "nom", "filename": "e2.csv"},
+        ]).create()
+        self.assertTrue(result)
+        alone = self._creator([{"type": "empty", "column": "nom", "filename": "e3.csv"}]).create()
+        self.assertTrue(alone)
+        self.assertEqual((self.completions / "e2.csv").read_text(encoding="utf-8"),
+                         "nom;nom_completion\nDupont;\nNA;\n;\n")
+        self.assertEqual((self.completions / "e3.csv").read_text(encoding="utf-8"),
+                         (self.completions / "e2.csv").read_text(encoding="utf-8"))
+        self.assertNotIn("nan", (self.completions / "e1.csv").read_text(encoding="utf-8"))
+
+    def test_duplicate_filenames_are_rejected(self):
+        creator = self._creator([
+            {"type": "empty", "column": "nom", "filename": "noms.csv"},
+            {"type": "phonetic", "column": "ville", "phonetic": {"soundex": True}, "filename": "noms.csv"},
+        ])
+        self.assertFalse(creator.create())
+        self.assertEqual(list(self.completions.iterdir()), [])
+
+    def test_failed_commit_removes_published_files(self):
+        creator = self._creator([
+            {"type": "empty", "column": "nom", "filename": "noms.csv"},
+            {"type": "empty", "column": "ville", "filename": "villes.csv"},
+        ])
+        replace = AtomicFileWriter._replace
+
+        def fail_second(writer, tmp_path):
+            if writer.path.name == "villes.csv":
+                raise OSError("disque plein")
+            replace(writer, tmp_path)
+
+        with patch.object(AtomicFileWriter, "_replace", autospec=True, side_effect=fail_second):
+            self.assertFalse(creator.create())
+        self.assertEqual(list(self.completions.iterdir()), [])
+
+    def test_phonetic_file_reads_the_column_once_and_keeps_na(self):
+        request = {"filepath": FilePathCodec.encode(str(self.filepath)), "sep": ";", "column": "nom",
+                   "phonetic": {"soundex": True}, "filename": "noms.csv"}
+        with patch.object(CsvFileReader, "read_partial", autospec=True,
+                          side_effect=CsvFileReader.read_partial) as read_partial:
+            self.assertEqual(PhoneticFileCreator(request).create(), "noms.csv")
+        self.assertEqual(read_partial.call_count, 0)
+        phonetic = pd.read_csv(self.completions / "noms.csv", sep=";", dtype=str, keep_default_na=False)
+        self.assertEqual(phonetic["nom"].tolist(), ["Dupont", "NA", "Durand", "a;b", "Petit"])
+        self.assertEqual(phonetic.iloc[:, 1].tolist(), ["DUPONT", "NA", "DURAND", "A;B", "PETIT"])
+
+    def test_unknown_column(self):
+        self.assertFalse(self._creator([{"type": "empty", "column": "inconnue"}]).create())
+        self.assertEqual(list(self.completions.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
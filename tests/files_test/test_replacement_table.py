@@ -0,0 +1,65 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
+from config import Config
+from models.file_management.completion.lookup import clear_replacement_tables, get_replacement_table
+from models.mapping_management.fields_management.remplacement import ReplacementField
+
+
+class TestReplacementTable(unittest.TestCase):
+
+    def setUp(self):
+        clear_replacement_tables()
+        self.addCleanup(clear_replacement_tables)
+        self.folder = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        self.filepath = self.folder / "synonymes.csv"
+        self.filepath.write_text("nom;syn1;syn2\nParis;Lutèce;Paname\nLyon;;Lugdunum\nParis;Doublon;\nNA;Nul;\n",
+                                 encoding="utf-8")
+
+    def test_complete_joins_values(self):
+        table = get_replacement_table(self.filepath)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.complete(["Lyon", "Paris", "Nice", "NA"]).tolist(),
+                         [["Lugdunum"], ["Lutèce", "Paname"], None, ["Nul"]])
+        self.assertEqual(table.complete(["Lyon", "Nice", None], keep_original=True).tolist(),
+                         [["Lyon", "Lugdunum"], ["Nice"], None])
+        self.assertEqual(get_replacement_table(self.filepath, use_first_column=True).complete(["Lyon"]).tolist(),
+                         [["Lyon", "Lugdunum"]])
+
+    def test_table_is_shared_until_file_changes(self):
+        table = get_replacement_table(self.filepath)
+        copy = self.folder / "copie.csv"
+        shutil.copy(self.filepath, copy)
+        self.assertIs(get_replacement_table(self.filepath), table)
+        self.assertIs(get_replacement_table(copy), table)
+
+        self.filepath.write_text("nom;syn1\nParis;Ville lumière\n", encoding="utf-8")
+        stat = self.filepath.stat()
+        os.utime(self.filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        updated = get_replacement_table(self.filepath)
+        self.assertIsNot(updated, table)
+        self.assertEqual(updated.complete(["Paris"]).tolist(), [["Ville lumière"]])
+
+    def test_field_values_are_copies_of_the_shared_table(self):
+        (self.folder / "completions").mkdir()
+        shutil.copy(self.filepath, self.folder / "completions" / "synonymes.csv")
+        with patch.object(Config, "files_folder", new_callable=PropertyMock, return_value=self.folder):
+            field = ReplacementField("ville", {"category": "remplacement", "type_completion": "synonymes",
+                                               "original_field": "nom", "column_names": ["syn1", "syn2"],
+                                               "filename": "synonymes.csv"})
+        values = field.load_all_values()
+        self.assertEqual(values["nom"].tolist(), ["Paris", "Lyon", "NA"])
+        values.loc[0, "syn1"] = "modifié"
+        chunk = field.get_chunk_values(exclude_first_column=True)
+        chunk.loc[0, "syn2"] = "modifié"
+        self.assertEqual(field.lookup_table.complete(["Paris"]).tolist(), [["Lutèce", "Paname"]])
+        self.assertEqual(field.load_all_values().loc[0].tolist(), ["Paris", "Lutèce", "Paname"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import re
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
+import pandas as pd
+
+from config import Config
+from models.file_management.completion.lookup import clear_replacement_tables
+from models.file_management.completion.synonyms import AhoCorasick, get_synonym_expander
+from models.file_management.file_modifier.column_pipeline import build_transform
+
+
+class TestAhoCorasick(unittest.TestCase):
+
+    def test_all_overlapping_matches(self):
+        patterns = ["he", "she", "his", "hers"]
+        automaton = AhoCorasick(patterns)
+        text = "ushershishe"
+        expected = sorted((m.start(), m.start() + len(p), i)
+                          for i, p in enumerate(patterns) for m in re.finditer(f"(?={p})", text))
+        self.assertEqual(sorted(automaton.iter_matches(text)), expected)
+
+
+class TestSynonymExpander(unittest.TestCase):
+
+    def setUp(self):
+        clear_replacement_tables()
+        self.addCleanup(clear_replacement_tables)
+        self.folder = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        self.filepath = self.folder / "synonymes.csv"
+        self.filepath.write_text("terme;alt1;alt2\nParis;Lutèce;Paname\nSaint-Denis;St-Denis;\nUniv;Université;\n"
+                                 "Univ Paris;UP;\nrue;;\n", encoding="utf-8")
+
+    def test_expand_multi_word_values(self):
+        expander = get_synonym_expander(self.filepath)
+        self.assertEqual(len(expander), 4)
+        self.assertEqual(expander.expand("Gare de paris Saint-Denis"),
+                         ["Gare de Lutèce Saint-Denis", "Gare de Paname Saint-Denis", "Gare de paris St-Denis"])
+        # Occurrence la plus longue retenue, mots entiers seulement
+        self.assertEqual(expander.expand("Univ Paris 8"), ["UP 8"])
+        self.assertEqual(expander.expand("Parisien de la rue"), [])
+
+    def test_expand_many_and_cache(self):
+        expander = get_synonym_expander(self.filepath)
+        self.assertIs(get_synonym_expander(self.filepath), expander)
+        result = expander.expand_many(["Univ", None, "Lyon", "Univ"], keep_original=True)
+        self.assertEqual(result.tolist(), [["Univ", "Université"], None, ["Lyon"], ["Univ", "Université"]])
+        self.assertIsNone(expander.expand_many(["Lyon"])[0])
+
+    def test_pipeline_transform(self):
+        with patch.object(Config, "file_types", new_callable=PropertyMock) as file_types:
+            file_types.return_value.completions.folder_path = self.folder
+            transform = build_transform({"type": "synonyms", "column": "ville", "filename": "synonymes.csv"})
+        result = transform.apply(pd.DataFrame({"ville": ["Paris", "Lyon"]}))
+        self.assertEqual(result["ville_synonymes"].tolist(), ["Lutèce|Paname", ""])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pandas as pd
+
+from config import Config
+from models.import_management import DocumentIdBuilder, EsDataImport
+from models.import_management.delta import ImportHashState, hash_rows
+
+MAPPING = {
+    "mapping": {
+        "iso3": {"source_field": "iso3", "mapped": True, "fixed_value": False, "value": None},
+        "nom": {"category": "source", "source_field": "name_fr", "mapped": True},
+        "pays": {"category": "fixed_value", "value": "oui"},
+        "ignored": {"source_field": "name_en", "mapped": False},
+    }
+}
+
+
+class TestDocumentIdBuilder(unittest.TestCase):
+
+    def test_ids_are_deterministic_and_key_based(self):
+        builder = DocumentIdBuilder(["iso3"])
+        df1 = pd.DataFrame({"iso3": ["FRA", "DEU"], "name": ["France", "Allemagne"]})
+        df2 = pd.DataFrame({"iso3": ["DEU", "FRA"], "name": ["Germany", "France"]})
+        ids1 = builder.build(df1)
+        ids2 = builder.build(df2)
+        self.assertEqual(ids1, [ids2[1], ids2[0]])
+        self.assertEqual(len(ids1[0]), 32)
+        self.assertNotEqual(ids1[0], ids1[1])
+
+    def test_missing_key_column(self):
+        with self.assertRaises(ValueError):
+            DocumentIdBuilder("iso3").build(pd.DataFrame({"iso2": ["FR"]}))
+
+
+class TestHashRows(unittest.TestCase):
+
+    def test_column_names_and_order_change_the_hash(self):
+        df = pd.DataFrame({"nom": ["France", None], "code": ["FRA", "DEU"]})
+        hashes = hash_rows(df)
+        self.assertEqual(hash_rows(df.copy()).tolist(), hashes.tolist())
+        self.assertEqual(hash_rows(df.fillna("")).tolist(), hashes.tolist())
+        renamed = hash_rows(df.rename(columns={"nom": "libelle"}))
+        reordered = hash_rows(df[["code", "nom"]])
+        swapped = hash_rows(df.rename(columns={"nom": "code", "code": "nom"}))
+        for other in (renamed, reordered, swapped):
+            self.assertTrue((other != hashes).all())
+
+
+class TestEsDataImport(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.filepath = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("iso3;name_fr;name_en\nFRA;France;France\nDEU;;Germany\nITA;Italie;Italy\n")
+
+    def tearDown(self):
+        os.remove(self.filepath)
+
+    def _importer(self, **kwargs) -> EsDataImport:
+        importer = EsDataImport("pays", self.filepath, MAPPING, separator=";", **kwargs)
+        importer._elastic_manager = MagicMock()
+        importer._elastic_manager.tools.bulk_import.return_value = True
+        importer._elastic_manager.tools.bulk_delete.return_value = True
+        return importer
+
+    def test_build_documents(self):
+        importer = self._importer()
+        documents, key_hashes = importer.transform(pd.read_csv(self.filepath, sep=";", dtype=str))
+        documents, ids = importer.to_actions(documents, key_hashes)
+        self.assertIsNone(ids)
+        self.assertEqual(documents[0], {"iso3": "FRA", "nom": "France", "pays": "oui"})
+        self.assertIsNone(documents[1]["nom"])
+
+    def test_completion_fields_are_joined(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder, ignore_errors=True)
+        Path(folder, "synonymes.csv").write_text("name_fr;syn1;syn2\nFrance;Hexagone;\nItalie;Botte;Italia\n",
+                                                 encoding="utf-8")
+        mapping = {"mapping": {
+            "nom_synonymes": {"category": "remplacement", "original_field": "name_fr", "filename": "synonymes.csv",
+                              "keep_original": "True", "use_first_column": "False"},
+            "absent": {"category": "remplacement", "original_field": "name_fr", "filename": "inconnu.csv"},
+        }}
+        with patch.object(Config, "file_types", new_callable=PropertyMock) as file_types:
+            file_types.return_value.completions.folder_path = Path(folder)
+            importer = EsDataImport("pays", self.filepath, mapping, separator=";")
+        documents, _ = importer.transform(pd.read_csv(self.filepath, sep=";", dtype=str))
+        self.assertEqual(documents.columns.tolist(), ["nom_synonymes"])
+        self.assertEqual(documents["nom_synonymes"].tolist(),
+                         [["France", "Hexagone"], None, ["Italie", "Botte", "Italia"]])
+
+    def test_run_sends_deterministic_ids(self):
+        on_chunk = MagicMock()
+        importer = self._importer(id_columns=["iso3"], op_type="update", on_chunk=on_chunk)
+        result = importer.run()
+
+        self.assertEqual(result["docs"], 3)
+        args, kwargs = importer.elastic_manager.tools.bulk_import.call_args
+        self.assertEqual(kwargs["op_type"], "update")
+        self.assertEqual(kwargs["ids"], DocumentIdBuilder("iso3").build(pd.DataFrame({"iso3": ["FRA", "DEU", "ITA"]})))
+        self.assertEqual(on_chunk.call_args.kwargs["docs"], 3)
+
+    def test_update_requires_id_columns(self):
+        with self.assertRaises(ValueError):
+            EsDataImport("pays", self.filepath, MAPPING, op_type="update")
+        with self.assertRaises(ValueError):
+            EsDataImport("pays", self.filepath, MAPPING, incremental=True)
+
+    def test_incremental_sends_only_delta(self):
+        state_folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, state_folder, True)
+        state_path = Path(state_folder) / "pays.npz"
+
+        with patch.object(EsDataImport, "state_filepath", new_callable=PropertyMock, return_value=state_path):
+            first = self._importer(id_columns=["iso3"], incremental=True).run()
+            self.assertEqual((first["docs"], first["deleted"]), (3, 0))
+
+            with open(self.filepath, "w", encoding="utf-8") as f:
+                f.write("iso3;name_fr;name_en\nFRA;France;France\nDEU;Allemagne;Germany\nESP;Espagne;Spain\n")
+            importer = self._importer(id_columns=["iso3"], incremental=True)
+            second = importer.run()
+
+        self.assertEqual((second["docs"], second["unchanged"], second["deleted"]), (2, 1, 1))
+        sent = importer.elastic_manager.tools.bulk_import.call_args.args[1]
+        self.assertEqual(sorted(doc["iso3"] for doc in sent), ["DEU", "ESP"])
+        deleted_ids = importer.elastic_manager.tools.bulk_delete.call_args.args[1]
+        self.assertEqual(deleted_ids, DocumentIdBuilder("iso3").build(pd.DataFrame({"iso3": ["ITA"]})))
+
+    def test_incremental_with_duplicate_keys(self):
+        state_folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, state_folder, True)
+        state_path = Path(state_folder) / "pays.npz"
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            f.write("iso3;name_fr;name_en\nFRA;France;France\nFRA;République française;French Republic\n"
+                    "DEU;Allemagne;Germany\n")
+
+        with patch.object(EsDataImport, "state_filepath", new_callable=PropertyMock, return_value=state_path):
+            self._importer(id_columns=["iso3"], incremental=True).run()
+            self.assertEqual(len(ImportHashState(state_path).load()), 2)
+            second = self._importer(id_columns=["iso3"], incremental=True).run()
+
+            with open(self.filepath, "w", encoding="utf-8") as f:
+                f.write("iso3;name_fr;name_en\nFRA;France;France\nFRA;France (République);French Republic\n"
+                        "DEU;Allemagne;Germany\n")
+            importer = self._importer(id_columns=["iso3"], incremental=True)
+            third = importer.run()
+
+        self.assertEqual((second["docs"], second["unchanged"]), (0, 3))
+        self.assertEqual((third["docs"], third["unchanged"]), (1, 2))
+        sent = importer.elastic_manager.tools.bulk_import.call_args.args[1]
+        self.assertEqual([doc["nom"] for doc in sent], ["France (République)"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from elastic_manager.estools import ElasticSearchTools
+from models.import_management import EsDataImport, ImportPipeline
+
+MAPPING = {"mapping": {"iso3": {"source_field": "iso3"}, "nom": {"source_field": "name_fr"}}}
+
+
+class TestImportPipeline(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.filepath = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("iso3;name_fr\n")
+            for i in range(25):
+                f.write(f"C{i:02d};Pays {i}\n")
+        self.sent = []
+
+    def tearDown(self):
+        os.remove(self.filepath)
+
+    def _run(self, transform_workers: int, fail: bool = False):
+        data_import = EsDataImport("pays", self.filepath, MAPPING, separator=";", id_columns=["iso3"])
+        data_import._elastic_manager = MagicMock()
+        on_chunk = MagicMock()
+
+        def send(tools, body, ignore_conflicts=False):
+            self.sent.append(body)
+            return not fail
+
+        reader = data_import.open_reader()
+        reader.chunk_size = 10
+        with patch.object(data_import, "open_reader", return_value=reader), \
+                patch.object(ElasticSearchTools, "send_bulk_body", autospec=True, side_effect=send):
+            pipeline = ImportPipeline(data_import, transform_workers=transform_workers, sender_threads=2,
+                                      queue_size=1, on_chunk=on_chunk)
+            return pipeline.run(), on_chunk
+
+    def _sent_ids(self):
+        ids = []
+        for body in self.sent:
+            lines = body.decode("utf-8").strip().split("\n")
+            ids += [json.loads(line)["index"]["_id"] for line in lines[0::2]]
+        return ids
+
+    def test_inline_transform(self):
+        result, on_chunk = self._run(transform_workers=0)
+        self.assertEqual(result["docs"], 25)
+        self.assertEqual(len(self.sent), 3)
+        self.assertEqual(len(set(self._sent_ids())), 25)
+        self.assertEqual(on_chunk.call_count, 3)
+        self.assertEqual(set(result["stages"]), {"read", "transform", "serialize", "send"})
+        self.assertEqual(result["stages"]["send"]["items"], 3)
+
+    def test_process_pool_transform(self):
+        result, _ = self._run(transform_workers=2)
+        self.assertEqual(result["docs"], 25)
+        self.assertEqual(len(set(self._sent_ids())), 25)
+
+    def test_send_failure(self):
+        result, _ = self._run(transform_workers=0, fail=True)
+        self.assertFalse(result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from models.jobs import Job, JobContext, JobManager, JobStatus, JobStore
+
+
+def _wait_finished(manager: JobManager, job_id: str, timeout: float = 5.0) -> Job:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get(job_id)
+        if job.is_finished:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} non terminé après {timeout}s")
+
+
+class TestJobManager(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.store = JobStore(self.folder)
+        self.release = threading.Event()
+
+        def chunked(payload, context: JobContext, config):
+            for i in range(payload["chunks"]):
+                context.on_chunk(i, payload["chunks"])
+            return "fichier.csv"
+
+        def blocking(payload, context: JobContext, config):
+            self.release.wait(5)
+            context.on_chunk(0, 2)
+            context.on_chunk(1, 2)
+            return True
+
+        self.handlers = {
+            "chunked": chunked,
+            "blocking": blocking,
+            "failing": lambda payload, context, config: False,
+            "raising": MagicMock(side_effect=RuntimeError("boom")),
+        }
+        self.manager = JobManager(config=MagicMock(), store=self.store, handlers=self.handlers, max_workers=1)
+
+    def tearDown(self):
+        self.release.set()
+        self.manager.shutdown()
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_submit_runs_and_persists(self):
+        job = self.manager.submit("chunked", {"chunks": 3})
+        job = _wait_finished(self.manager, job.id)
+        self.assertEqual(job.status, JobStatus.SUCCEEDED)
+        self.assertEqual(job.result, "fichier.csv")
+        self.assertEqual((job.done, job.total), (3, 3))
+        self.assertEqual(self.store.load(job.id).status, JobStatus.SUCCEEDED)
+
+    def test_unknown_job_type(self):
+        with self.assertRaises(ValueError):
+            self.manager.submit("unknown", {})
+
+    def test_handler_returning_false_or_raising_fails(self):
+        failed = _wait_finished(self.manager, self.manager.submit("failing", {}).id)
+        raised = _wait_finished(self.manager, self.manager.submit("raising", {}).id)
+        self.assertEqual(failed.status, JobStatus.FAILED)
+        self.assertEqual(raised.status, JobStatus.FAILED)
+        self.assertEqual(raised.error, "boom")
+
+    def test_cancel_running_and_pending(self):
+        running = self.manager.submit("blocking", {})
+        pending = self.manager.submit("chunked", {"chunks": 1})
+        self.assertTrue(self.manager.cancel(pending.id))
+        self.assertTrue(self.manager.cancel(running.id))
+        self.release.set()
+        self.assertEqual(_wait_finished(self.manager, running.id).status, JobStatus.CANCELLED)
+        self.assertEqual(_wait_finished(self.manager, pending.id).status, JobStatus.CANCELLED)
+        self.assertFalse(self.manager.cancel(running.id))
+
+    def test_restore_requeues_pending_and_interrupts_running(self):
+        pending = Job("chunked", {"chunks": 1})
+        running = Job("chunked", {"chunks": 1})
+        running.mark_running()
+        self.store.save(pending)
+        self.store.save(running)
+
+        manager = JobManager(config=MagicMock(), store=self.store, handlers=self.handlers, max_workers=1)
+        try:
+            self.assertEqual(_wait_finished(manager, pending.id).status, JobStatus.SUCCEEDED)
+            self.assertEqual(manager.get(running.id).status, JobStatus.INTERRUPTED)
+        finally:
+            manager.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
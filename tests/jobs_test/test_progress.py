@@ -0,0 +1,92 @@
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from models.jobs import Job, JobContext, JobManager, JobStore
+from models.jobs.progress import ProgressCounters
+
+
+class TestProgressCounters(unittest.TestCase):
+
+    def test_context_updates_counters(self):
+        job = Job("test")
+        job.mark_running()
+        context = JobContext(job)
+        context.on_chunk(0, 4, rows=10, total_bytes=400)
+        context.on_chunk(1, 4, rows=10)
+
+        counters = job.counters
+        self.assertEqual((job.done, job.total), (2, 4))
+        self.assertEqual(counters.rows, 20)
+        self.assertEqual(counters.bytes_read, 200)
+        self.assertEqual(counters.total_bytes, 400)
+        self.assertIsNotNone(counters.throughput)
+        self.assertIsNotNone(job.dict["counters"]["eta"])
+
+    def test_eta_unknown_without_total(self):
+        counters = ProgressCounters()
+        counters.start()
+        self.assertIsNone(counters.eta(1, None))
+        self.assertIsNone(counters.throughput)
+
+    def test_counters_round_trip(self):
+        job = Job("test")
+        job.counters.update(rows=5, bytes_read=50, docs=3, total_bytes=100)
+        restored = Job.from_dict(job.dict)
+        self.assertEqual(restored.counters.rows, 5)
+        self.assertEqual(restored.counters.docs, 3)
+        self.assertEqual(restored.counters.total_bytes, 100)
+
+
+class TestJobEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+        def chunked(payload, context, config):
+            for i in range(3):
+                context.on_chunk(i, 3, rows=2, total_bytes=30)
+                time.sleep(0.01)
+            return True
+
+        self.manager = JobManager(config=MagicMock(), store=JobStore(self.folder),
+                                  handlers={"chunked": chunked}, max_workers=1)
+
+    def tearDown(self):
+        self.manager.shutdown()
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_stream_ends_with_final_state(self):
+        from routes import jobs as jobs_routes
+
+        job = self.manager.submit("chunked", {})
+        with patch.object(jobs_routes, "get_job_manager", return_value=self.manager):
+            events = list(jobs_routes._job_events(job.id))
+
+        self.assertTrue(events[-1].startswith("event: end\n"))
+        self.assertIn('"status": "succeeded"', events[-1])
+        self.assertIn('"rows": 6', events[-1])
+
+    def test_idle_stream_sends_keepalive_comments_only(self):
+        from routes import jobs as jobs_routes
+
+        manager = MagicMock(version=1)
+        manager.get.side_effect = [MagicMock(is_finished=False, dict={"status": "running"}),
+                                   MagicMock(is_finished=True, dict={"status": "succeeded"})]
+        manager.wait_for_update.side_effect = [1, 1, 2]
+        with patch.object(jobs_routes, "get_job_manager", return_value=manager):
+            events = list(jobs_routes._job_events("job"))
+
+        self.assertEqual([event.split("\n")[0] for event in events],
+                         ["event: progress", ": keepalive", ": keepalive", "event: end"])
+
+    def test_manager_version_changes_on_progress(self):
+        version = self.manager.version
+        self.manager.submit("chunked", {})
+        self.assertNotEqual(self.manager.wait_for_update(version, timeout=1), version)
+
+
+if __name__ == "__main__":
+    unittest.main()
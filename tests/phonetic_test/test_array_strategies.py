@@ -0,0 +1,197 @@
+import ctypes
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from ext_lib.phonetic.wrappers.metaphone.strategy import MetaphoneStrategy
+from ext_lib.phonetic.wrappers.metaphone3.signature import metaphone3_signature
+from ext_lib.phonetic.wrappers.metaphone3.strategy import Metaphone3Strategy
+from ext_lib.phonetic.wrappers.phonex.signature import phonex_signature
+from ext_lib.phonetic.wrappers.phonex.strategy import PhonexStrategy
+
+LIB_PHONEX = Path(__file__).resolve().parents[2] / "ext_lib" / "libphonex.so"
+LIB_METAPHONE3 = Path(__file__).resolve().parents[2] / "ext_lib" / "libmetaphone3.so"
+
+
+def _load_lib(path: Path, signature: dict) -> ctypes.CDLL:
+    lib = ctypes.CDLL(str(path))
+    for func_name, sig in signature.items():
+        if hasattr(lib, func_name):
+            getattr(lib, func_name).argtypes = sig["argtypes"]
+            getattr(lib, func_name).restype = sig["restype"]
+    return lib
+
+
+class FakePhonexLib:
+    """Bibliothèque factice : le code est la valeur en majuscules, tronquée et complétée par des '0'."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def phonex_single(self, value: bytes, address: int, length: int) -> None:
+        self.calls += 1
+        code = value.decode().upper()[:length].ljust(length, "0").encode() + b"\0"
+        ctypes.memmove(address, code, len(code))
+
+
+class FakePhonexArrayLib(FakePhonexLib):
+
+    def phonex_encode_array(self, inputs, count: int, address: int, width: int, length: int) -> int:
+        for i in range(count):
+            self.phonex_single(inputs[i], address + i * width, length)
+        return 0
+
+
+class FakeMetaphoneApiLib:
+    """Points d'entrée de libmetaphone.dll : metaphone_api / free_output."""
+
+    def __init__(self):
+        self.inputs = []
+
+    def metaphone_api(self, value: bytes, output_ref, separator: bytes, length: int) -> None:
+        self.inputs.append(value)
+        output_ref._obj.value = value.upper()[:length]
+
+    def free_output(self, pointer) -> None:
+        pass
+
+
+class FakeMetaphone3Lib:
+
+    def Metaphone3_new(self, value: bytes, encode_vowels: bool, encode_exact: bool, length: int):
+        return ctypes.c_char_p(value)
+
+    def Metaphone3_encode(self, encoder) -> None:
+        pass
+
+    def Metaphone3_primary(self, encoder) -> bytes:
+        return encoder.value.upper()
+
+    def Metaphone3_secondary(self, encoder) -> bytes:
+        return encoder.value.lower()
+
+    def Metaphone3_free(self, encoder) -> None:
+        pass
+
+
+class FakeMetaphone3FlagsLib(FakeMetaphone3Lib):
+    """Enregistre les options (encode_vowels, encode_exact) reçues par l'API objet."""
+
+    def __init__(self):
+        self.flags = []
+
+    def Metaphone3_new(self, value: bytes, encode_vowels: bool, encode_exact: bool, length: int):
+        self.flags.append((encode_vowels, encode_exact))
+        return super().Metaphone3_new(value, encode_vowels, encode_exact, length)
+
+
+class FakeMetaphone3TextLib:
+    """
+    Points d'entrée de libmetaphone3.dll : réponse texte, valeurs vides ignorées.
+    Les codes sont les lettres de la valeur, en majuscules (primary) et en minuscules (secondary).
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self._results = {}
+
+    def metaphone3_encode_multi_str(self, values: bytes, separator: int, length: int, encode_vowels: int,
+                                    encode_exact: int) -> int:
+        self.calls += 1
+        lines = []
+        for value in values.split(bytes([separator])):
+            if value:
+                letters = bytes(char for char in value if chr(char).isalpha())
+                lines.append(b"%s,%s,%s\n" % (value, letters.upper(), letters.lower()))
+        result = ctypes.create_string_buffer(b"".join(lines))
+        self._results[ctypes.addressof(result)] = result
+        return ctypes.addressof(result)
+
+    def free_result_str(self, pointer: int) -> None:
+        del self._results[pointer]
+
+
+class TestArrayStrategies(unittest.TestCase):
+
+    def test_values_containing_separator_stay_aligned(self):
+        codes = PhonexStrategy(FakePhonexLib()).process_array(["ab|cd", "", "xyz"], 4)
+        self.assertIsInstance(codes, np.ndarray)
+        self.assertEqual(codes.tolist(), ["AB|C", "0000", "XYZ0"])
+
+    def test_array_entry_point_is_preferred(self):
+        lib = FakePhonexArrayLib()
+        codes = PhonexStrategy(lib).process_array(["dupont", "durand"], 3)
+        self.assertEqual(codes.tolist(), ["DUP", "DUR"])
+        self.assertEqual(lib.calls, 2)
+
+    def test_empty_input(self):
+        self.assertEqual(len(PhonexStrategy(FakePhonexLib()).process_array([], 8)), 0)
+        self.assertEqual(len(MetaphoneStrategy(object()).process_array([], 8)), 0)
+        primaries, secondaries = Metaphone3Strategy(FakeMetaphone3Lib()).process_array([])
+        self.assertEqual((len(primaries), len(secondaries)), (0, 0))
+
+    def test_metaphone_falls_back_to_api_entry_point(self):
+        lib = FakeMetaphoneApiLib()
+        codes = MetaphoneStrategy(lib).process_array(["Smith", "", "a|b"], 4)
+        self.assertEqual(codes.tolist(), ["SMIT", "", "A|B"])
+        self.assertEqual(lib.inputs, [b"Smith", b"a|b"])
+
+    def test_metaphone3_returns_primary_and_secondary_arrays(self):
+        primaries, secondaries = Metaphone3Strategy(FakeMetaphone3Lib()).process_array(["Smith", "a,b"])
+        self.assertEqual(primaries.tolist(), ["SMITH", "A,B"])
+        self.assertEqual(secondaries.tolist(), ["smith", "a,b"])
+
+    def test_metaphone3_falls_back_to_text_entry_point(self):
+        lib = FakeMetaphone3TextLib()
+        primaries, secondaries = Metaphone3Strategy(lib).process_array(["Smith", "", "a,b|c"])
+        self.assertEqual(primaries.tolist(), ["SMITH", "", "ABC"])
+        self.assertEqual(secondaries.tolist(), ["smith", "", "abc"])
+        self.assertEqual(lib.calls, 1)
+        primaries, _ = Metaphone3Strategy(lib).process_array(["x\ny", "Jones"])
+        self.assertEqual(primaries.tolist(), ["XY", "JONES"])
+
+    @unittest.skipUnless(LIB_METAPHONE3.exists(), "libmetaphone3.so absente")
+    def test_metaphone3_text_entry_point_matches_object_api(self):
+        try:
+            lib = _load_lib(LIB_METAPHONE3, metaphone3_signature)
+        except OSError as e:
+            self.skipTest(f"libmetaphone3.so non chargeable : {e}")
+        if not hasattr(lib, "Metaphone3_new"):
+            self.skipTest("API objet absente")
+
+        class TextOnlyLib:
+            metaphone3_encode_multi_str = lib.metaphone3_encode_multi_str
+            free_result_str = lib.free_result_str
+
+        values = ["Dupont", "", "Hélène", "jean,pierre", "a|b", "Smith", "x\ny"]
+        expected = Metaphone3Strategy(lib).process_array(values)
+        result = Metaphone3Strategy(TextOnlyLib()).process_array(values)
+        self.assertEqual([codes.tolist() for codes in result], [codes.tolist() for codes in expected])
+
+    def test_metaphone3_process_reads_structured_output(self):
+        strategy = Metaphone3Strategy(FakeMetaphone3Lib())
+        self.assertEqual(strategy.process("Smith|Jones"), [("SMITH", "smith"), ("JONES", "jones")])
+        self.assertEqual(strategy.process(["a|b"]), [("A|B", "a|b")])
+        with self.assertRaises(ValueError):
+            strategy.process([])
+
+    def test_metaphone3_entry_points_share_defaults(self):
+        lib = FakeMetaphone3FlagsLib()
+        strategy = Metaphone3Strategy(lib)
+        strategy.process("Smith")
+        strategy.process_array(["Smith"])
+        self.assertEqual(lib.flags, [(False, True), (False, True)])
+
+    @unittest.skipUnless(LIB_PHONEX.exists(), "libphonex.so absente")
+    def test_phonex_library_matches_single_call(self):
+        try:
+            lib = _load_lib(LIB_PHONEX, phonex_signature)
+        except OSError as e:
+            self.skipTest(f"libphonex.so non chargeable : {e}")
+        values = [f"Dupont{i}" for i in range(5000)] + ["a|b"]
+        codes = PhonexStrategy(lib).process_array(values, 8)
+        self.assertEqual(len(codes), len(values))
+        buffer = ctypes.create_string_buffer(9)
+        lib.phonex_single(b"a|b", ctypes.addressof(buffer), 8)
+        self.assertEqual(codes[-1], buffer.value.decode())
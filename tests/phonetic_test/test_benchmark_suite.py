@@ -0,0 +1,31 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ext_lib.phonetic.benchmarks.corpus import generate_names, parse_size
+from ext_lib.phonetic.benchmarks.suite import _run_wrapper, build_cases
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_corpus_is_reproducible_and_repetitive(self):
+        names = generate_names(5_000, "fr", vocabulary_size=500)
+        self.assertEqual(names, generate_names(5_000, "fr", vocabulary_size=500))
+        self.assertLessEqual(len(set(names)), 500)
+        self.assertIn("Martin", names)
+
+    def test_parse_size(self):
+        self.assertEqual([parse_size(s) for s in ("10k", "1M", "10M", "2500")],
+                         [10_000, 1_000_000, 10_000_000, 2_500])
+
+    def test_length_is_only_swept_for_the_wrapper(self):
+        cases = build_cases(["wrapper", "encoder"], [10], ["soundex"], [4, 8], [100], [1, 2])
+        self.assertEqual(sum(c["target"] == "wrapper" for c in cases), 4)
+        self.assertEqual({c["length"] for c in cases if c["target"] == "encoder"}, {8})
+
+    def test_soundex_wrapper_case_uses_the_production_entry_point(self):
+        with patch("ext_lib.phonetic.PhoneticWrapper") as wrapper_class:
+            _run_wrapper(["Dupont", "Durand"], {"algorithm": "soundex", "length": 4, "batch_size": 1, "threads": 1},
+                         MagicMock())
+        wrapper = wrapper_class.return_value
+        self.assertEqual(wrapper.soundex_encode_array.call_count, 2)
+        wrapper.phonex_encode_array.assert_not_called()
@@ -0,0 +1,89 @@
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from config import Config
+from models.phonetc_basics.chunk_encoder import PhoneticChunkEncoder
+from models.phonetc_basics.code_cache import PhoneticCodeCache, clear_code_caches, code_cache_stats
+
+
+class FakeProcessor:
+    """Encodeur factice comptant les valeurs envoyées à la « bibliothèque »."""
+
+    def __init__(self, *_):
+        self.encoded = []
+
+    def soundex_encode_array(self, values, length=8):
+        self.encoded += list(values)
+        self.threads = getattr(self, "threads", set()) | {threading.current_thread().name}
+        return np.array([v.upper()[:length] for v in values], dtype=str)
+
+    def metaphone3_encode_array(self, values, length=8, encode_vowels=False, encode_exact=True):
+        self.encoded += list(values)
+        return np.array([v.upper() for v in values], dtype=str), np.array([v.lower() for v in values], dtype=str)
+
+
+class TestPhoneticCodeCache(unittest.TestCase):
+
+    def test_lookup_store_and_eviction(self):
+        cache = PhoneticCodeCache(max_size=2)
+        found, missing = cache.lookup(["a", "b"])
+        self.assertEqual(found, [None, None])
+        self.assertEqual(missing.tolist(), [0, 1])
+        cache.store(["a", "b"], [("A",), ("B",)])
+        cache.lookup(["a"])
+        cache.store(["c"], [("C",)])
+        found, missing = cache.lookup(["a", "b", "c"])
+        self.assertEqual(found, [("A",), None, ("C",)])
+        self.assertEqual(cache.size, 2)
+        self.assertEqual((cache.hits, cache.misses), (3, 3))
+        self.assertAlmostEqual(cache.hit_rate, 0.5)
+
+
+class TestEncoderDeduplication(unittest.TestCase):
+
+    def setUp(self):
+        clear_code_caches()
+        env_patcher = patch.dict(os.environ, {"PHONETIC_STORE_MAX_ENTRIES": "0", "PHONETIC_NORMALIZATION": ""})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        patcher = patch("models.phonetc_basics.chunk_encoder.PhoneticWrapper", FakeProcessor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(clear_code_caches)
+
+    def test_only_unique_uncached_values_are_encoded(self):
+        encoder = PhoneticChunkEncoder({"soundex": True, "metaphone3": True}, "nom")
+        processor = encoder._processor
+        result = encoder.encode(["Dupont", "Martin", "Dupont", None, "Martin"])
+        self.assertEqual(result["nom_soundex"].tolist(), ["DUPONT", "MARTIN", "DUPONT", "", "MARTIN"])
+        self.assertEqual(result["nom_metaphone3_secondary"].tolist(), ["dupont", "martin", "dupont", "", "martin"])
+        self.assertEqual(len(processor.encoded), 6)
+
+        # Second chunk (et second encodeur) : seules les nouvelles valeurs atteignent la bibliothèque
+        other = PhoneticChunkEncoder({"soundex": True}, "nom")
+        other.encode(["Martin", "Durand"])
+        self.assertEqual(other._processor.encoded, ["Durand"])
+        self.assertEqual(other.stats["encoded_values"], 1)
+        self.assertEqual(code_cache_stats()["soundex:8"]["hits"], 1)
+
+    def test_empty_chunk(self):
+        encoder = PhoneticChunkEncoder({"soundex": True, "metaphone3": True}, "nom")
+        result = encoder.encode([])
+        self.assertEqual(list(result.columns), encoder.new_column_names)
+        self.assertEqual(len(result), 0)
+
+    def test_threaded_sub_batches_are_reassembled_in_order(self):
+        with patch.dict(os.environ, {"PHONETIC_SUB_BATCH_SIZE": "3"}):
+            config = Config()
+        values = [f"nom{i}" for i in range(20)] * 2
+        encoder = PhoneticChunkEncoder({"soundex": True, "metaphone3": True}, "nom", config,
+                                       workers=3, cache_size=0)
+        result = encoder.encode(values)
+        self.assertEqual(result["nom_soundex"].tolist(), [v.upper() for v in values])
+        self.assertEqual(result["nom_metaphone3_primary"].tolist(), [v.upper() for v in values])
+        self.assertEqual(len(encoder._processor.encoded), 40)
+        self.assertTrue(all(name.startswith("phonetic") for name in encoder._processor.threads))
@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from config import Config
+from models.phonetc_basics.chunk_encoder import PhoneticChunkEncoder
+from models.phonetc_basics.code_cache import clear_code_caches
+from models.phonetc_basics.code_store import PhoneticCodeStore, get_code_store
+from tests.phonetic_test.test_code_cache import FakeProcessor
+
+
+class TestPhoneticCodeStore(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = Path(tempfile.mkdtemp())
+        self.store = PhoneticCodeStore(self.folder / "codes.sqlite", max_entries=10)
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        self.addCleanup(self.store.close)
+
+    def test_put_and_get_many(self):
+        self.store.put_many("metaphone3:8", ["Smith", "a|b"], [("SM0", "XMT"), ("AB", "AB")])
+        found = self.store.get_many("metaphone3:8", ["Smith", "a|b", "Jones"])
+        self.assertEqual(found, {"Smith": ("SM0", "XMT"), "a|b": ("AB", "AB")})
+        self.assertEqual(self.store.get_many("soundex:8", ["Smith"]), {})
+
+    def test_batches_larger_than_sql_limit(self):
+        values = [f"nom{i}" for i in range(2000)]
+        store = PhoneticCodeStore(self.folder / "big.sqlite", max_entries=10_000)
+        self.addCleanup(store.close)
+        store.put_many("soundex:8", values, [(v.upper(),) for v in values])
+        self.assertEqual(len(store.get_many("soundex:8", values)), 2000)
+
+    def test_compaction_keeps_most_recently_used(self):
+        with patch("models.phonetc_basics.code_store.time.time", side_effect=range(0, 100 * 3600, 3600)):
+            for i in range(5):
+                self.store.put_many("soundex:8", [f"v{i}"], [(f"C{i}",)])
+            self.store.get_many("soundex:8", ["v0"])
+        removed = self.store.compact(max_entries=2)
+        self.assertEqual(removed, 3)
+        self.assertEqual(set(self.store.get_many("soundex:8", [f"v{i}" for i in range(5)])), {"v0", "v4"})
+
+    def test_automatic_compaction_over_limit(self):
+        values = [f"v{i}" for i in range(30)]
+        self.store.put_many("soundex:8", values, [(v,) for v in values])
+        self.assertLessEqual(self.store.count(), 10)
+
+
+class TestEncoderWithStore(unittest.TestCase):
+
+    def setUp(self):
+        clear_code_caches()
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        env = {"PHONETIC_STORE_FILENAME": os.path.join(self.folder, "codes.sqlite"), "PHONETIC_CACHE_SIZE": "0",
+               "PHONETIC_NORMALIZATION": ""}
+        with patch.dict(os.environ, env):
+            self.config = Config()
+        patcher = patch("models.phonetc_basics.chunk_encoder.PhoneticWrapper", FakeProcessor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        get_code_store(self.config).close()
+
+    def test_store_is_shared_across_encoders(self):
+        first = PhoneticChunkEncoder({"soundex": True}, "nom", self.config)
+        first.encode(["Dupont", "Martin"])
+        second = PhoneticChunkEncoder({"soundex": True}, "nom", self.config)
+        result = second.encode(["Martin", "Durand", "Dupont"])
+        self.assertEqual(result["nom_soundex"].tolist(), ["MARTIN", "DURAND", "DUPONT"])
+        self.assertEqual(second._processor.encoded, ["Durand"])
+        self.assertEqual(second.stats["stored_values"], 2)
+
+    def test_another_library_build_does_not_reuse_stored_codes(self):
+        builds = [Path(self.folder) / "libphonex_v1.so", Path(self.folder) / "libphonex_v2.so"]
+        for build in builds:
+            build.write_bytes(build.name.encode())
+        with patch.object(Config, "get_lib_path", return_value=builds[0]):
+            PhoneticChunkEncoder({"soundex": True}, "nom", self.config).encode(["Dupont", "Martin"])
+            same = PhoneticChunkEncoder({"soundex": True}, "nom", self.config)
+            same.encode(["Dupont"])
+        with patch.object(Config, "get_lib_path", return_value=builds[1]):
+            other = PhoneticChunkEncoder({"soundex": True}, "nom", self.config)
+            other.encode(["Dupont", "Martin"])
+        self.assertEqual(same._processor.encoded, [])
+        self.assertEqual(other._processor.encoded, ["Dupont", "Martin"])
+        self.assertEqual(other.stats["stored_values"], 0)
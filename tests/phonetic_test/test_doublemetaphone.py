@@ -0,0 +1,79 @@
+import ctypes
+import unittest
+from unittest.mock import patch
+
+from ext_lib.phonetic.wrappers.doublemetaphone.strategy import DoubleMetaphoneStrategy
+from ext_lib.phonetic.wrappers.registry import PhoneticLibraryRegistry
+from models.phonetc_basics.phonetic_dict_validator import PhoneticDictValidator
+
+
+class FakeDoubleMetaphoneLib:
+    """Bibliothèque factice : primaire en majuscules, secondaire en minuscules, tronqués à la longueur."""
+
+    def __init__(self):
+        self.calls = 0
+        self._buffers = {}
+
+    def double_metaphone(self, input_bytes: bytes, separator: bytes, length: int) -> int:
+        self.calls += 1
+        items = input_bytes.decode().split(separator.decode())
+        result = separator.decode().join(f"{item.upper()[:length]},{item.lower()[:length]}" for item in items)
+        buffer = ctypes.create_string_buffer(result.encode())
+        self._buffers[ctypes.addressof(buffer)] = buffer
+        return ctypes.addressof(buffer)
+
+    def double_metaphone_free(self, address: int) -> None:
+        del self._buffers[address]
+
+
+class FakeDoubleMetaphoneArrayLib(FakeDoubleMetaphoneLib):
+
+    def double_metaphone_encode_array(self, inputs, count, primaries, secondaries, width, length) -> int:
+        for i in range(count):
+            value = inputs[i].decode()
+            ctypes.memmove(primaries + i * width, value.upper()[:length].encode() + b"\0", width)
+            ctypes.memmove(secondaries + i * width, value.lower()[:length].encode() + b"\0", width)
+        return 0
+
+
+class TestDoubleMetaphoneStrategy(unittest.TestCase):
+
+    def test_process_returns_primary_and_secondary(self):
+        lib = FakeDoubleMetaphoneLib()
+        self.assertEqual(DoubleMetaphoneStrategy(lib).process(["Paris", "Lyon"], "|", 3),
+                         [("PAR", "par"), ("LYO", "lyo")])
+        self.assertEqual(lib._buffers, {})
+
+    def test_batch_is_sent_in_one_call_and_stays_aligned(self):
+        lib = FakeDoubleMetaphoneLib()
+        primaries, secondaries = DoubleMetaphoneStrategy(lib).process_array(["Smith", "", "a|b", "x\x1fy"], 4)
+        self.assertEqual(lib.calls, 1)
+        self.assertEqual(primaries.tolist(), ["SMIT", "", "A|B", "XY"])
+        self.assertEqual(secondaries.tolist(), ["smit", "", "a|b", "xy"])
+
+    def test_array_entry_point_is_preferred(self):
+        lib = FakeDoubleMetaphoneArrayLib()
+        primaries, secondaries = DoubleMetaphoneStrategy(lib).process_array(["Schmidt", "Jones"], 4)
+        self.assertEqual(lib.calls, 0)
+        self.assertEqual(primaries.tolist(), ["SCHM", "JONE"])
+        self.assertEqual(secondaries.tolist(), ["schm", "jone"])
+
+    def test_empty_input(self):
+        primaries, secondaries = DoubleMetaphoneStrategy(FakeDoubleMetaphoneLib()).process_array([])
+        self.assertEqual((len(primaries), len(secondaries)), (0, 0))
+
+    def test_validator_accepts_doublemetaphone(self):
+        with patch.object(PhoneticLibraryRegistry, "is_available", return_value=True):
+            validated = PhoneticDictValidator({"doublemetaphone": True, "unknown": True}).validate()
+        self.assertTrue(validated["doublemetaphone"])
+        self.assertNotIn("unknown", validated)
+
+    def test_validator_rejects_doublemetaphone_without_library(self):
+        with patch.object(PhoneticLibraryRegistry, "is_available", return_value=False):
+            with self.assertRaises(ValueError):
+                PhoneticDictValidator({"doublemetaphone": True}).validate()
+            self.assertFalse(PhoneticDictValidator({"doublemetaphone": False}).validate()["doublemetaphone"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ext_lib.phonetic.wrappers.registry import LIBRARY_FACTORIES, PhoneticLibraryRegistry
+
+
+class TestPhoneticLibraryRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = MagicMock(side_effect=lambda config: object())
+        patcher = patch.dict(LIBRARY_FACTORIES, {"phonex": self.factory, "metaphone": self.factory})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.config = MagicMock()
+        self.config.get_lib_path.side_effect = lambda name: f"/libs/lib{name}.so"
+
+    def test_library_is_loaded_once_and_lazily(self):
+        registry = PhoneticLibraryRegistry()
+        self.assertFalse(registry.is_loaded("phonex"))
+        first = registry.get("phonex", self.config)
+        self.assertIs(registry.get("phonex", self.config), first)
+        self.assertEqual(self.factory.call_count, 1)
+        self.assertFalse(registry.is_loaded("metaphone"))
+        self.assertEqual(list(registry.stats()), ["phonex"])
+        self.assertIn("load_ms", registry.stats()["phonex"])
+
+    def test_concurrent_first_access_loads_once(self):
+        registry = PhoneticLibraryRegistry()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get("metaphone", self.config)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.factory.call_count, 1)
+        self.assertEqual(len({id(r) for r in results}), 1)
+
+    def test_unknown_library(self):
+        with self.assertRaises(ValueError):
+            PhoneticLibraryRegistry().get("soundex", self.config)
@@ -0,0 +1,57 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from config import Config
+from models.phonetc_basics.chunk_encoder import PhoneticChunkEncoder
+from models.phonetc_basics.code_cache import clear_code_caches
+from models.phonetc_basics.normalizer import PhoneticNormalizer
+from tests.phonetic_test.test_code_cache import FakeProcessor
+
+
+class TestPhoneticNormalizer(unittest.TestCase):
+
+    def test_all_steps(self):
+        normalizer = PhoneticNormalizer(("nfkd", "accents", "casefold", "punctuation"))
+        self.assertEqual(normalizer.normalize(["Hélène", "HELENE", "Jean-Pierre", "O'Neil", "Œuvre", "Straße", "ﬁn"]),
+                         ["helene", "helene", "jean pierre", "oneil", "oeuvre", "strasse", "fin"])
+
+    def test_steps_are_independent(self):
+        self.assertEqual(PhoneticNormalizer(("casefold",)).normalize(["Hélène"]), ["hélène"])
+        self.assertEqual(PhoneticNormalizer(("nfkd", "accents")).normalize(["Hélène"]), ["Helene"])
+        self.assertEqual(PhoneticNormalizer(()).normalize(["Hélène"]), ["Hélène"])
+
+    def test_unknown_step(self):
+        with self.assertRaises(ValueError):
+            PhoneticNormalizer(("nfkd", "soundex"))
+
+
+class TestEncoderNormalization(unittest.TestCase):
+
+    def setUp(self):
+        clear_code_caches()
+        env_patcher = patch.dict(os.environ, {"PHONETIC_STORE_MAX_ENTRIES": "0",
+                                              "PHONETIC_NORMALIZATION": "nfkd,accents,casefold,punctuation"})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        patcher = patch("models.phonetc_basics.chunk_encoder.PhoneticWrapper", FakeProcessor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_variants_are_encoded_once(self):
+        encoder = PhoneticChunkEncoder({"soundex": True}, "nom", Config(), include_source_column=True, cache_size=0)
+        result = encoder.encode(["Hélène", "HELENE", "helene", "Dupont"])
+        self.assertEqual(encoder._processor.encoded, ["helene", "dupont"])
+        self.assertEqual(result["nom"].tolist(), ["Hélène", "HELENE", "helene", "Dupont"])
+        self.assertEqual(result["nom_soundex"].tolist(), ["HELENE", "HELENE", "HELENE", "DUPONT"])
+        self.assertEqual((encoder.stats["distinct_values"], encoder.stats["unique_values"]), (4, 2))
+
+    def test_values_are_not_normalized_by_default(self):
+        with patch.dict(os.environ, {"PHONETIC_NORMALIZATION": ""}):
+            encoder = PhoneticChunkEncoder({"soundex": True}, "nom", Config(), cache_size=0)
+        encoder.encode(["Hélène", "HELENE"])
+        self.assertEqual(encoder._processor.encoded, ["Hélène", "HELENE"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ext_lib.phonetic import PhoneticWrapper
+from ext_lib.phonetic.wrappers.soundex import NumpySoundexWrapper, soundex_array
+from models.phonetc_basics.chunk_encoder import PhoneticChunkEncoder
+
+REFERENCE_CODES = {
+    "Robert": "R163", "Rupert": "R163", "Rubin": "R150", "Ashcraft": "A261", "Tymczak": "T522",
+    "Pfister": "P236", "Honeyman": "H555", "Lee": "L000", "Gutierrez": "G362", "Jackson": "J250",
+    "Washington": "W252", "Lloyd": "L300", "Burroughs": "B620",
+}
+
+
+class TestNumpySoundex(unittest.TestCase):
+
+    def test_reference_codes(self):
+        codes = soundex_array(list(REFERENCE_CODES), 4)
+        self.assertEqual(codes.tolist(), list(REFERENCE_CODES.values()))
+
+    def test_normalization_and_padding(self):
+        codes = soundex_array(["Éloïse", "  12 smith", "", "日本", "a|b"], 8)
+        self.assertEqual(codes.tolist(), ["E4200000", "S5300000", "00000000", "00000000", "A1000000"])
+
+    def test_string_interface(self):
+        wrapper = NumpySoundexWrapper()
+        self.assertEqual(wrapper.run("Robert", "|", 4), "R163")
+        self.assertEqual(wrapper.run(["Robert", "Lee"], "|", 4), ["R163", "L000"])
+
+    def test_wrapper_exposes_a_distinct_algorithm(self):
+        registry = MagicMock()
+        wrapper = PhoneticWrapper(MagicMock(), registry=registry)
+        self.assertEqual(wrapper.american_soundex_encode_array(["Robert"], 4).tolist(), ["R163"])
+        registry.get.assert_not_called()
+        wrapper.soundex_encode_array(["Robert"], 4)
+        registry.get.assert_called_once_with("phonex", wrapper._config)
+
+    def test_encoder_writes_its_own_column(self):
+        with patch("models.phonetc_basics.chunk_encoder.PhoneticWrapper",
+                   lambda config: PhoneticWrapper(config, registry=MagicMock())):
+            encoder = PhoneticChunkEncoder({"american_soundex": True}, "nom", cache_size=0, use_store=False,
+                                           normalization=())
+        self.assertEqual(encoder.new_column_names, ["nom_american_soundex"])
+        self.assertEqual(encoder.encode(["Robert", "Lee"])["nom_american_soundex"].tolist(),
+                         ["R1630000", "L0000000"])
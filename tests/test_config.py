@@ -58,3 +58,10 @@ def test_properties_not_none():
         cfg.index_es_types_name,
         cfg.index_es_analysers_name
     ])
+
+
+def test_phonetic_normalization_is_opt_in(monkeypatch):
+    monkeypatch.delenv("PHONETIC_NORMALIZATION", raising=False)
+    assert Config().phonetic_normalization == ()
+    monkeypatch.setenv("PHONETIC_NORMALIZATION", "nfkd, accents")
+    assert Config().phonetic_normalization == ("nfkd", "accents")